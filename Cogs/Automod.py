@@ -1,74 +1,155 @@
 import discord
 from discord.ext import commands, tasks
 from datetime import datetime, timezone
-import re
-from collections import defaultdict
 import asyncio
 
+from utils.automod_rules import CapsRule, FloodRule, LinkRule, MessageContext, ProfanityRule, RuleEngine
+from utils.log_dispatcher import PRIORITY_HIGH
+from utils.flood import FloodTracker
+from utils.profanity import ProfanityMatcher, normalize
+
 class Automod(commands.Cog):
     def __init__(self, bot, db_manager):
         self.bot = bot
         self.db = db_manager
-        self.message_cache = defaultdict(list)
         self.flood_threshold = 5  
         self.flood_time = 7  
-        self.profanity_list = ["küfür1", "küfür2", "küfür3"]  
-        self.link_regex = re.compile(r"https?://\S+")
+        self.flood_max_keys = 50_000  # Bellek sınırı: izlenen en fazla (sunucu, kullanıcı) sayısı
+        self.message_cache = FloodTracker(self.flood_threshold, self.flood_time, self.flood_max_keys)
+        self.profanity_list = ["küfür1", "küfür2", "küfür3"]  # Kendi listesi olmayan sunucular için varsayılan
+        self.default_matcher = ProfanityMatcher(self.profanity_list)
+        self.matchers = {}  # guild_id -> ProfanityMatcher
         self.caps_threshold = 0.7  
+        self.engine = RuleEngine([
+            FloodRule(self.message_cache),
+            LinkRule(),
+            CapsRule(self.caps_threshold),
+            ProfanityRule(),
+        ])
+        self.disabled_rules = {}  # guild_id -> kapalı kural adları
 
     async def mute_member(self, member: discord.Member, reason="Otomatik Moderasyon"):
-        role = discord.utils.get(member.guild.roles, name="Muted")
-        if not role:
-            role = await member.guild.create_role(name="Muted")
-            for ch in member.guild.channels:
-                await ch.set_permissions(role, send_messages=False)
+        role = await self.bot.mute_roles.get_or_create(member.guild)
         await member.add_roles(role)
         await self.log_action(member.guild.id, member.id, "MUTE", reason)
 
+    async def cog_load(self):
+        self.flood_sweeper.start()
+
+    async def cog_unload(self):
+        self.flood_sweeper.cancel()
+
+    @tasks.loop(seconds=60)
+    async def flood_sweeper(self):
+        self.message_cache.sweep()
+
+    async def get_matcher(self, guild_id):
+        matcher = self.matchers.get(guild_id)
+        if matcher is None:
+            words = await self.db.get_profanity_words(guild_id)
+            matcher = ProfanityMatcher(words) if words is not None else self.default_matcher
+            self.matchers[guild_id] = matcher
+        return matcher
+
+    async def get_disabled_rules(self, guild_id):
+        disabled = self.disabled_rules.get(guild_id)
+        if disabled is None:
+            disabled = frozenset(await self.db.get_disabled_rules(guild_id))
+            self.disabled_rules[guild_id] = disabled
+        return disabled
+
     async def log_action(self, guild_id, user_id, action, reason):
         guild = self.bot.get_guild(guild_id)
-        if guild:
-            channel = discord.utils.get(guild.text_channels, name="denetim-log")
-            if channel:
-                embed = discord.Embed(title=f"Otomatik Moderasyon | {action}", color=0xff0000, timestamp=datetime.now(timezone.utc))
-                embed.add_field(name="Kullanıcı", value=f"<@{user_id}>", inline=True)
-                embed.add_field(name="Sebep", value=reason, inline=False)
-                await channel.send(embed=embed)
+        if guild and self.bot.log_channels.wants_action(guild_id, action):
+            embed = discord.Embed(title=f"Otomatik Moderasyon | {action}", color=0xff0000, timestamp=datetime.now(timezone.utc))
+            embed.add_field(name="Kullanıcı", value=f"<@{user_id}>", inline=True)
+            embed.add_field(name="Sebep", value=reason, inline=False)
+            self.bot.log_dispatcher.send(guild, embed, priority=PRIORITY_HIGH)
 
     @commands.Cog.listener()
     async def on_message(self, message):
-        if message.author.bot:
+        if message.author.bot or message.guild is None:
             return
 
-        now = datetime.utcnow().timestamp()
-        self.message_cache[message.author.id] = [t for t in self.message_cache[message.author.id] if now - t < self.flood_time]
-        self.message_cache[message.author.id].append(now)
-        if len(self.message_cache[message.author.id]) > self.flood_threshold:
-            await self.mute_member(message.author, "Flood")
-            await message.channel.send(f"{message.author.mention} flood nedeniyle susturuldu!", delete_after=5)
-            self.message_cache[message.author.id] = []
-            return
+        disabled = await self.get_disabled_rules(message.guild.id)
+        ctx = MessageContext(message)
+        if self.engine.needs("matcher", disabled):
+            ctx.matcher = await self.get_matcher(message.guild.id)
 
-        content_lower = message.content.lower()
-        if any(bad_word in content_lower for bad_word in self.profanity_list):
-            await message.delete()
-            await self.mute_member(message.author, "Küfür")
-            await message.channel.send(f"{message.author.mention} küfür nedeniyle susturuldu!", delete_after=5)
+        rule = self.engine.evaluate(ctx, disabled)
+        if rule is None:
             return
-
-        if self.link_regex.search(message.content):
+        if rule.delete_message:
             await message.delete()
-            await self.mute_member(message.author, "Link paylaşımı")
-            await message.channel.send(f"{message.author.mention} link paylaşımı nedeniyle susturuldu!", delete_after=5)
-            return
+        await self.mute_member(message.author, rule.reason)
+        await message.channel.send(f"{message.author.mention} {rule.notice} nedeniyle susturuldu!", delete_after=5)
+
+    @commands.command(name="automod")
+    @commands.has_permissions(administrator=True)
+    async def automod(self, ctx, rule: str = None, state: str = None):
+        disabled = await self.get_disabled_rules(ctx.guild.id)
+        if rule is None:
+            embed = discord.Embed(title="Otomatik Moderasyon Kuralları", color=0x00ff00, timestamp=datetime.now(timezone.utc))
+            for name, stats in self.engine.stats().items():
+                durum = "kapalı" if name in disabled else "açık"
+                embed.add_field(
+                    name=f"{name} ({durum})",
+                    value=f"{stats['hits']}/{stats['evaluations']} isabet | ort {stats['avg_us']:.1f}us | p99 ≤{stats['p99_us']}us",
+                    inline=False
+                )
+            return await ctx.send(embed=embed)
+        if rule not in self.engine.by_name or state not in ("ac", "kapat"):
+            return await ctx.send(f"Kullanım: automod <{'|'.join(self.engine.by_name)}> <ac|kapat>")
+        enabled = state == "ac"
+        await self.db.set_rule_enabled(ctx.guild.id, rule, enabled)
+        self.disabled_rules[ctx.guild.id] = disabled - {rule} if enabled else disabled | {rule}
+        await ctx.send(f"`{rule}` kuralı {'açıldı' if enabled else 'kapatıldı'}.")
+
+    @commands.command(name="kufurekle")
+    @commands.has_permissions(administrator=True)
+    async def kufurekle(self, ctx, *, word: str):
+        matcher = await self.get_matcher(ctx.guild.id)
+        term = normalize(word.strip())
+        if not term or term in matcher:
+            return await ctx.send("Bu kelime zaten listede.")
+        # Önce veritabanı: yazma başarısız olursa bellekteki liste değişmemiş olur
+        if matcher is self.default_matcher:
+            # Sunucunun ilk özelleştirmesi: varsayılan liste sunucuya kopyalanır
+            await self.db.add_profanity_words(ctx.guild.id, sorted(matcher.terms | {term}))
+            matcher = self.matchers[ctx.guild.id] = ProfanityMatcher(self.profanity_list)
+        else:
+            await self.db.add_profanity_words(ctx.guild.id, [term])
+        matcher.add(term)
+        matcher.build()
+        await ctx.send(f"Yasaklı kelime eklendi. Listede {len(matcher)} kelime var.")
+
+    @commands.command(name="kufursil")
+    @commands.has_permissions(administrator=True)
+    async def kufursil(self, ctx, *, word: str):
+        matcher = await self.get_matcher(ctx.guild.id)
+        term = normalize(word.strip())
+        if term not in matcher:
+            return await ctx.send("Bu kelime listede yok.")
+        if matcher is self.default_matcher:
+            await self.db.add_profanity_words(ctx.guild.id, sorted(matcher.terms - {term}))
+            matcher = self.matchers[ctx.guild.id] = ProfanityMatcher(self.profanity_list)
+        else:
+            await self.db.remove_profanity_word(ctx.guild.id, term)
+        matcher.remove(term)
+        matcher.build()
+        await ctx.send(f"Yasaklı kelime silindi. Listede {len(matcher)} kelime var.")
 
-        if len(message.content) >= 5:
-            caps_ratio = sum(1 for c in message.content if c.isupper()) / len(message.content)
-            if caps_ratio >= self.caps_threshold:
-                await message.delete()
-                await self.mute_member(message.author, "Caps spam")
-                await message.channel.send(f"{message.author.mention} caps nedeniyle susturuldu!", delete_after=5)
-                return
+    @commands.command(name="kufurliste")
+    @commands.has_permissions(administrator=True)
+    async def kufurliste(self, ctx):
+        matcher = await self.get_matcher(ctx.guild.id)
+        words = sorted(matcher.terms)
+        if not words:
+            return await ctx.send("Yasaklı kelime listesi boş.")
+        text = ", ".join(words)
+        if len(text) > 1900:
+            text = text[:1900] + "..."
+        await ctx.send(f"Yasaklı kelimeler ({len(words)}): ||{text}||")
 
 async def setup(bot):
     from main import db_manager
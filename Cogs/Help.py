@@ -31,8 +31,8 @@ class Help(commands.Cog):
             inline=False
         )
         embed.add_field(
-            name="/mute <@user> [sebep]",
-            value="Kullanıcıyı susturur (Yönetici)",
+            name="/mute <@user> [süre] [sebep]",
+            value="Kullanıcıyı susturur; süre verilirse (10m, 2h, 1d) süre dolunca otomatik kaldırılır (Yönetici)",
             inline=False
         )
         embed.add_field(
@@ -51,8 +51,8 @@ class Help(commands.Cog):
             inline=False
         )
         embed.add_field(
-            name="/nuke",
-            value="Kanaldaki tüm mesajları siler (Yönetici)",
+            name="/nuke [filtre] | /purge <sayı> [filtre]",
+            value="Kanaldaki mesajları siler; filtre: @kullanıcı, icerir:\"kelime\", ek, bot. İptal butonu ile durdurulabilir (Yönetici)",
             inline=False
         )
         embed.add_field(
@@ -60,6 +60,47 @@ class Help(commands.Cog):
             value="Denetim-log kanalını gösterir veya oluşturur",
             inline=False
         )
+        embed.add_field(
+            name="/logconfig [olay] [durum]",
+            value="Denetim kanalına loglanacak olayları gösterir/açar/kapatır (Yönetici)",
+            inline=False
+        )
+        embed.add_field(
+            name="/kufurekle <kelime> | /kufursil <kelime> | /kufurliste",
+            value="Sunucuya özel yasaklı kelime listesini yönetir (Yönetici)",
+            inline=False
+        )
+        embed.add_field(
+            name="/automod [kural] [ac|kapat]",
+            value="Otomatik moderasyon kurallarını ve istatistiklerini gösterir, açar/kapatır (Yönetici)",
+            inline=False
+        )
+        embed.add_field(
+            name="/raidayar [eşik] [saniye]",
+            value="Raid koruma eşiğini ve süresini gösterir/ayarlar (Yönetici)",
+            inline=False
+        )
+        embed.add_field(
+            name="/lockdown [sebep] | /unlockdown",
+            value="Tüm metin kanallarını kilitler / önceki izinleri geri yükler (Yönetici)",
+            inline=False
+        )
+        embed.add_field(
+            name="/massban | /masskick <id...|son:10m> [sil:1g] [sebep]",
+            value="ID listesi, yüklenen .txt dosyası veya son katılanlar için toplu ban/kick; onay ister. "
+                  "Massban varsayılan olarak mesaj silmez, sil:1g ile son 1 günün mesajları silinir (en fazla 7g) (Yönetici)",
+            inline=False
+        )
+        embed.add_field(
+            name="/case <id> | /history <kullanıcı> [yetkili]",
+            value="Tek bir moderasyon vakasını veya kullanıcının sayfalı geçmişini gösterir (Yönetici)",
+            inline=False
+        )
+        embed.add_field(
+            name="/export [jsonl|csv]",
+            value="Sunucunun mod kayıtlarını, forcebanlarını ve mutelarını gzip dosyaları olarak gönderir (Yönetici)",
+            inline=False
+        )
         embed.add_field(
             name="/help",
             value="Komutları ve açıklamalarını gösterir",
@@ -3,72 +3,136 @@ from discord.ext import commands
 from datetime import datetime, timezone
 import aiosqlite
 
+from utils.log_channels import EVENT_BITS
+from utils.log_dispatcher import PRIORITY_LOW, PRIORITY_NORMAL
+
+MESSAGE_DELETE = EVENT_BITS["message_delete"]
+MESSAGE_EDIT = EVENT_BITS["message_edit"]
+MEMBER_JOIN = EVENT_BITS["member_join"]
+MEMBER_REMOVE = EVENT_BITS["member_remove"]
+ROLE_CHANGE = EVENT_BITS["role_change"]
+
 class Log(commands.Cog):
     def __init__(self, bot, db_manager):
         self.bot = bot
         self.db = db_manager
 
-    async def get_log_channel(self, guild: discord.Guild):
-        """Denetim kanalı varsa döndür, yoksa oluştur"""
-        channel = discord.utils.get(guild.text_channels, name="denetim-log")
-        if not channel:
-            overwrites = {guild.default_role: discord.PermissionOverwrite(send_messages=True)}
-            channel = await guild.create_text_channel("denetim-log", overwrites=overwrites)
-        return channel
-
-    async def send_embed(self, guild_id, title, fields: dict):
+    async def send_embed(self, guild_id, title, fields: dict, priority=PRIORITY_NORMAL):
         guild = self.bot.get_guild(guild_id)
         if not guild:
             return
-        channel = await self.get_log_channel(guild)
         embed = discord.Embed(title=title, color=0xff5500, timestamp=datetime.now(timezone.utc))
         for name, value in fields.items():
             embed.add_field(name=name, value=value, inline=False)
-        await channel.send(embed=embed)
+        self.bot.log_dispatcher.send(guild, embed, priority=priority, create_channel=True)
 
     @commands.Cog.listener()
     async def on_member_join(self, member):
-        await self.send_embed(member.guild.id, "Üye Katıldı", {"Üye": f"{member} ({member.id})"})
+        if not self.bot.log_channels.wants(member.guild.id, MEMBER_JOIN):
+            return
+        await self.send_embed(member.guild.id, "Üye Katıldı", {"Üye": f"{member} ({member.id})"}, PRIORITY_LOW)
 
     @commands.Cog.listener()
     async def on_member_remove(self, member):
-        await self.send_embed(member.guild.id, "Üye Ayrıldı", {"Üye": f"{member} ({member.id})"})
+        if not self.bot.log_channels.wants(member.guild.id, MEMBER_REMOVE):
+            return
+        await self.send_embed(member.guild.id, "Üye Ayrıldı", {"Üye": f"{member} ({member.id})"}, PRIORITY_LOW)
+
+    def _user(self, guild_id, user_id):
+        guild = self.bot.get_guild(guild_id)
+        member = guild.get_member(user_id) if guild else None
+        return f"{member or f'<@{user_id}>'} ({user_id})"
+
+    @commands.Cog.listener()
+    async def on_message(self, message):
+        self.bot.content_cache.add(message)
 
     @commands.Cog.listener()
-    async def on_message_delete(self, message):
-        if message.author.bot:
+    async def on_raw_message_delete(self, payload):
+        if payload.guild_id is None:
+            return
+        # Log kapalı olsa da girişi önbellekten çıkar
+        entry = self.bot.content_cache.pop(payload.message_id)
+        if not self.bot.log_channels.wants(payload.guild_id, MESSAGE_DELETE):
+            return
+        if entry is not None:
+            author_id, content, attachments = entry.author_id, entry.content, entry.attachments
+        elif payload.cached_message is not None and not payload.cached_message.author.bot:
+            message = payload.cached_message
+            author_id, content, attachments = message.author.id, message.content, [a.filename for a in message.attachments]
+        else:
             return
-        await self.send_embed(message.guild.id, "Mesaj Silindi", {
-            "Kullanıcı": f"{message.author} ({message.author.id})",
-            "Kanal": message.channel.mention,
-            "Mesaj": message.content or "Boş mesaj"
-        })
+        fields = {
+            "Kullanıcı": self._user(payload.guild_id, author_id),
+            "Kanal": f"<#{payload.channel_id}>",
+            "Mesaj": (content or "Boş mesaj")[:1024]
+        }
+        if attachments:
+            fields["Ekler"] = ", ".join(attachments)[:1024]
+        await self.send_embed(payload.guild_id, "Mesaj Silindi", fields)
 
     @commands.Cog.listener()
-    async def on_message_edit(self, before, after):
-        if before.author.bot or before.content == after.content:
+    async def on_raw_bulk_message_delete(self, payload):
+        if payload.guild_id is None:
             return
-        await self.send_embed(before.guild.id, "Mesaj Düzenlendi", {
-            "Kullanıcı": f"{before.author} ({before.author.id})",
-            "Kanal": before.channel.mention,
-            "Önce": before.content or "Boş",
-            "Sonra": after.content or "Boş"
-        })
+        entries = self.bot.content_cache.pop_many(payload.message_ids)
+        if not self.bot.log_channels.wants(payload.guild_id, MESSAGE_DELETE):
+            return
+        lines = [f"<@{entry.author_id}>: {entry.content or ', '.join(entry.attachments)}"[:200] for _, entry in entries]
+        fields = {
+            "Kanal": f"<#{payload.channel_id}>",
+            "Silinen": f"{len(payload.message_ids)} mesaj ({len(entries)} içeriği kayıtlı)"
+        }
+        if lines:
+            fields["Mesajlar"] = "\n".join(lines)[:1024]
+        await self.send_embed(payload.guild_id, "Toplu Mesaj Silme", fields)
+
+    @commands.Cog.listener()
+    async def on_raw_message_edit(self, payload):
+        message = payload.message
+        if payload.guild_id is None or message.author.bot:
+            return
+        old = self.bot.content_cache.replace(
+            payload.message_id, payload.channel_id, message.author.id, message.content,
+            tuple(a.filename for a in message.attachments)
+        )
+        if not self.bot.log_channels.wants(payload.guild_id, MESSAGE_EDIT):
+            return
+        if old is not None:
+            before = old.content
+        elif payload.cached_message is not None:
+            before = payload.cached_message.content
+        else:
+            return
+        if before == message.content:
+            return
+        await self.send_embed(payload.guild_id, "Mesaj Düzenlendi", {
+            "Kullanıcı": self._user(payload.guild_id, message.author.id),
+            "Kanal": f"<#{payload.channel_id}>",
+            "Önce": (before or "Boş")[:1024],
+            "Sonra": (message.content or "Boş")[:1024]
+        }, PRIORITY_LOW)
 
     @commands.Cog.listener()
     async def on_guild_role_create(self, role):
+        if not self.bot.log_channels.wants(role.guild.id, ROLE_CHANGE):
+            return
         await self.send_embed(role.guild.id, "Rol Oluşturuldu", {"Rol": f"{role.name} ({role.id})"})
 
     @commands.Cog.listener()
     async def on_guild_role_delete(self, role):
+        if not self.bot.log_channels.wants(role.guild.id, ROLE_CHANGE):
+            return
         await self.send_embed(role.guild.id, "Rol Silindi", {"Rol": f"{role.name} ({role.id})"})
 
     @commands.Cog.listener()
     async def on_guild_role_update(self, before, after):
+        if not self.bot.log_channels.wants(after.guild.id, ROLE_CHANGE):
+            return
         await self.send_embed(before.guild.id, "Rol Güncellendi", {
             "Önce": f"{before.name}",
             "Sonra": f"{after.name}"
-        })
+        }, PRIORITY_LOW)
 
 async def setup(bot):
     from main import db_manager
@@ -2,57 +2,24 @@ import discord
 from discord.ext import commands
 from datetime import timedelta, datetime
 
-class Moderation(commands.Cog):
-    def __init__(self, bot):
+from utils.purge import PurgeFilter, run_purge
+
+# ban/unban/kick/mute/unmute main.Moderation'da; bu cog ek yönetim komutlarını taşır
+class ModerationTools(commands.Cog):
+    def __init__(self, bot, db_manager):
         self.bot = bot
-        self.warns = {}
+        self.db = db_manager
+        # Uyarı sayısı -> otomatik yaptırım (None süre = kick)
+        self.warn_escalation = {
+            3: timedelta(minutes=10),
+            5: timedelta(hours=1),
+            7: None,
+        }
+        self.warns_page_size = 10
 
     async def is_admin(self, ctx):
         return ctx.author.guild_permissions.administrator
 
-    @commands.command()
-    async def ban(self, ctx, member: discord.Member, *, reason="Sebep belirtilmedi"):
-        if not await self.is_admin(ctx):
-            return await ctx.send("Yetkin yok.")
-        await member.ban(reason=reason)
-        await ctx.send(f"{member} yasaklandı.")
-
-    @commands.command()
-    async def unban(self, ctx, user_id: int):
-        if not await self.is_admin(ctx):
-            return await ctx.send("Yetkin yok.")
-        user = await self.bot.fetch_user(user_id)
-        await ctx.guild.unban(user)
-        await ctx.send(f"{user} yasağı kaldırıldı.")
-
-    @commands.command()
-    async def kick(self, ctx, member: discord.Member, *, reason="Sebep belirtilmedi"):
-        if not await self.is_admin(ctx):
-            return await ctx.send("Yetkin yok.")
-        await member.kick(reason=reason)
-        await ctx.send(f"{member} atıldı.")
-
-    @commands.command()
-    async def mute(self, ctx, member: discord.Member):
-        if not await self.is_admin(ctx):
-            return await ctx.send("Yetkin yok.")
-        role = discord.utils.get(ctx.guild.roles, name="Muted")
-        if not role:
-            role = await ctx.guild.create_role(name="Muted")
-            for ch in ctx.guild.channels:
-                await ch.set_permissions(role, send_messages=False)
-        await member.add_roles(role)
-        await ctx.send(f"{member} susturuldu.")
-
-    @commands.command()
-    async def unmute(self, ctx, member: discord.Member):
-        if not await self.is_admin(ctx):
-            return await ctx.send("Yetkin yok.")
-        role = discord.utils.get(ctx.guild.roles, name="Muted")
-        if role:
-            await member.remove_roles(role)
-        await ctx.send(f"{member} susturması kaldırıldı.")
-
     @commands.command()
     async def timeout(self, ctx, member: discord.Member, dakika: int):
         if not await self.is_admin(ctx):
@@ -68,11 +35,14 @@ class Moderation(commands.Cog):
         await ctx.send(f"{member} timeout kaldırıldı.")
 
     @commands.command()
-    async def purge(self, ctx, amount: int):
+    async def purge(self, ctx, amount: int, *, filtre: str = None):
         if not await self.is_admin(ctx):
             return await ctx.send("Yetkin yok.")
-        await ctx.channel.purge(limit=amount)
-        await ctx.send("Mesajlar silindi.", delete_after=3)
+        try:
+            check = PurgeFilter.parse(filtre)
+        except ValueError as e:
+            return await ctx.send(str(e), delete_after=5)
+        await run_purge(self.bot, ctx, amount, check, "PURGE")
 
     @commands.command()
     async def lock(self, ctx):
@@ -106,32 +76,54 @@ class Moderation(commands.Cog):
     async def warn(self, ctx, member: discord.Member, *, reason="Sebep yok"):
         if not await self.is_admin(ctx):
             return await ctx.send("Yetkin yok.")
-        self.warns.setdefault(member.id, [])
-        self.warns[member.id].append({
-            "reason": reason,
-            "date": datetime.utcnow()
-        })
-        await ctx.send(f"{member} uyarıldı.")
+        warning_id, count = await self.db.add_warning(ctx.guild.id, member.id, ctx.author.id, reason)
+        await self.db.add_mod_log(ctx.guild.id, ctx.author.id, member.id, "WARN", reason, ctx.message.jump_url)
+        await ctx.send(f"{member} uyarıldı. (#{warning_id}, toplam {count} uyarı)")
+        await self.escalate(ctx, member, count)
+
+    async def escalate(self, ctx, member, count):
+        if count not in self.warn_escalation:
+            return
+        duration = self.warn_escalation[count]
+        reason = f"{count} uyarıya ulaştı"
+        try:
+            if duration is None:
+                await member.kick(reason=reason)
+                await ctx.send(f"{member} {count} uyarıya ulaştığı için atıldı.")
+                action = "KICK"
+            else:
+                await member.timeout(duration, reason=reason)
+                await ctx.send(f"{member} {count} uyarıya ulaştığı için {int(duration.total_seconds() // 60)} dakika timeout yedi.")
+                action = "TIMEOUT"
+        except discord.HTTPException:
+            return await ctx.send("Otomatik yaptırım uygulanamadı.")
+        await self.db.add_mod_log(ctx.guild.id, self.bot.user.id, member.id, action, reason, ctx.message.jump_url)
 
     @commands.command()
-    async def warns(self, ctx, member: discord.Member):
+    async def warns(self, ctx, member: discord.Member, before: int = None):
         if not await self.is_admin(ctx):
             return await ctx.send("Yetkin yok.")
-        data = self.warns.get(member.id)
-        if not data:
+        rows = await self.db.get_warnings(ctx.guild.id, member.id, before, self.warns_page_size + 1)
+        if not rows:
             return await ctx.send("Uyarısı yok.")
-        msg = ""
-        for i, w in enumerate(data, 1):
-            msg += f"{i}. {w['reason']} ({w['date']})\n"
-        await ctx.send(msg)
+        page, has_more = rows[:self.warns_page_size], len(rows) > self.warns_page_size
+        total = await self.db.count_warnings(ctx.guild.id, member.id)
+        embed = discord.Embed(title=f"{member} - {total} uyarı", color=0xffaa00)
+        for warning_id, moderator_id, reason, timestamp in page:
+            date = discord.utils.format_dt(datetime.fromisoformat(timestamp), "f")
+            embed.add_field(name=f"#{warning_id} - {date}", value=f"{reason or 'Sebep yok'} (<@{moderator_id}>)"[:1024], inline=False)
+        if has_more:
+            embed.set_footer(text=f"Devamı için: warns {member.id} {page[-1][0]}")
+        await ctx.send(embed=embed)
 
     @commands.command()
     async def clearwarns(self, ctx, member: discord.Member):
         if not await self.is_admin(ctx):
             return await ctx.send("Yetkin yok.")
-        self.warns.pop(member.id, None)
-        await ctx.send("Uyarılar silindi.")
+        deleted = await self.db.clear_warnings(ctx.guild.id, member.id)
+        await ctx.send(f"Uyarılar silindi. ({deleted})")
 
 async def setup(bot):
-    await bot.add_cog(Moderation(bot))
+    from main import db_manager
+    await bot.add_cog(ModerationTools(bot, db_manager))
    
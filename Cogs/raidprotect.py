@@ -1,75 +1,294 @@
+import asyncio
+import re
 import discord
 from discord.ext import commands, tasks
-from collections import defaultdict
 from datetime import datetime, timezone, timedelta
 
+from utils.log_dispatcher import PRIORITY_HIGH
+from utils.window_counter import WindowCounter
+
+_NAME_NOISE = re.compile(r"[\d_\W]+")
+
 class RaidProtect(commands.Cog):
     def __init__(self, bot, db_manager):
         self.bot = bot
         self.db = db_manager
-        self.action_cache = defaultdict(list)
         self.threshold = 5  # Süre içinde bu kadar işlemi yaparsa alarm
         self.time_window = 10  # saniye
+        self.action_cache = WindowCounter(self.threshold, self.time_window)
+        self._configured = set()  # raid_config'i okunmuş sunucular
+        self.cursors = {}  # guild_id -> işlenen son denetim kaydı ID'si
+        self._ready_shards = set()  # ilk READY'si alınmış shard'lar
+        # Katılım hızı: süre içinde bu kadar katılım (veya yeni hesap / benzer isim) olursa kilitle
+        self.join_threshold = 10
+        self.new_account_threshold = 5
+        self.name_pattern_threshold = 4
+        self.join_window = 15  # saniye
+        self.new_account_age = timedelta(days=7)
+        self.lockdown_concurrency = 10
+        self.auto_unlock_after = 15 * 60  # saniye
+        self.join_cache = WindowCounter(self.join_threshold, self.join_window, max_keys=20_000)
+        self.locked_guilds = set()
+        self._unlock_tasks = {}
 
-    async def get_log_channel(self, guild: discord.Guild):
-        channel = discord.utils.get(guild.text_channels, name="denetim-log")
-        if not channel:
-            overwrites = {guild.default_role: discord.PermissionOverwrite(send_messages=True)}
-            channel = await guild.create_text_channel("denetim-log", overwrites=overwrites)
-        return channel
+    WATCHED_ACTIONS = {
+        discord.AuditLogAction.kick: ("KICK", "kick"),
+        discord.AuditLogAction.ban: ("BAN", "ban"),
+        discord.AuditLogAction.role_delete: ("ROLE_DELETE", "rol silme"),
+        discord.AuditLogAction.role_create: ("ROLE_CREATE", "rol oluşturma"),
+    }
 
     async def log_raid(self, guild, user, action, count):
-        channel = await self.get_log_channel(guild)
         embed = discord.Embed(
             title="Raid Koruma Alarmı",
-            description=f"{user} {action} işlemi hızlı şekilde yaptı!",
+            description=f"<@{user.id}> {action} işlemi hızlı şekilde yaptı!",
             color=0xff0000,
             timestamp=datetime.now(timezone.utc)
         )
-        embed.add_field(name="Kullanıcı", value=f"{user} ({user.id})")
+        embed.add_field(name="Kullanıcı", value=f"<@{user.id}> ({user.id})")
         embed.add_field(name="İşlem Sayısı", value=str(count))
-        await channel.send(embed=embed)
-
-    async def check_raid(self, user, action_type):
-        now = datetime.utcnow()
-        self.action_cache[(user.id, action_type)] = [
-            t for t in self.action_cache[(user.id, action_type)]
-            if now - t < timedelta(seconds=self.time_window)
-        ]
-        self.action_cache[(user.id, action_type)].append(now)
-        if len(self.action_cache[(user.id, action_type)]) >= self.threshold:
-            return True
-        return False
+        self.bot.log_dispatcher.send(guild, embed, priority=PRIORITY_HIGH, create_channel=True)
+
+    async def cog_load(self):
+        self.raid_sweeper.start()
+        # Yeniden başlatmadan önce alınmış kilitler geri yüklenir; süresi dolanlar gecikmeden kaldırılır
+        for guild_id, unlock_at in await self.db.get_lockdowns(self.bot.shard_count, self.bot.shard_ids):
+            self._adopt_lockdown(guild_id, unlock_at)
+
+    async def cog_unload(self):
+        self.raid_sweeper.cancel()
+        for task in self._unlock_tasks.values():
+            task.cancel()
+        self._unlock_tasks.clear()
+
+    @tasks.loop(seconds=60)
+    async def raid_sweeper(self):
+        self.action_cache.sweep()
+        self.join_cache.sweep()
+
+    async def load_config(self, guild_id):
+        if guild_id in self._configured:
+            return
+        self._configured.add(guild_id)
+        row = await self.db.get_raid_config(guild_id)
+        if row:
+            self.action_cache.configure(guild_id, *row)
+
+    async def check_raid(self, guild_id, user, action_type):
+        await self.load_config(guild_id)
+        count = self.action_cache.hit(guild_id, user.id, action_type)
+        return count >= self.action_cache.threshold(guild_id)
+
+    async def process_entry(self, entry: discord.AuditLogEntry):
+        guild = entry.guild
+        # Her kayıt tam bir kez sayılır: ID'si imleçten küçük/eşit olanlar atlanır
+        if entry.id <= self.cursors.get(guild.id, 0):
+            return
+        self.cursors[guild.id] = entry.id
+        spec = self.WATCHED_ACTIONS.get(entry.action)
+        if spec is None or entry.user_id is None or entry.user_id == self.bot.user.id:
+            return
+        action_type, label = spec
+        actor = guild.get_member(entry.user_id)
+        if actor is not None and actor.guild_permissions.administrator:
+            return
+        if actor is None:
+            actor = entry.user or discord.Object(id=entry.user_id)
+        if await self.check_raid(guild.id, actor, action_type):
+            await self.log_raid(guild, actor, label, self.action_cache.count(guild.id, actor.id, action_type))
 
     @commands.Cog.listener()
-    async def on_member_remove(self, member):
-        guild = member.guild
-        async for entry in guild.audit_logs(limit=5, action=discord.AuditLogAction.kick):
-            if entry.target.id == member.id:
-                if not entry.user.guild_permissions.administrator:
-                    if await self.check_raid(entry.user, "KICK"):
-                        await self.log_raid(guild, entry.user, "kick", len(self.action_cache[(entry.user.id, "KICK")]))
-        async for entry in guild.audit_logs(limit=5, action=discord.AuditLogAction.ban):
-            if entry.target.id == member.id:
-                if not entry.user.guild_permissions.administrator:
-                    if await self.check_raid(entry.user, "BAN"):
-                        await self.log_raid(guild, entry.user, "ban", len(self.action_cache[(entry.user.id, "BAN")]))
-    
+    async def on_audit_log_entry_create(self, entry):
+        await self.process_entry(entry)
+
     @commands.Cog.listener()
-    async def on_guild_role_delete(self, role):
-        guild = role.guild
-        async for entry in guild.audit_logs(limit=5, action=discord.AuditLogAction.role_delete):
-            if not entry.user.guild_permissions.administrator:
-                if await self.check_raid(entry.user, "ROLE_DELETE"):
-                    await self.log_raid(guild, entry.user, "rol silme", len(self.action_cache[(entry.user.id, "ROLE_DELETE")]))
+    async def on_shard_ready(self, shard_id):
+        # AutoShardedBot'ta tek bir shard yeniden IDENTIFY olduğunda on_ready değil yalnızca
+        # on_shard_ready gelir. İlk ready'de gateway olayları yeterli; sonrakilerde yalnızca
+        # o shard'ın sunucuları için arada kaçan kayıtlar sunucu başına tek istekle alınır
+        if shard_id not in self._ready_shards:
+            self._ready_shards.add(shard_id)
+            return
+        await self.catch_up(shard_id)
+
+    async def catch_up(self, shard_id: int | None = None):
+        for guild_id, cursor in list(self.cursors.items()):
+            guild = self.bot.get_guild(guild_id)
+            if guild is None or (shard_id is not None and guild.shard_id != shard_id):
+                continue
+            try:
+                entries = [entry async for entry in guild.audit_logs(limit=100, after=discord.Object(id=cursor))]
+            except discord.HTTPException:
+                continue
+            for entry in sorted(entries, key=lambda e: e.id):
+                await self.process_entry(entry)
+
+    @staticmethod
+    def name_skeleton(name: str) -> str:
+        """"raider123", "Raider_77" gibi isimleri ortak köke indirger"""
+        return _NAME_NOISE.sub("", name.lower())
 
     @commands.Cog.listener()
-    async def on_guild_role_create(self, role):
-        guild = role.guild
-        async for entry in guild.audit_logs(limit=5, action=discord.AuditLogAction.role_create):
-            if not entry.user.guild_permissions.administrator:
-                if await self.check_raid(entry.user, "ROLE_CREATE"):
-                    await self.log_raid(guild, entry.user, "rol oluşturma", len(self.action_cache[(entry.user.id, "ROLE_CREATE")]))
+    async def on_member_join(self, member):
+        guild = member.guild
+        if member.bot or guild.id in self.locked_guilds:
+            return
+        joins = self.join_cache.hit(guild.id, 0, "JOIN")
+        reason = None
+        if joins >= self.join_threshold:
+            reason = f"{self.join_window} saniyede {joins} katılım"
+        if member.created_at > datetime.now(timezone.utc) - self.new_account_age:
+            new_accounts = self.join_cache.hit(guild.id, 0, "NEW_ACCOUNT")
+            if new_accounts >= self.new_account_threshold:
+                reason = reason or f"{self.join_window} saniyede {new_accounts} yeni hesap katıldı"
+        skeleton = self.name_skeleton(member.name)
+        if len(skeleton) >= 3:
+            similar = self.join_cache.hit(guild.id, 0, ("NAME", skeleton))
+            if similar >= self.name_pattern_threshold:
+                reason = reason or f"{similar} benzer isimli hesap katıldı ({skeleton}*)"
+        if reason:
+            await self.lockdown(guild, f"Otomatik: {reason}", auto=True)
+
+    async def lockdown(self, guild: discord.Guild, reason: str, auto: bool = False) -> tuple[int, int] | None:
+        """Tüm metin kanallarını @everyone için kilitler; önceki izinleri veritabanına kaydeder.
+        Sunucu zaten kilitliyse None döner"""
+        if guild.id in self.locked_guilds:
+            return None
+        stored = await self.db.get_lockdown(guild.id)
+        if guild.id in self.locked_guilds:
+            # Sorgu beklenirken başka bir katılım olayı kilitlemiş
+            return None
+        if stored is not None:
+            # Bellekte olmayan kayıtlı kilit: anlık görüntü ezilmez, kilit sahiplenilir
+            self._adopt_lockdown(guild.id, stored[0])
+            return None
+        self.locked_guilds.add(guild.id)
+        committed = False
+        try:
+            everyone = guild.default_role
+            channels = [ch for ch in guild.text_channels if ch.overwrites_for(everyone).send_messages is not False]
+            snapshot = []
+            for channel in channels:
+                allow, deny = channel.overwrites_for(everyone).pair()
+                snapshot.append((channel.id, allow.value, deny.value))
+            unlock_at = datetime.now(timezone.utc) + timedelta(seconds=self.auto_unlock_after) if auto else None
+            await self.db.save_lockdown_snapshot(guild.id, snapshot, unlock_at)
+
+            async def lock(channel):
+                overwrite = channel.overwrites_for(everyone)
+                overwrite.send_messages = False
+                await channel.set_permissions(everyone, overwrite=overwrite, reason=reason)
+
+            locked, elapsed = await self._bulk(channels, lock)
+            committed = True
+        finally:
+            # Kayıt veya kilitleme başarısız olursa sunucu kilitli sayılmaz
+            if not committed:
+                self.locked_guilds.discard(guild.id)
+        self.bot.log_dispatcher.send(guild, self._lockdown_embed("Sunucu Kilitlendi", reason, locked, len(channels), elapsed),
+                                     priority=PRIORITY_HIGH, create_channel=True)
+        if unlock_at:
+            self._schedule_unlock(guild.id, unlock_at)
+        return locked, len(channels)
+
+    async def unlockdown(self, guild: discord.Guild, reason: str) -> tuple[int, int]:
+        """Kilitlemeden önceki izinleri anlık görüntüden toplu olarak geri yükler"""
+        task = self._unlock_tasks.pop(guild.id, None)
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+        everyone = guild.default_role
+        snapshot = await self.db.get_lockdown_snapshot(guild.id)
+
+        async def restore(item):
+            channel_id, allow, deny = item
+            channel = guild.get_channel(channel_id)
+            if channel is None:
+                return
+            overwrite = discord.PermissionOverwrite.from_pair(discord.Permissions(allow), discord.Permissions(deny))
+            await channel.set_permissions(everyone, overwrite=None if overwrite.is_empty() else overwrite, reason=reason)
+
+        restored, elapsed = await self._bulk(snapshot, restore)
+        await self.db.clear_lockdown_snapshot(guild.id)
+        self.locked_guilds.discard(guild.id)
+        self.bot.log_dispatcher.send(guild, self._lockdown_embed("Kilit Kaldırıldı", reason, restored, len(snapshot), elapsed),
+                                     priority=PRIORITY_HIGH, create_channel=True)
+        return restored, len(snapshot)
+
+    async def _bulk(self, items, action) -> tuple[int, float]:
+        semaphore = asyncio.Semaphore(self.lockdown_concurrency)
+        done = 0
+
+        async def run(item):
+            nonlocal done
+            async with semaphore:
+                try:
+                    await action(item)
+                    done += 1
+                except discord.HTTPException:
+                    pass
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await asyncio.gather(*(run(item) for item in items))
+        return done, loop.time() - start
+
+    def _adopt_lockdown(self, guild_id: int, unlock_at: str | None):
+        self.locked_guilds.add(guild_id)
+        if unlock_at and guild_id not in self._unlock_tasks:
+            self._schedule_unlock(guild_id, datetime.fromisoformat(unlock_at))
+
+    def _schedule_unlock(self, guild_id: int, unlock_at: datetime):
+        self._unlock_tasks[guild_id] = asyncio.create_task(self._auto_unlock(guild_id, unlock_at))
+
+    async def _auto_unlock(self, guild_id: int, unlock_at: datetime):
+        await discord.utils.sleep_until(unlock_at)
+        await self.bot.wait_until_ready()
+        guild = self.bot.get_guild(guild_id)
+        if guild is None:
+            # Bot sunucudan çıkmış; izinler geri yüklenemez, kayıt temizlenir
+            self._unlock_tasks.pop(guild_id, None)
+            self.locked_guilds.discard(guild_id)
+            await self.db.clear_lockdown_snapshot(guild_id)
+            return
+        await self.unlockdown(guild, "Otomatik kilit süresi doldu")
+
+    def _lockdown_embed(self, title, reason, done, total, elapsed):
+        embed = discord.Embed(title=title, description=reason, color=0xff0000, timestamp=datetime.now(timezone.utc))
+        embed.add_field(name="Kanallar", value=f"{done}/{total}", inline=True)
+        embed.add_field(name="Süre", value=f"{elapsed:.1f} sn", inline=True)
+        return embed
+
+    @commands.command(name="lockdown")
+    @commands.has_permissions(administrator=True)
+    async def lockdown_command(self, ctx, *, reason="Sebep belirtilmedi"):
+        result = await self.lockdown(ctx.guild, f"{ctx.author}: {reason}")
+        if result is None:
+            return await ctx.send("Sunucu zaten kilitli.")
+        locked, total = result
+        await ctx.send(f"Sunucu kilitlendi ({locked}/{total} kanal).")
+
+    @commands.command(name="unlockdown")
+    @commands.has_permissions(administrator=True)
+    async def unlockdown_command(self, ctx):
+        restored, total = await self.unlockdown(ctx.guild, f"{ctx.author} kilidi kaldırdı")
+        if not total:
+            return await ctx.send("Geri yüklenecek kilit kaydı yok.")
+        await ctx.send(f"Kilit kaldırıldı ({restored}/{total} kanal).")
+
+    @commands.command(name="raidayar")
+    @commands.has_permissions(administrator=True)
+    async def raidayar(self, ctx, esik: int = None, saniye: int = None):
+        await self.load_config(ctx.guild.id)
+        if esik is None or saniye is None:
+            return await ctx.send(
+                f"Raid koruma: {self.action_cache.window(ctx.guild.id):g} saniyede "
+                f"{self.action_cache.threshold(ctx.guild.id)} işlem. Değiştirmek için: raidayar <eşik> <saniye>"
+            )
+        if esik < 2 or not 1 <= saniye <= 3600:
+            return await ctx.send("Eşik en az 2, süre 1-3600 saniye olmalı.")
+        await self.db.set_raid_config(ctx.guild.id, esik, saniye)
+        self.action_cache.configure(ctx.guild.id, esik, saniye)
+        await ctx.send(f"Raid koruma ayarlandı: {saniye} saniyede {esik} işlem.")
 
 async def setup(bot):
     from main import db_manager
@@ -2,25 +2,19 @@ import discord
 from discord.ext import commands
 from datetime import datetime, timezone
 
+from utils.log_dispatcher import PRIORITY_HIGH
+
 class Roles(commands.Cog):
     def __init__(self, bot, db_manager):
         self.bot = bot
         self.db = db_manager
 
-    async def get_log_channel(self, guild: discord.Guild):
-        channel = discord.utils.get(guild.text_channels, name="denetim-log")
-        if not channel:
-            overwrites = {guild.default_role: discord.PermissionOverwrite(send_messages=True)}
-            channel = await guild.create_text_channel("denetim-log", overwrites=overwrites)
-        return channel
-
     async def log_role_action(self, guild, user, target, action, role):
-        channel = await self.get_log_channel(guild)
         embed = discord.Embed(title=f"Rol {action}", color=0x00ff00, timestamp=datetime.now(timezone.utc))
         embed.add_field(name="Yetkili", value=f"{user}", inline=True)
         embed.add_field(name="Hedef", value=f"{target}", inline=True)
         embed.add_field(name="Rol", value=f"{role.name}", inline=False)
-        await channel.send(embed=embed)
+        self.bot.log_dispatcher.send(guild, embed, priority=PRIORITY_HIGH, create_channel=True)
 
     @commands.command(name="rolver")
     @commands.has_permissions(administrator=True)
@@ -0,0 +1,94 @@
+"""Sorgu başına gecikme: her sorguda yeni bağlantı vs. DatabaseManager havuzu.
+
+Kullanım: python benchmarks/db_latency.py [sorgu_sayısı]
+"""
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import aiosqlite
+
+from utils.database import DatabaseManager
+
+
+async def connect_per_query(db_path, n):
+    read, write = [], []
+    for i in range(n):
+        start = time.perf_counter()
+        async with aiosqlite.connect(db_path) as db:
+            cursor = await db.execute(
+                "SELECT 1 FROM forcebans WHERE user_id = ? AND guild_id = ?", (i, 1)
+            )
+            await cursor.fetchone()
+        read.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        async with aiosqlite.connect(db_path) as db:
+            await db.execute(
+                "INSERT INTO mod_logs (guild_id, user_id, target_id, action, reason, timestamp, message_link) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (1, 1, i, "BENCH", None, datetime.now(timezone.utc).isoformat(), None)
+            )
+            await db.commit()
+        write.append(time.perf_counter() - start)
+    return read, write
+
+
+async def pooled(db, n):
+    read, write = [], []
+    for i in range(n):
+        start = time.perf_counter()
+        await db.fetchone(
+            "SELECT 1 FROM forcebans WHERE user_id = ? AND guild_id = ?", (i, 1)
+        )
+        read.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await db.execute(
+            "INSERT INTO mod_logs (guild_id, user_id, target_id, action, reason, timestamp, message_link) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (1, 1, i, "BENCH", None, datetime.now(timezone.utc).isoformat(), None)
+        )
+        write.append(time.perf_counter() - start)
+    return read, write
+
+
+def report(name, samples):
+    samples = sorted(samples)
+    p50 = samples[len(samples) // 2] * 1e6
+    p99 = samples[int(len(samples) * 0.99)] * 1e6
+    print(f"{name:<28} ort={statistics.mean(samples) * 1e6:9.1f}us  p50={p50:9.1f}us  p99={p99:9.1f}us")
+
+
+async def main(n):
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(os.path.join(tmp, "bench.db"))
+        await db.initialize()
+
+        read, write = await connect_per_query(db.db_path, n)
+        report("önce  / okuma (connect)", read)
+        report("önce  / yazma (connect)", write)
+
+        read, write = await pooled(db, n)
+        report("sonra / okuma (havuz)", read)
+        report("sonra / yazma (havuz)", write)
+
+        # Komutun beklediği yalnızca kuyruğa ekleme; diske yazım toplu olarak ayrıca ölçülür
+        enqueue = []
+        for i in range(n):
+            start = time.perf_counter()
+            await db.add_mod_log(1, 1, i, "BENCH", None, None)
+            enqueue.append(time.perf_counter() - start)
+        report("sonra / yazma (kuyruk)", enqueue)
+        start = time.perf_counter()
+        await db.flush_mod_logs()
+        print(f"{'sonra / kuyruk boşaltma':<28} {n} kayıt {(time.perf_counter() - start) * 1e3:.1f}ms")
+        await db.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 500))
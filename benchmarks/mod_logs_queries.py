@@ -0,0 +1,146 @@
+"""mod_logs geçmiş sorguları: indekssiz tarama vs. bileşik indeks + keyset sayfalama.
+
+Sentetik tabloyu (varsayılan 10M satır) önce indekssiz doldurur ve ölçer,
+ardından DatabaseManager.initialize() ile indeksleri kurup aynı sorguları
+havuz üzerinden tekrarlar. Derin sayfalar için OFFSET ile karşılaştırır.
+
+Kullanım: python benchmarks/mod_logs_queries.py [satır_sayısı] [sunucu_sayısı]
+"""
+import asyncio
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.database import DatabaseManager
+
+ACTIONS = ("BAN", "KICK", "MUTE", "UNMUTE", "WARN")
+MEMBERS_PER_GUILD = 20_000
+MODERATORS_PER_GUILD = 25
+PAGE = 10
+
+HISTORY_SQL = (
+    "SELECT id, user_id, target_id, action, reason, timestamp, message_link FROM mod_logs "
+    "WHERE guild_id = ? AND target_id = ? ORDER BY timestamp DESC, id DESC LIMIT ?"
+)
+OFFSET_SQL = (
+    "SELECT id, user_id, target_id, action, reason, timestamp, message_link FROM mod_logs "
+    "WHERE guild_id = ? AND user_id = ? ORDER BY timestamp DESC, id DESC LIMIT ? OFFSET ?"
+)
+
+
+def rows(n, guilds):
+    rng = random.Random(42)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for i in range(n):
+        yield (
+            rng.randrange(guilds),
+            rng.randrange(MODERATORS_PER_GUILD),
+            rng.randrange(MEMBERS_PER_GUILD),
+            rng.choice(ACTIONS),
+            "bench",
+            (start + timedelta(seconds=i)).isoformat(),
+            None,
+        )
+
+
+def populate(path, n, guilds):
+    conn = sqlite3.connect(path)
+    conn.execute("DROP INDEX IF EXISTS idx_mod_logs_target")
+    conn.execute("DROP INDEX IF EXISTS idx_mod_logs_moderator")
+    conn.execute("PRAGMA synchronous = OFF")
+    start = time.perf_counter()
+    conn.executemany(
+        "INSERT INTO mod_logs (guild_id, user_id, target_id, action, reason, timestamp, message_link) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        rows(n, guilds)
+    )
+    conn.commit()
+    print(f"{n} satır yazıldı: {time.perf_counter() - start:.1f} sn")
+    return conn
+
+
+def report(name, samples):
+    samples = sorted(samples)
+    p50 = samples[len(samples) // 2] * 1e3
+    p99 = samples[min(int(len(samples) * 0.99), len(samples) - 1)] * 1e3
+    print(f"{name:<34} ort={statistics.mean(samples) * 1e3:9.3f}ms  p50={p50:9.3f}ms  p99={p99:9.3f}ms")
+
+
+def unindexed(conn, guilds, iterations):
+    rng = random.Random(7)
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        conn.execute(HISTORY_SQL, (rng.randrange(guilds), rng.randrange(MEMBERS_PER_GUILD), PAGE)).fetchall()
+        samples.append(time.perf_counter() - start)
+    report("önce  / hedef geçmişi (tarama)", samples)
+
+
+async def indexed(db, guilds, iterations):
+    rng = random.Random(7)
+    first, deep, offset = [], [], []
+    for _ in range(iterations):
+        guild_id, target_id = rng.randrange(guilds), rng.randrange(MEMBERS_PER_GUILD)
+        start = time.perf_counter()
+        await db.get_history(guild_id, target_id, limit=PAGE)
+        first.append(time.perf_counter() - start)
+
+    # Yetkili geçmişi çok sayfalı: 50. sayfaya keyset ile ve OFFSET ile git
+    for _ in range(max(iterations // 10, 1)):
+        guild_id, moderator_id = rng.randrange(guilds), rng.randrange(MODERATORS_PER_GUILD)
+        cursor, elapsed = None, 0.0
+        for _ in range(50):
+            start = time.perf_counter()
+            page = await db.get_history(guild_id, moderator_id, by_moderator=True, before=cursor, limit=PAGE)
+            elapsed = time.perf_counter() - start
+            if not page:
+                break
+            cursor = (page[-1][5], page[-1][0])
+        deep.append(elapsed)
+
+        start = time.perf_counter()
+        await db.fetchall(OFFSET_SQL, (guild_id, moderator_id, PAGE, 49 * PAGE))
+        offset.append(time.perf_counter() - start)
+
+    report("sonra / hedef geçmişi (indeks)", first)
+    report("sonra / 50. sayfa (keyset)", deep)
+    report("sonra / 50. sayfa (OFFSET)", offset)
+
+    cases = []
+    for case_id in random.Random(3).sample(range(1, 1000), min(iterations, 999)):
+        start = time.perf_counter()
+        await db.get_case(0, case_id)
+        cases.append(time.perf_counter() - start)
+    report("sonra / vaka (birincil anahtar)", cases)
+
+
+async def main(n, guilds):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        db = DatabaseManager(path)
+        await db.initialize()
+        await db.close()
+
+        conn = populate(path, n, guilds)
+        unindexed(conn, guilds, 5)
+        conn.close()
+
+        db = DatabaseManager(path)
+        start = time.perf_counter()
+        await db.initialize()
+        print(f"İndeksler oluşturuldu: {time.perf_counter() - start:.1f} sn")
+        await indexed(db, guilds, 1000)
+        await db.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 100,
+    ))
@@ -0,0 +1,105 @@
+"""RaidProtect sayaçları: eski datetime listesi vs. iki kovalı kayan pencere sayacı.
+
+Kullanım: python benchmarks/raid_counters.py [işlem_sayısı] [anahtar_sayısı]
+"""
+import os
+import random
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.window_counter import WindowCounter
+
+ACTIONS = ("KICK", "BAN", "ROLE_DELETE", "ROLE_CREATE")
+
+
+def legacy(events, threshold=5, window=10):
+    cache = defaultdict(list)
+    for guild_id, actor_id, action, _ in events:
+        now = datetime.utcnow()
+        cache[(actor_id, action)] = [t for t in cache[(actor_id, action)] if now - t < timedelta(seconds=window)]
+        cache[(actor_id, action)].append(now)
+        len(cache[(actor_id, action)]) >= threshold
+    return cache
+
+
+def compact(events, threshold=5, window=10):
+    counter = WindowCounter(threshold, window)
+    for guild_id, actor_id, action, now in events:
+        counter.hit(guild_id, actor_id, action, now) >= threshold
+    return counter
+
+
+def measure(name, fn, events):
+    # Süre ve bellek ayrı geçişlerde ölçülür; tracemalloc izlemesi süreyi katlarca şişirir
+    start = time.perf_counter()
+    fn(events)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    result = fn(events)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<10} {elapsed / len(events) * 1e9:8.0f} ns/işlem   bellek {current / 1e6:8.2f} MB "
+          f"(tepe {peak / 1e6:.2f} MB, {current / max(len(result), 1):.0f} B/anahtar)")
+    return result
+
+
+def time_hits(events) -> tuple[float, WindowCounter]:
+    counter = WindowCounter(5, 10)
+    start = time.perf_counter_ns()
+    for guild_id, actor_id, action, ts in events:
+        counter.hit(guild_id, actor_id, action, ts)
+    return (time.perf_counter_ns() - start) / len(events), counter
+
+
+def main(total, keys):
+    rng = random.Random(7)
+    actors = [(rng.randrange(1, 500), rng.randrange(10**17, 10**18)) for _ in range(keys)]
+    # Saatte ~total/3600 işlem hızında sahte monotonik zaman
+    events = []
+    now = 0.0
+    for _ in range(total):
+        guild_id, actor_id = rng.choice(actors)
+        now += 3600 / total
+        events.append((guild_id, actor_id, rng.choice(ACTIONS), now))
+    print(f"{total} işlem, {keys} aktör")
+
+    # Eski yapı tahliye yapmaz; karşılaştırma aynı kısaltılmış örnek üzerinde yapılır
+    sample = events[: min(total, 200_000)]
+    print(f"karşılaştırma: ilk {len(sample)} işlem")
+    measure("eski", legacy, sample)
+    measure("sayaç", compact, sample)
+    print(f"kararlı durum: {total} işlem, anahtar sınırı {WindowCounter(5, 10).max_keys}")
+    counter = measure("sayaç", compact, events)
+    print(f"sayaç anahtar: {len(counter)}, stats() tahmini {counter.stats()['bytes'] / max(len(counter), 1):.0f} B/anahtar")
+
+    hit_ns, counter = time_hits(events)
+    start = time.perf_counter_ns()
+    for guild_id, actor_id, action, _ in events:
+        counter.count(guild_id, actor_id, action)
+    count_ns = (time.perf_counter_ns() - start) / total
+    print(f"hit(): {hit_ns:.0f} ns, count(): {count_ns:.0f} ns (rastgele anahtarlar, {keys} aktör, tahliyelerle)")
+
+    # Anahtar sınırı altında rastgele erişim: tahliye yok, yalnızca önbellek ıskaları
+    few = actors[: max(keys // 20, 1)]
+    now = 0.0
+    warm = []
+    for _ in range(total):
+        guild_id, actor_id = rng.choice(few)
+        now += 3600 / total
+        warm.append((guild_id, actor_id, rng.choice(ACTIONS), now))
+    hit_ns, counter = time_hits(warm)
+    print(f"hit(): {hit_ns:.0f} ns (rastgele anahtarlar, {len(few)} aktör, tahliyesiz; {len(counter)} anahtar)")
+
+    hit_ns, _ = time_hits([(1, 2, "KICK", i * 0.001) for i in range(total)])
+    print(f"hit(): {hit_ns:.0f} ns (tek sıcak anahtar)")
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 50_000,
+    )
@@ -0,0 +1,330 @@
+"""Mesaj sıcak yolu için çevrimdışı tekrar ölçümü.
+
+Sahte Message/Member/Guild nesneleri main.on_message, forceban_check,
+Automod.on_message ve Log önbelleğinden (content_cache.add) geçirilir.
+forceban_check @bot.check ile kayıtlı global komut kontrolüdür; gerçekte
+yalnızca komut çağrılarında çalışır, burada her mesajda çağrılarak en kötü
+durum (her mesaj bir komut) ölçülür. main içe aktarılırken oluşturulan
+data/ ve logs/ geçici bir dizine yazılır.
+REST çağrıları (mesaj silme, rol verme, kanala yazma) sayılıp hemen döner;
+veritabanı geçici bir dosyadır, ağ bağlantısı gerekmez. Otomatik moderasyon
+logları sahte sunucular bot önbelleğinde olmadığı için gönderilmez.
+
+Trafik sentetik üretilir ya da JSONL dosyasından okunur; her satır
+{"guild_id", "author_id", "content", "bot"?, "attachments"?, "t"?} alanlarını
+taşır (t: saniye cinsinden varış zamanı). --rate verilirse mesajlar o hızda
+ayrı görevler olarak gelir ve gecikme varıştan bitişe ölçülür; verilmezse
+mesajlar art arda işlenir (azami verim; zaman sıkıştığı için flood kuralı
+gerçek trafikten sık tetiklenir). --min-throughput altında kalınırsa
+çıkış kodu 1 olur (CI için).
+
+Kullanım: python benchmarks/replay.py [--messages N] [--rate MSG/SN] [--trace dosya.jsonl] [--min-throughput MSG/SN]
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# main.py içe aktarılırken data/ ve logs/ çalışma dizininde oluşturulur; --trace yolu
+# bu yüzden asıl çalışma dizinine göre çözülür
+LAUNCH_DIR = os.getcwd()
+WORK_DIR = tempfile.TemporaryDirectory(prefix="modbot-replay-")
+os.chdir(WORK_DIR.name)
+
+from discord.ext import commands  # noqa: E402
+
+import main  # noqa: E402
+from Cogs.Automod import Automod  # noqa: E402
+from utils.mute_roles import MUTE_ROLE_NAME  # noqa: E402
+
+WORDS = (
+    "selam", "naber", "bugün", "oyun", "akşam", "sunucu", "etkinlik", "herkese", "tamam", "güzel",
+    "yarın", "müzik", "rol", "kanal", "sohbet", "toplantı", "bot", "yardım", "teşekkürler", "görüşürüz",
+)
+REST_CALLS: Counter = Counter()
+_ids = itertools.count(10**17)
+
+
+async def rest(name: str):
+    REST_CALLS[name] += 1
+
+
+class FakeRole:
+    __slots__ = ("id", "name")
+
+    def __init__(self, role_id: int, name: str):
+        self.id = role_id
+        self.name = name
+
+
+class FakeGuild:
+    __slots__ = ("id", "name", "roles", "shard_id")
+
+    def __init__(self, guild_id: int):
+        self.id = guild_id
+        self.name = f"sunucu-{guild_id}"
+        self.roles = [FakeRole(next(_ids), "@everyone"), FakeRole(next(_ids), MUTE_ROLE_NAME)]
+        self.shard_id = 0
+
+    def get_role(self, role_id: int):
+        return next((role for role in self.roles if role.id == role_id), None)
+
+
+class FakeMember:
+    __slots__ = ("id", "bot", "guild", "mention", "display_name")
+
+    def __init__(self, user_id: int, guild: FakeGuild, bot: bool = False):
+        self.id = user_id
+        self.bot = bot
+        self.guild = guild
+        self.mention = f"<@{user_id}>"
+        self.display_name = f"üye-{user_id}"
+
+    async def add_roles(self, *roles, reason=None):
+        await rest("member.add_roles")
+
+
+class FakeChannel:
+    __slots__ = ("id", "guild", "name", "mention")
+
+    def __init__(self, guild: FakeGuild):
+        self.id = next(_ids)
+        self.guild = guild
+        self.name = "genel"
+        self.mention = f"<#{self.id}>"
+
+    async def send(self, content=None, **kwargs):
+        await rest("channel.send")
+
+
+class FakeAttachment:
+    __slots__ = ("filename",)
+
+    def __init__(self, filename: str):
+        self.filename = filename
+
+
+class FakeMessage:
+    __slots__ = ("id", "content", "author", "guild", "channel", "attachments", "_state")
+
+    def __init__(self, content: str, author: FakeMember, channel: FakeChannel, attachments=(), state=None):
+        self.id = next(_ids)
+        self.content = content
+        self.author = author
+        self.guild = author.guild
+        self.channel = channel
+        self.attachments = [FakeAttachment(name) for name in attachments]
+        self._state = state
+
+    async def delete(self, *, delay=None):
+        await rest("message.delete")
+
+
+class ReplayContext(commands.Context):
+    async def send(self, content=None, **kwargs):
+        await rest("context.send")
+
+
+class World:
+    """Sunucu, kanal ve üye nesnelerini ID başına bir kez oluşturur"""
+
+    def __init__(self, state):
+        self.state = state
+        self.guilds: dict[int, FakeGuild] = {}
+        self.channels: dict[int, FakeChannel] = {}
+        self.members: dict[tuple[int, int], FakeMember] = {}
+
+    def message(self, guild_id: int, author_id: int, content: str, bot: bool = False, attachments=()) -> FakeMessage:
+        guild = self.guilds.get(guild_id)
+        if guild is None:
+            guild = self.guilds[guild_id] = FakeGuild(guild_id)
+            self.channels[guild_id] = FakeChannel(guild)
+        member = self.members.get((guild_id, author_id))
+        if member is None:
+            member = self.members[guild_id, author_id] = FakeMember(author_id, guild, bot)
+        return FakeMessage(content, member, self.channels[guild_id], attachments, self.state)
+
+
+def synthetic(count: int, guilds: int, users: int, seed: int = 7) -> list[dict]:
+    """Üye etkinliği Zipf benzeri dağılır; az sayıda link, caps, küfür ve bot mesajı içerir"""
+    rng = random.Random(seed)
+    guild_ids = [10**15 + i for i in range(guilds)]
+    user_ids = [10**16 + i for i in range(users)]
+    weights = [1 / (rank + 1) for rank in range(users)]
+    authors = rng.choices(user_ids, weights, k=count)
+    traffic = []
+    for author_id in authors:
+        content = " ".join(rng.choices(WORDS, k=rng.randint(1, 12)))
+        roll = rng.random()
+        if roll < 0.02:
+            content += " https://example.com/" + str(rng.randrange(10**6))
+        elif roll < 0.03:
+            content = content.upper()
+        elif roll < 0.035:
+            content += " küfür1"
+        traffic.append({
+            "guild_id": guild_ids[author_id % guilds],
+            "author_id": author_id,
+            "content": content,
+            "bot": roll > 0.99,
+            "attachments": ["resim.png"] if roll > 0.97 else [],
+        })
+    return traffic
+
+
+def load_trace(path: str) -> list[dict]:
+    with open(os.path.join(LAUNCH_DIR, path), encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+async def process(bot, automod: Automod, message: FakeMessage):
+    await main.on_message(message)
+    if not message.author.bot:
+        ctx = await bot.get_context(message, cls=ReplayContext)
+        await main.forceban_check(ctx)
+    bot.content_cache.add(message)
+    await automod.on_message(message)
+
+
+async def run_sequential(bot, automod, messages) -> list[float]:
+    latencies = []
+    for message in messages:
+        start = time.perf_counter()
+        await process(bot, automod, message)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def run_paced(bot, automod, messages, arrivals) -> list[float]:
+    """Her mesaj varış anında ayrı görev olarak başlar (gateway dağıtımı gibi)"""
+    latencies = []
+
+    async def one(message, arrival):
+        await process(bot, automod, message)
+        latencies.append(time.perf_counter() - arrival)
+
+    tasks = []
+    began = time.perf_counter()
+    for message, offset in zip(messages, arrivals):
+        arrival = began + offset
+        delay = arrival - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(one(message, arrival)))
+    await asyncio.gather(*tasks)
+    return latencies
+
+
+async def measure_memory(bot, automod, messages) -> tuple[list[int], int]:
+    """Mesaj başına geçici tepe bellek ve toplam kalıcı bellek (tracemalloc)"""
+    transient = []
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    for message in messages:
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        await process(bot, automod, message)
+        transient.append(tracemalloc.get_traced_memory()[1] - before)
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    return transient, retained
+
+
+def percentile(samples: list, q: float):
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * q), len(ordered) - 1)]
+
+
+async def run(args) -> float:
+    traffic = load_trace(args.trace) if args.trace else synthetic(args.messages, args.guilds, args.users)
+    with tempfile.TemporaryDirectory() as tmp:
+        bot = main.bot
+        db = main.db_manager
+        db.db_path = os.path.join(tmp, "replay.db")
+        await db.initialize()
+        # get_context yazarın bot kendisi olup olmadığına bakar
+        bot._connection.user = FakeMember(1, None, bot=True)
+        automod = Automod(bot, db)
+
+        authors = sorted({(entry["guild_id"], entry["author_id"]) for entry in traffic})
+        rng = random.Random(11)
+        for guild_id, author_id in rng.sample(authors, int(len(authors) * args.forceban_ratio)):
+            await db.add_forceban(author_id, guild_id, 1, "replay")
+
+        world = World(bot._connection)
+
+        def build(entries):
+            return [
+                world.message(e["guild_id"], e["author_id"], e["content"], e.get("bot", False), e.get("attachments", ()))
+                for e in entries
+            ]
+
+        # Isınma: sunucu başına kural/küfür listesi ve mute rolü önbelleğe alınır
+        await run_sequential(bot, automod, build(traffic[: min(len(traffic), 1000)]))
+        REST_CALLS.clear()
+
+        messages = build(traffic)
+        if args.rate:
+            arrivals = [i / args.rate for i in range(len(messages))]
+        elif all("t" in e for e in traffic):
+            first = traffic[0]["t"]
+            arrivals = [(e["t"] - first) / args.speed for e in traffic]
+        else:
+            arrivals = None
+        start = time.perf_counter()
+        if arrivals is None:
+            latencies = await run_sequential(bot, automod, messages)
+        else:
+            latencies = await run_paced(bot, automod, messages, arrivals)
+        elapsed = time.perf_counter() - start
+        throughput = len(messages) / elapsed
+
+        sample = build(traffic[: min(len(traffic), args.memory_sample)])
+        transient, retained = await measure_memory(bot, automod, sample)
+
+        mode = f"{args.rate} mesaj/sn hedef" if args.rate else ("kayıttaki zamanlama" if arrivals else "art arda")
+        print(f"{len(messages)} mesaj, {len(world.guilds)} sunucu, {len(world.members)} üye ({mode})")
+        print(f"verim      {throughput:10.0f} mesaj/sn")
+        print(
+            f"gecikme    p50={percentile(latencies, 0.5) * 1e6:8.1f}us  p99={percentile(latencies, 0.99) * 1e6:8.1f}us  "
+            f"maks={max(latencies) * 1e6:8.1f}us"
+        )
+        print(
+            f"bellek     geçici ort={sum(transient) / len(transient):8.0f} B/mesaj  p99={percentile(transient, 0.99)} B  "
+            f"kalıcı={retained / len(sample):6.0f} B/mesaj ({len(sample)} mesajlık örnek)"
+        )
+        hits = {name: stats["hits"] for name, stats in automod.engine.stats().items()}
+        print(f"automod    {hits}")
+        print(f"REST       {dict(REST_CALLS)}")
+        await db.close()
+    return throughput
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Mesaj sıcak yolu tekrar ölçümü")
+    parser.add_argument("--messages", type=int, default=100_000, help="sentetik mesaj sayısı")
+    parser.add_argument("--guilds", type=int, default=200)
+    parser.add_argument("--users", type=int, default=50_000)
+    parser.add_argument("--trace", help="kayıtlı trafik (JSONL)")
+    parser.add_argument("--rate", type=float, default=0, help="mesaj/sn; 0 = art arda, azami verim")
+    parser.add_argument("--speed", type=float, default=1.0, help="kayıttaki zamanlamanın hızlandırma katsayısı")
+    parser.add_argument("--forceban-ratio", type=float, default=0.01)
+    parser.add_argument("--memory-sample", type=int, default=5000)
+    parser.add_argument("--min-throughput", type=float, default=0, help="altında kalınırsa çıkış kodu 1")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    throughput = asyncio.run(run(args))
+    if throughput < args.min_throughput:
+        print(f"Verim {throughput:.0f} < {args.min_throughput:.0f} mesaj/sn")
+        sys.exit(1)
@@ -0,0 +1,180 @@
+"""Shard aralıklarını birden fazla bot işlemine dağıtan küme başlatıcı.
+
+Her işlem main.py'yi SHARD_COUNT / SHARD_IDS / CLUSTER_ID ortam değişkenleriyle
+çalıştırır. Şema göçleri işlemler başlamadan bir kez yapılır; işlemler aynı
+SQLite dosyasını WAL + busy_timeout + BEGIN IMMEDIATE ile paylaşır. Bir işlem
+`restart` komutuyla RESTART_EXIT_CODE ile çıkarsa tüm küme sırayla yeniden
+başlatılır; başka bir nedenle düşen işlem tek başına yeniden başlatılır.
+
+Kullanım: python launcher.py [işlem_sayısı]
+"""
+import asyncio
+import logging
+import math
+import os
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import aiohttp
+from dotenv import load_dotenv
+
+# main içe aktarılmaz: bot nesnesi, log dinleyicisi ve log dosyası denetleyicide oluşmamalı
+from utils.database import DatabaseManager
+from utils.shard_stats import RESTART_EXIT_CODE
+
+logger = logging.getLogger("ModerationBot.launcher")
+
+# Discord: max_concurrency başına 5 saniyede bir IDENTIFY
+IDENTIFY_INTERVAL = 5.0
+STOP_TIMEOUT = 30.0
+MAX_BACKOFF = 60.0
+BOT_SCRIPT = Path(__file__).resolve().with_name("main.py")
+
+
+async def fetch_gateway(token: str) -> tuple[int, int]:
+    """Önerilen shard sayısı ve IDENTIFY eşzamanlılığı"""
+    async with aiohttp.ClientSession() as session:
+        async with session.get(
+            "https://discord.com/api/v10/gateway/bot", headers={"Authorization": f"Bot {token}"}
+        ) as response:
+            response.raise_for_status()
+            data = await response.json()
+    return data["shards"], data["session_start_limit"]["max_concurrency"]
+
+
+async def prepare_database():
+    # İşlemlerle aynı dosya: işlemler BOT_SCRIPT'in dizininde çalışır
+    db = DatabaseManager(str(BOT_SCRIPT.parent / "data" / "moderation.db"))
+    await db.initialize()
+    await db.close()
+
+
+def split_shards(shard_count: int, clusters: int) -> list[list[int]]:
+    per_cluster = math.ceil(shard_count / clusters)
+    return [
+        list(range(start, min(start + per_cluster, shard_count)))
+        for start in range(0, shard_count, per_cluster)
+    ]
+
+
+class Worker:
+    def __init__(self, cluster_id: int, shard_ids: list[int], shard_count: int):
+        self.cluster_id = cluster_id
+        self.shard_ids = shard_ids
+        self.shard_count = shard_count
+        self.process: subprocess.Popen | None = None
+        self.failures = 0
+        self.started_at = 0.0
+        self.restart_at = 0.0
+
+    def start(self):
+        env = dict(
+            os.environ,
+            SHARD_COUNT=str(self.shard_count),
+            SHARD_IDS=",".join(map(str, self.shard_ids)),
+            CLUSTER_ID=str(self.cluster_id),
+        )
+        kwargs = {}
+        if os.name == "nt":
+            # CTRL_BREAK_EVENT yalnızca ayrı süreç grubuna gönderilebilir
+            kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+        self.process = subprocess.Popen([sys.executable, str(BOT_SCRIPT)], cwd=BOT_SCRIPT.parent, env=env, **kwargs)
+        self.started_at = time.monotonic()
+        logger.info(f"Küme #{self.cluster_id} başlatıldı (pid {self.process.pid}, shard {self.shard_ids})")
+
+    def poll(self) -> int | None:
+        return self.process.poll() if self.process is not None else None
+
+    def stop(self):
+        if self.process is None or self.process.poll() is not None:
+            return
+        self.process.send_signal(signal.CTRL_BREAK_EVENT if os.name == "nt" else signal.SIGTERM)
+        try:
+            self.process.wait(STOP_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            logger.warning(f"Küme #{self.cluster_id} zamanında kapanmadı, sonlandırılıyor")
+            self.process.kill()
+            self.process.wait()
+
+
+class Launcher:
+    def __init__(self, workers: list[Worker], max_concurrency: int):
+        self.workers = workers
+        self.max_concurrency = max_concurrency
+
+    def startup_delay(self, worker: Worker) -> float:
+        # İşlemler kendi içinde IDENTIFY'ı sıralar; işlemler arası sıra burada
+        return math.ceil(len(worker.shard_ids) / self.max_concurrency) * IDENTIFY_INTERVAL
+
+    def start_all(self):
+        for i, worker in enumerate(self.workers):
+            worker.start()
+            if i < len(self.workers) - 1:
+                time.sleep(self.startup_delay(worker))
+
+    def stop_all(self):
+        for worker in reversed(self.workers):
+            worker.stop()
+
+    def run(self):
+        try:
+            self.start_all()
+            while True:
+                time.sleep(1)
+                for worker in self.workers:
+                    code = worker.poll()
+                    if code is None:
+                        continue
+                    if code == RESTART_EXIT_CODE:
+                        logger.info(f"Küme #{worker.cluster_id} yeniden başlatma istedi, tüm küme yeniden başlatılıyor")
+                        self.stop_all()
+                        for w in self.workers:
+                            w.failures = 0
+                        self.start_all()
+                        break
+                    if code == 0:
+                        logger.info(f"Küme #{worker.cluster_id} kapandı, başlatıcı durduruluyor")
+                        self.stop_all()
+                        return
+                    if worker.restart_at == 0.0:
+                        # Uzun süre sağlıklı çalıştıysa bekleme süresi baştan başlar
+                        if time.monotonic() - worker.started_at > MAX_BACKOFF:
+                            worker.failures = 0
+                        worker.failures += 1
+                        backoff = min(2 ** worker.failures, MAX_BACKOFF)
+                        worker.restart_at = time.monotonic() + backoff
+                        logger.error(f"Küme #{worker.cluster_id} {code} koduyla düştü, {backoff:.0f} sn sonra yeniden başlatılacak")
+                    elif time.monotonic() >= worker.restart_at:
+                        worker.restart_at = 0.0
+                        worker.start()
+        except KeyboardInterrupt:
+            logger.info("Başlatıcı durduruluyor")
+            self.stop_all()
+
+
+def main():
+    load_dotenv()
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s", datefmt="%H:%M:%S"
+    )
+    token = os.getenv("TOKEN")
+    clusters = int(sys.argv[1]) if len(sys.argv) > 1 else int(os.getenv("CLUSTERS", os.cpu_count() or 1))
+    shard_count, max_concurrency = asyncio.run(fetch_gateway(token))
+    if os.getenv("SHARD_COUNT"):
+        shard_count = int(os.getenv("SHARD_COUNT"))
+    clusters = min(clusters, shard_count)
+    asyncio.run(prepare_database())
+
+    workers = [
+        Worker(cluster_id, shard_ids, shard_count)
+        for cluster_id, shard_ids in enumerate(split_shards(shard_count, clusters))
+    ]
+    logger.info(f"{shard_count} shard, {len(workers)} işleme dağıtılıyor (max_concurrency {max_concurrency})")
+    Launcher(workers, max_concurrency).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,56 @@
+import atexit
+import io
 import os
+import signal
 import sys
 import asyncio
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueListener, RotatingFileHandler
+from queue import SimpleQueue
 import colorlog
 from datetime import datetime, timezone
 from pathlib import Path
+import time
 import traceback
 import json
+import hashlib
+from collections import Counter
+from contextlib import contextmanager
+from typing import Literal, Optional
 
 import discord
 from discord.ext import commands, tasks
 from discord import app_commands
-import aiosqlite
 from dotenv import load_dotenv
 
+from utils.case_pages import HistoryView, case_embed
+from utils.database import DatabaseManager
+from utils.export import GuildExport
+from utils.log_channels import CONFIGURABLE_EVENTS, EVENT_BITS, LogChannelResolver
+from utils.log_dispatcher import LogDispatcher, PRIORITY_HIGH
+from utils.log_setup import (
+    ContextFilter, DebugSampler, JsonFormatter, LoopQueueHandler, bind_log_context, parse_levels
+)
+from utils.mass_action import (
+    MAX_TARGETS, ConfirmView, filter_targets, joined_within, mass_ban, mass_kick, parse_targets, read_attachment_ids
+)
+from utils.message_cache import MessageContentCache
+from utils.metrics import (
+    COMMAND_SECONDS, EVENT_SECONDS, REGISTRY,
+    Gauge, MetricsServer, MetricsTree, install_ratelimit_handler, monitor_loop_lag, record_interaction
+)
+from utils.mute_roles import MuteRoleManager
+from utils.mute_scheduler import Duration, MuteScheduler, parse_duration
+from utils.purge import PurgeFilter, PurgeJob, run_purge
+from utils.shard_stats import RESTART_EXIT_CODE, ShardStats, event_shard, format_latency
+
 def setup_logging() -> logging.Logger:
+    """Kayıtları kuyruğa koyar; konsol ve dosya yazımı dinleyici iş parçacığında yapılır.
+
+    LOG_FORMAT=json: dosyaya JSON satırları (guild_id/user_id/command alanlarıyla)
+    LOG_LEVELS: logger başına seviye, ör. `ModerationBot.purge=DEBUG,discord.gateway=WARNING`
+    LOG_DEBUG_SAMPLE=N: aynı satırdan gelen DEBUG kayıtlarının N'de biri yazılır
+    """
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
     
@@ -35,17 +70,24 @@ def setup_logging() -> logging.Logger:
         }
     )
     
-    file_formatter = logging.Formatter(
-        '%(asctime)s | %(levelname)-8s | %(name)s | %(funcName)s:%(lineno)d | %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    # Küme başlatıcısı altında her işlem kendi dosyasını döndürür
+    cluster_id = os.getenv("CLUSTER_ID")
+    json_lines = os.getenv("LOG_FORMAT", "").lower() == "json"
+    if json_lines:
+        file_formatter = JsonFormatter({"cluster": int(cluster_id)} if cluster_id else None)
+    else:
+        file_formatter = logging.Formatter(
+            '%(asctime)s | %(levelname)-8s | %(name)s | %(funcName)s:%(lineno)d | %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
     
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(console_formatter)
     
+    file_name = f'moderation_bot-{cluster_id}' if cluster_id else 'moderation_bot'
     file_handler = RotatingFileHandler(
-        filename=log_dir / 'moderation_bot.log',
+        filename=log_dir / (file_name + ('.jsonl' if json_lines else '.log')),
         maxBytes=10 * 1024 * 1024,
         backupCount=10,
         encoding='utf-8'
@@ -53,117 +95,257 @@ def setup_logging() -> logging.Logger:
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(file_formatter)
     
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    queue_handler = LoopQueueHandler(SimpleQueue())
+    queue_handler.addFilter(DebugSampler(int(os.getenv("LOG_DEBUG_SAMPLE", "1"))))
+    queue_handler.addFilter(ContextFilter())
+    listener = QueueListener(queue_handler.queue, console_handler, file_handler, respect_handler_level=True)
+    listener.start()
+    # Kapanışta kuyrukta kalan kayıtlar yazılır
+    atexit.register(listener.stop)
+    
+    logger.addHandler(queue_handler)
+    # discord.py kendi stderr işleyicisini kurmaz (bot.run(log_handler=None)); aynı kuyruğu kullanır
+    discord_logger = logging.getLogger("discord")
+    discord_logger.setLevel(logging.INFO)
+    discord_logger.addHandler(queue_handler)
+    for name, level in parse_levels(os.getenv("LOG_LEVELS")).items():
+        logging.getLogger(name).setLevel(level)
     
     return logger
 
+load_dotenv()
 logger = setup_logging()
 
-class DatabaseManager:
-    def __init__(self, db_path: str = "data/moderation.db"):
-        self.db_path = db_path
-        self.db_dir = Path("data")
-        self.db_dir.mkdir(exist_ok=True)
-        logger.info(f"Veritabanı yöneticisi başlatılıyor: {db_path}")
-    
-    async def initialize(self):
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute('''
-                CREATE TABLE IF NOT EXISTS forcebans (
-                    user_id INTEGER NOT NULL,
-                    guild_id INTEGER NOT NULL,
-                    banned_by INTEGER NOT NULL,
-                    ban_reason TEXT,
-                    ban_date TEXT NOT NULL,
-                    PRIMARY KEY (user_id, guild_id)
-                )
-            ''')
-            await db.execute('''
-                CREATE TABLE IF NOT EXISTS mutes (
-                    user_id INTEGER NOT NULL,
-                    guild_id INTEGER NOT NULL,
-                    muted_by INTEGER NOT NULL,
-                    mute_reason TEXT,
-                    mute_date TEXT NOT NULL,
-                    unmute_date TEXT,
-                    PRIMARY KEY (user_id, guild_id)
-                )
-            ''')
-            await db.execute('''
-                CREATE TABLE IF NOT EXISTS log_channels (
-                    guild_id INTEGER PRIMARY KEY,
-                    channel_id INTEGER NOT NULL,
-                    log_events TEXT NOT NULL DEFAULT '{"message_delete":true,"message_edit":true,"member_join":true,"member_remove":true,"ban":true,"unban":true,"kick":true,"mute":true,"unmute":true,"role_change":true,"voice_state":true}'
-                )
-            ''')
-            await db.execute('''
-                CREATE TABLE IF NOT EXISTS mute_roles (
-                    guild_id INTEGER PRIMARY KEY,
-                    role_id INTEGER NOT NULL
-                )
-            ''')
-            await db.execute('''
-                CREATE TABLE IF NOT EXISTS mod_logs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id INTEGER NOT NULL,
-                    user_id INTEGER NOT NULL,
-                    target_id INTEGER NOT NULL,
-                    action TEXT NOT NULL,
-                    reason TEXT,
-                    timestamp TEXT NOT NULL,
-                    message_link TEXT
-                )
-            ''')
-            await db.commit()
-            logger.info("Veritabanı tabloları başarıyla oluşturuldu")
-    
-    async def add_forceban(self, user_id: int, guild_id: int, banned_by: int, reason: str):
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                "INSERT OR REPLACE INTO forcebans (user_id, guild_id, banned_by, ban_reason, ban_date) VALUES (?, ?, ?, ?, ?)",
-                (user_id, guild_id, banned_by, reason, datetime.now(timezone.utc).isoformat())
-            )
-            await db.commit()
-    
-    async def remove_forceban(self, user_id: int, guild_id: int) -> bool:
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute(
-                "DELETE FROM forcebans WHERE user_id = ? AND guild_id = ?",
-                (user_id, guild_id)
-            )
-            await db.commit()
-            return cursor.rowcount > 0
-    
-    async def is_forcebanned(self, user_id: int, guild_id: int) -> bool:
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute(
-                "SELECT 1 FROM forcebans WHERE user_id = ? AND guild_id = ?",
-                (user_id, guild_id)
-            )
-            result = await cursor.fetchone()
-            return result is not None
-
-load_dotenv()
 TOKEN = os.getenv("TOKEN")
+COGS_DIR = Path(__file__).resolve().parent / "Cogs"
+
+# Shard ayarları; launcher.py her işleme kendi aralığını ortam değişkenleriyle verir
+SHARD_COUNT = int(os.getenv("SHARD_COUNT")) if os.getenv("SHARD_COUNT") else None
+SHARD_IDS = [int(x) for x in os.getenv("SHARD_IDS", "").split(",") if x.strip()] or None
+CLUSTER_ID = int(os.getenv("CLUSTER_ID")) if os.getenv("CLUSTER_ID") else None
+# Yalnızca 127.0.0.1'de dinlenir; 0 kapatır. Kümede her işlem CLUSTER_ID kadar kaydırılmış portu kullanır
+METRICS_PORT = int(os.getenv("METRICS_PORT", "9108"))
 
 intents = discord.Intents.default()
 intents.members = True
 intents.guilds = True
 intents.messages = True
 intents.message_content = True
+intents.moderation = True  # on_audit_log_entry_create (RaidProtect)
+
+class ModerationBot(commands.AutoShardedBot):
+    def __init__(self, *args, db_manager: DatabaseManager, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.db = db_manager
+        self.shard_stats = ShardStats()
+        self.exit_code = 0
+        self.logger = logger
+        self.log_channels = LogChannelResolver(self, db_manager)
+        self.log_dispatcher = LogDispatcher(self)
+        self.mute_roles = MuteRoleManager(self, db_manager)
+        self.mute_scheduler = MuteScheduler(self, db_manager)
+        self.purge_jobs: dict[int, PurgeJob] = {}
+        self.content_cache = MessageContentCache()
+        self.metrics_server: MetricsServer | None = None
+        self._lag_task: asyncio.Task | None = None
+        # Aşama adı -> süre (sn); ilk on_ready'de tek satırda loglanır
+        self.startup_timings: dict[str, float] = {}
+        self._startup_began = time.perf_counter()
+        self._startup_reported = False
+
+    @contextmanager
+    def _phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.startup_timings[name] = time.perf_counter() - start
+
+    async def setup_hook(self):
+        """Bağlantıdan önce bir kez çalışır; yeniden bağlanmalarda tekrarlanmaz"""
+        with self._phase("veritabanı"):
+            await self.db.initialize()
+        with self._phase("önbellekler"):
+            await asyncio.gather(self.log_channels.load(), self.mute_roles.load())
+        with self._phase("coglar"):
+            await self.load_cogs()
+        with self._phase("komut senkronu"):
+            await self.sync_commands()
+        with self._phase("metrikler"):
+            await self.start_metrics()
+
+    async def load_cogs(self):
+        await self.add_cog(Moderation(self, self.db))
+        names = sorted(f"{COGS_DIR.name}.{path.stem}" for path in COGS_DIR.glob("*.py"))
+        await asyncio.gather(*(self._load_cog(name) for name in names))
+
+    async def _load_cog(self, name: str):
+        start = time.perf_counter()
+        try:
+            await self.load_extension(name)
+        except Exception as e:
+            logger.error(f"Cog yüklenemedi: {name}", exc_info=e)
+            return
+        logger.info(f"Cog yüklendi: {name} ({(time.perf_counter() - start) * 1000:.0f} ms)")
+
+    async def sync_commands(self):
+        """Komut ağacının özeti son senkronla aynıysa API'ye yükleme yapmaz"""
+        # Komut ağacı globaldir; kümede yalnızca ilk işlem senkronlar
+        if CLUSTER_ID not in (None, 0):
+            return
+        payload = sorted((command.to_dict(self.tree) for command in self.tree.get_commands()), key=lambda c: c["name"])
+        digest = hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+        key = f"command_tree:{self.application_id}"
+        if await self.db.get_state(key) == digest:
+            logger.info("Komut ağacı değişmedi, senkron atlandı")
+            return
+        synced = await self.tree.sync()
+        await self.db.set_state(key, digest)
+        logger.info(f"Komut ağacı senkronlandı: {len(synced)} komut")
+
+    async def start_metrics(self):
+        REGISTRY.add_collector(self.collect_metrics)
+        install_ratelimit_handler()
+        self._lag_task = asyncio.create_task(monitor_loop_lag())
+        if not METRICS_PORT:
+            return
+        self.metrics_server = MetricsServer(REGISTRY, port=METRICS_PORT + (CLUSTER_ID or 0))
+        try:
+            await self.metrics_server.start()
+        except OSError as e:
+            logger.warning(f"Metrik uç noktası açılamadı (port {self.metrics_server.port}): {e}")
+            self.metrics_server = None
+
+    def collect_metrics(self) -> list[Gauge]:
+        """/metrics okunurken çağrılır; sıcak yolda hiçbir şey hesaplanmaz"""
+        guilds = Gauge("modbot_guilds", "Sunucu sayısı").add((), len(self.guilds))
+        members = Gauge("modbot_members", "Sunuculardaki toplam üye sayısı").add(
+            (), sum(guild.member_count or 0 for guild in self.guilds)
+        )
+        users = Gauge("modbot_cached_users", "Önbellekteki kullanıcı sayısı").add((), len(self.users))
+        latency = Gauge("modbot_shard_latency_seconds", "Shard heartbeat gecikmesi", ("shard",))
+        for shard_id, value in self.latencies:
+            latency.add((shard_id,), value)
+        shard_events = Gauge("modbot_shard_events_total", "Shard başına dağıtılan olay", ("shard",), type="counter")
+        shard_rate = Gauge("modbot_shard_event_rate", "Shard başına son 60 sn olay/sn", ("shard",))
+        for shard_id, stats in self.shard_stats.stats().items():
+            shard_events.add((shard_id,), stats["events"])
+            shard_rate.add((shard_id,), stats["rate"])
+
+        cache_entries = Gauge("modbot_cache_entries", "Önbellekteki giriş sayısı", ("cache",))
+        cache_bytes = Gauge("modbot_cache_bytes", "Önbelleğin yaklaşık bellek kullanımı", ("cache",))
+        caches = {"message_content": self.content_cache.stats()}
+        automod = self.get_cog("Automod")
+        if automod is not None:
+            caches["flood"] = automod.message_cache.stats()
+        raid = self.get_cog("RaidProtect")
+        if raid is not None:
+            caches["raid_actions"] = raid.action_cache.stats()
+            caches["raid_joins"] = raid.join_cache.stats()
+        for name, stats in caches.items():
+            cache_entries.add((name,), stats.get("entries", stats.get("keys", 0)))
+            cache_bytes.add((name,), stats["bytes"])
+        forceban = self.db.forceban_stats()
+        cache_entries.add(("forceban",), forceban["entries"])
+        cache_entries.add(("mute_schedule",), len(self.mute_scheduler))
+        forceban_lookups = Gauge(
+            "modbot_forceban_lookups_total", "Mesaj yolundaki forceban sorguları", ("result",), type="counter"
+        )
+        forceban_lookups.add(("hit",), forceban["hits"]).add(("miss",), forceban["lookups"] - forceban["hits"])
+
+        rule_evaluations = Gauge(
+            "modbot_automod_rule_evaluations_total", "Automod kuralının çalıştırılma sayısı", ("rule",), type="counter"
+        )
+        rule_hits = Gauge("modbot_automod_rule_hits_total", "Automod kuralının tetiklenme sayısı", ("rule",), type="counter")
+        rule_p99 = Gauge("modbot_automod_rule_p99_seconds", "Automod kuralının p99 süresi", ("rule",))
+        if automod is not None:
+            for rule, stats in automod.engine.stats().items():
+                rule_evaluations.add((rule,), stats["evaluations"])
+                rule_hits.add((rule,), stats["hits"])
+                rule_p99.add((rule,), stats["p99_us"] / 1e6)
+
+        mod_logs = self.db.mod_log_stats()
+        dispatcher = self.log_dispatcher.stats()
+        queues = Gauge("modbot_queue_depth", "Bekleyen iş sayısı", ("queue",))
+        queues.add(("mod_logs",), mod_logs["queue_depth"]).add(("log_dispatcher",), dispatcher["queued"])
+        queues.add(("purge_jobs",), len(self.purge_jobs))
+        log_events = Gauge("modbot_log_events_total", "Log kanalına giden olaylar", ("outcome",), type="counter")
+        log_events.add(("embed",), dispatcher["sent_embeds"]).add(("summarized",), dispatcher["summarized_events"])
+        log_events.add(("dropped",), dispatcher["dropped_events"])
+        return [
+            guilds, members, users, latency, shard_events, shard_rate, cache_entries, cache_bytes,
+            forceban_lookups, rule_evaluations, rule_hits, rule_p99, queues, log_events,
+        ]
+
+    def report_startup(self):
+        if self._startup_reported:
+            return
+        self._startup_reported = True
+        self.startup_timings["ilk READY"] = time.perf_counter() - self._startup_began
+        logger.info("Başlangıç süreleri: " + " | ".join(
+            f"{name} {elapsed:.2f} sn" for name, elapsed in self.startup_timings.items()
+        ))
+
+    def dispatch(self, event_name: str, /, *args, **kwargs):
+        if not event_name.startswith("socket_"):
+            self.shard_stats.record(event_shard(args, self.shard_count))
+        super().dispatch(event_name, *args, **kwargs)
+
+    async def _run_event(self, coro, event_name: str, *args, **kwargs):
+        # Client._run_event her dinleyiciyi ayrı çalıştırır (cog dinleyicileri dahil)
+        start = time.perf_counter()
+        try:
+            await super()._run_event(coro, event_name, *args, **kwargs)
+        finally:
+            EVENT_SECONDS.observe(
+                (event_name, getattr(coro, "__qualname__", "?")), time.perf_counter() - start
+            )
+
+    async def invoke(self, ctx: commands.Context):
+        bind_log_context(
+            ctx.guild.id if ctx.guild else None, ctx.author.id, ctx.command.qualified_name if ctx.command else None
+        )
+        start = time.perf_counter()
+        try:
+            await super().invoke(ctx)
+        finally:
+            if ctx.command is not None:
+                COMMAND_SECONDS.observe(
+                    (ctx.command.qualified_name, "prefix", "error" if ctx.command_failed else "ok"),
+                    time.perf_counter() - start
+                )
+
+    async def on_app_command_completion(self, interaction: discord.Interaction, command):
+        record_interaction(interaction, "ok")
+
+    async def close(self):
+        if self._lag_task is not None:
+            self._lag_task.cancel()
+        if self.metrics_server is not None:
+            await self.metrics_server.close()
+        self.mute_scheduler.stop()
+        await self.log_dispatcher.close()
+        await super().close()
+        # Kapanışta (restart dahil) bekleyen mod_logs satırları diske yazılır
+        await self.db.close()
 
-bot = commands.Bot(command_prefix="/", intents=intents, help_command=None)
-tree = bot.tree
 db_manager = DatabaseManager()
+bot = ModerationBot(
+    command_prefix="/", intents=intents, help_command=None, db_manager=db_manager,
+    shard_count=SHARD_COUNT, shard_ids=SHARD_IDS, tree_cls=MetricsTree
+)
+tree = bot.tree
 
 @bot.event
 async def on_ready():
-    await db_manager.initialize()
-    logger.info(f"{bot.user} aktif! {len(bot.guilds)} sunucuda çalışıyor.")
-    await tree.sync()
+    # Veritabanı, önbellekler, cog'lar ve komut senkronu setup_hook'ta bir kez yapılır
+    await bot.mute_scheduler.start()
+    logger.info(f"{bot.user} aktif! {len(bot.guilds)} sunucuda çalışıyor (shard: {bot.shard_ids or 'otomatik'}).")
+    bot.report_startup()
     if not status_loop.is_running():
         status_loop.start()
+    if not forceban_sync_loop.is_running():
+        forceban_sync_loop.start()
 
 @tasks.loop(minutes=5)
 async def status_loop():
@@ -175,10 +357,14 @@ async def status_loop():
     activity = discord.Game(name=statuses[datetime.now().minute % len(statuses)])
     await bot.change_presence(status=discord.Status.online, activity=activity)
 
-for filename in os.listdir("./cogs"):
-    if filename.endswith(".py"):
-        bot.load_extension(f"cogs.{filename[:-3]}")
-        logger.info(f"Cog yüklendi: {filename}")
+@tasks.loop(minutes=10)
+async def forceban_sync_loop():
+    await db_manager.verify_forceban_index()
+    stats = db_manager.forceban_stats()
+    logger.debug(
+        f"Forceban indeksi: {stats['entries']} kayıt, {stats['lookups']} sorgu, "
+        f"isabet oranı %{stats['hit_rate'] * 100:.2f}"
+    )
 
 @bot.event
 async def on_command_error(ctx, error):
@@ -196,10 +382,7 @@ async def on_command_error(ctx, error):
 
 @bot.event
 async def on_guild_join(guild):
-    log_channel = discord.utils.get(guild.text_channels, name="denetim-log")
-    if not log_channel:
-        overwrites = {guild.default_role: discord.PermissionOverwrite(send_messages=True)}
-        log_channel = await guild.create_text_channel("denetim-log", overwrites=overwrites)
+    await bot.log_channels.get_or_create(guild)
 
 @bot.event
 async def on_guild_remove(guild):
@@ -207,14 +390,36 @@ async def on_guild_remove(guild):
 
 @tree.command(name="ping", description="Botun pingini gösterir")
 async def slash_ping(interaction: discord.Interaction):
-    await interaction.response.send_message(f"Pong! {round(bot.latency*1000)}ms")
+    text = f"Pong! {format_latency(bot.latency)}"
+    if interaction.guild is not None and (bot.shard_count or 1) > 1:
+        shard_id = interaction.guild.shard_id
+        shard = bot.get_shard(shard_id)
+        if shard is not None:
+            text += f" | Shard #{shard_id}: {format_latency(shard.latency)}, {bot.shard_stats.rate(shard_id):.1f} olay/sn"
+    await interaction.response.send_message(text)
 
 @tree.command(name="info", description="Bot hakkında bilgi verir")
 async def slash_info(interaction: discord.Interaction):
     embed = discord.Embed(title="Moderasyon Botu", color=0x00ff00)
     embed.add_field(name="Sunucular", value=f"{len(bot.guilds)}", inline=True)
     embed.add_field(name="Kullanıcılar", value=f"{len(bot.users)}", inline=True)
-    embed.add_field(name="Ping", value=f"{round(bot.latency*1000)}ms", inline=True)
+    embed.add_field(name="Ping", value=format_latency(bot.latency), inline=True)
+    guild_counts = Counter(guild.shard_id for guild in bot.guilds)
+    shard_lines = [
+        f"#{shard_id}: {format_latency(latency)}, {guild_counts[shard_id]} sunucu, "
+        f"{bot.shard_stats.rate(shard_id):.1f} olay/sn"
+        for shard_id, latency in bot.latencies
+    ]
+    title = f"Shard'lar ({len(shard_lines)}/{bot.shard_count or 1}"
+    title += f", küme #{CLUSTER_ID})" if CLUSTER_ID is not None else ")"
+    embed.add_field(name=title, value="\n".join(shard_lines)[:1024] or "-", inline=False)
+    cache = bot.content_cache.stats()
+    embed.add_field(
+        name="Mesaj önbelleği",
+        value=f"{cache['entries']} mesaj, {cache['bytes'] / 1024 / 1024:.1f} MB "
+              f"(~{cache['bytes_per_message']:.0f} B/mesaj), isabet %{cache['hit_rate'] * 100:.0f}",
+        inline=False
+    )
     embed.timestamp = datetime.now(timezone.utc)
     await interaction.response.send_message(embed=embed)
 
@@ -222,10 +427,16 @@ async def slash_info(interaction: discord.Interaction):
 @commands.has_permissions(administrator=True)
 async def restart(ctx):
     await ctx.send("Bot yeniden başlatılıyor...")
+    if CLUSTER_ID is not None:
+        # Başlatıcı bu çıkış kodunu görünce tüm işlemleri sırayla yeniden başlatır
+        bot.exit_code = RESTART_EXIT_CODE
+        await bot.close()
+        return
     await bot.close()
     os.execv(sys.executable, ['python'] + sys.argv)
-    class Moderation(commands.Cog):
-          def __init__(self, bot, db_manager: DatabaseManager):
+
+class Moderation(commands.Cog):
+    def __init__(self, bot, db_manager: DatabaseManager):
         self.bot = bot
         self.db = db_manager
 
@@ -244,15 +455,82 @@ async def restart(ctx):
     @commands.has_permissions(administrator=True)
     async def forceban(self, ctx, user_id: int, *, reason=None):
         try:
-            user = await self.bot.fetch_user(user_id)
-            await ctx.guild.ban(user, reason=reason)
-            await self.db.add_forceban(user.id, ctx.guild.id, ctx.author.id, reason or "Yönetici tarafından")
-            await ctx.send(f"{user} sunucudan force banlandı!")
-            await self.log_mod_action(ctx.guild.id, ctx.author.id, user.id, "FORCEBAN", reason, None)
+            # fetch_user gerekmez: ban uç noktası yalnızca ID ister
+            await ctx.guild.ban(discord.Object(id=user_id), reason=reason)
+            await self.db.add_forceban(user_id, ctx.guild.id, ctx.author.id, reason or "Yönetici tarafından")
+            await ctx.send(f"<@{user_id}> ({user_id}) sunucudan force banlandı!")
+            await self.log_mod_action(ctx.guild.id, ctx.author.id, user_id, "FORCEBAN", reason, None)
         except Exception as e:
             await ctx.send("Forceban başarısız!")
             logger.error("Forceban hatası", exc_info=e)
 
+    @commands.command()
+    @commands.has_permissions(administrator=True)
+    async def massban(self, ctx, *, hedefler: str = None):
+        await self.mass_action(ctx, hedefler, "MASSBAN")
+
+    @commands.command()
+    @commands.has_permissions(administrator=True)
+    async def masskick(self, ctx, *, hedefler: str = None):
+        await self.mass_action(ctx, hedefler, "MASSKICK")
+
+    async def mass_action(self, ctx, text, action):
+        try:
+            ids, window, delete_seconds, reason = parse_targets(text)
+            ids += await read_attachment_ids(ctx.message.attachments)
+        except ValueError as e:
+            return await ctx.send(str(e))
+        if delete_seconds and action != "MASSBAN":
+            return await ctx.send("sil: seçeneği yalnızca massban için geçerli.")
+        if window is not None:
+            ids += joined_within(ctx.guild, window)
+        targets, skipped = filter_targets(ctx, ids)
+        if not targets:
+            return await ctx.send("Geçerli hedef bulunamadı. ID listesi, dosya veya son:10m gibi bir süre ver.")
+        if len(targets) > MAX_TARGETS:
+            return await ctx.send(f"Tek seferde en fazla {MAX_TARGETS} kullanıcı işlenebilir ({len(targets)} verildi).")
+
+        verb = "banlanacak" if action == "MASSBAN" else "atılacak"
+        if delete_seconds:
+            verb += f", son {delete_seconds} saniyedeki mesajları silinecek"
+        view = ConfirmView(ctx.author.id)
+        prompt = await ctx.send(f"{len(targets)} kullanıcı {verb} ({skipped} atlandı). Onaylıyor musun?", view=view)
+        if await view.wait():
+            return await prompt.edit(content="Onay süresi doldu.", view=None)
+        if not view.confirmed:
+            return
+
+        reason = reason or "Toplu işlem"
+        audit_reason = f"{ctx.author}: {reason}"[:512]
+        start = time.perf_counter()
+        try:
+            if action == "MASSBAN":
+                done, failed = await mass_ban(ctx.guild, targets, audit_reason, delete_seconds)
+            else:
+                done, failed = await mass_kick(ctx.guild, targets, audit_reason)
+        except Exception as e:
+            await ctx.send("Toplu işlem başarısız!")
+            return logger.error(f"{action} hatası", exc_info=e)
+        elapsed = time.perf_counter() - start
+        if done:
+            await self.db.record_mass_action(
+                ctx.guild.id, ctx.author.id, action, done, reason, ctx.message.jump_url, forceban=action == "MASSBAN"
+            )
+
+        embed = discord.Embed(title=f"Moderasyon | {action}", color=0xff0000, timestamp=datetime.now(timezone.utc))
+        embed.add_field(name="Yetkili", value=ctx.author.mention, inline=True)
+        embed.add_field(name="Başarılı", value=str(len(done)), inline=True)
+        embed.add_field(name="Başarısız", value=str(len(failed)), inline=True)
+        embed.add_field(name="Atlanan", value=str(skipped), inline=True)
+        embed.add_field(name="Süre", value=f"{elapsed:.1f} sn", inline=True)
+        embed.add_field(name="Sebep", value=reason[:1024], inline=False)
+        if failed:
+            embed.add_field(name="Başarısız ID'ler", value=" ".join(map(str, failed))[:1024], inline=False)
+        embed.add_field(name="Mesaj", value=f"[Jump]({ctx.message.jump_url})", inline=False)
+        await ctx.send(embed=embed)
+        if self.bot.log_channels.wants_action(ctx.guild.id, action):
+            self.bot.log_dispatcher.send(ctx.guild, embed, priority=PRIORITY_HIGH)
+
     @commands.command()
     @commands.has_permissions(administrator=True)
     async def unban(self, ctx, user_id: int):
@@ -279,22 +557,18 @@ async def restart(ctx):
 
     @commands.command()
     @commands.has_permissions(administrator=True)
-    async def mute(self, ctx, member: discord.Member, *, reason=None):
-        role = discord.utils.get(ctx.guild.roles, name="Muted")
-        if not role:
-            role = await ctx.guild.create_role(name="Muted")
-            for ch in ctx.guild.channels:
-                await ch.set_permissions(role, send_messages=False)
+    async def mute(self, ctx, member: discord.Member, duration: Optional[Duration] = None, *, reason=None):
+        role = await self.bot.mute_roles.get_or_create(ctx.guild)
         try:
             await member.add_roles(role)
-            now = datetime.now(timezone.utc).isoformat()
-            async with aiosqlite.connect(self.db.db_path) as db:
-                await db.execute(
-                    "INSERT OR REPLACE INTO mutes (user_id, guild_id, muted_by, mute_reason, mute_date) VALUES (?, ?, ?, ?, ?)",
-                    (member.id, ctx.guild.id, ctx.author.id, reason, now)
-                )
-                await db.commit()
-            await ctx.send(f"{member} susturuldu!")
+            unmute_date = datetime.now(timezone.utc) + duration if duration else None
+            await self.db.add_mute(member.id, ctx.guild.id, ctx.author.id, reason, unmute_date)
+            if unmute_date:
+                self.bot.mute_scheduler.schedule(ctx.guild.id, member.id, unmute_date)
+                await ctx.send(f"{member} {discord.utils.format_dt(unmute_date, 'R')} kadar susturuldu!")
+            else:
+                self.bot.mute_scheduler.cancel(ctx.guild.id, member.id)
+                await ctx.send(f"{member} susturuldu!")
             await self.log_mod_action(ctx.guild.id, ctx.author.id, member.id, "MUTE", reason, ctx.message.jump_url)
         except Exception as e:
             await ctx.send("Mute başarısız!")
@@ -303,16 +577,11 @@ async def restart(ctx):
     @commands.command()
     @commands.has_permissions(administrator=True)
     async def unmute(self, ctx, member: discord.Member):
-        role = discord.utils.get(ctx.guild.roles, name="Muted")
+        role = await self.bot.mute_roles.get(ctx.guild)
         try:
             await member.remove_roles(role)
-            now = datetime.now(timezone.utc).isoformat()
-            async with aiosqlite.connect(self.db.db_path) as db:
-                await db.execute(
-                    "UPDATE mutes SET unmute_date=? WHERE user_id=? AND guild_id=?",
-                    (now, member.id, ctx.guild.id)
-                )
-                await db.commit()
+            await self.db.set_unmuted(member.id, ctx.guild.id)
+            self.bot.mute_scheduler.cancel(ctx.guild.id, member.id)
             await ctx.send(f"{member} artık konuşabilir!")
             await self.log_mod_action(ctx.guild.id, ctx.author.id, member.id, "UNMUTE", None, ctx.message.jump_url)
         except Exception as e:
@@ -321,11 +590,13 @@ async def restart(ctx):
 
     @commands.command()
     @commands.has_permissions(administrator=True)
-    async def nuke(self, ctx):
+    async def nuke(self, ctx, *, filtre: str = None):
+        try:
+            check = PurgeFilter.parse(filtre)
+        except ValueError as e:
+            return await ctx.send(str(e), delete_after=5)
         try:
-            await ctx.channel.purge()
-            await ctx.send("Chat temizlendi!", delete_after=5)
-            await self.log_mod_action(ctx.guild.id, ctx.author.id, ctx.author.id, "NUKE", None, None)
+            await run_purge(self.bot, ctx, None, check, "NUKE")
         except Exception as e:
             await ctx.send("Nuke başarısız!")
             logger.error("Nuke hatası", exc_info=e)
@@ -344,36 +615,23 @@ async def restart(ctx):
     @commands.command()
     @commands.has_permissions(administrator=True)
     async def log(self, ctx):
-        channel = discord.utils.get(ctx.guild.text_channels, name="denetim-log")
-        if not channel:
-            overwrites = {ctx.guild.default_role: discord.PermissionOverwrite(send_messages=True)}
-            channel = await ctx.guild.create_text_channel("denetim-log", overwrites=overwrites)
+        channel = await self.bot.log_channels.get_or_create(ctx.guild)
         await ctx.send(f"Denetim kanalı hazır: {channel.mention}")
 
     async def log_mod_action(self, guild_id, user_id, target_id, action, reason, message_link):
-        timestamp = datetime.now(timezone.utc).isoformat()
-        async with aiosqlite.connect(self.db.db_path) as db:
-            await db.execute(
-                "INSERT INTO mod_logs (guild_id, user_id, target_id, action, reason, timestamp, message_link) VALUES (?, ?, ?, ?, ?, ?, ?)",
-                (guild_id, user_id, target_id, action, reason, timestamp, message_link)
-            )
-            await db.commit()
+        await self.db.add_mod_log(guild_id, user_id, target_id, action, reason, message_link)
         guild = self.bot.get_guild(guild_id)
-        if guild:
-            log_channel = discord.utils.get(guild.text_channels, name="denetim-log")
-            if log_channel:
-                embed = discord.Embed(title=f"Moderasyon | {action}", color=0xff0000, timestamp=datetime.now(timezone.utc))
-                embed.add_field(name="Yetkili", value=f"<@{user_id}>", inline=True)
-                embed.add_field(name="Hedef", value=f"<@{target_id}>", inline=True)
-                if reason:
-                    embed.add_field(name="Sebep", value=reason, inline=False)
-                if message_link:
-                    embed.add_field(name="Mesaj", value=f"[Jump]({message_link})", inline=False)
-                await log_channel.send(embed=embed)
-
-async def setup(bot):
-    await bot.add_cog(Moderation(bot, db_manager))
-    @tree.command(name="ban", description="Kullanıcıyı sunucudan yasaklar (Yönetici)")
+        if guild and self.bot.log_channels.wants_action(guild_id, action):
+            embed = discord.Embed(title=f"Moderasyon | {action}", color=0xff0000, timestamp=datetime.now(timezone.utc))
+            embed.add_field(name="Yetkili", value=f"<@{user_id}>", inline=True)
+            embed.add_field(name="Hedef", value=f"<@{target_id}>", inline=True)
+            if reason:
+                embed.add_field(name="Sebep", value=reason, inline=False)
+            if message_link:
+                embed.add_field(name="Mesaj", value=f"[Jump]({message_link})", inline=False)
+            self.bot.log_dispatcher.send(guild, embed, priority=PRIORITY_HIGH)
+
+@tree.command(name="ban", description="Kullanıcıyı sunucudan yasaklar (Yönetici)")
 @app_commands.checks.has_permissions(administrator=True)
 @app_commands.checks.cooldown(1, 10.0)
 async def slash_ban(interaction: discord.Interaction, member: discord.Member, reason: str = None):
@@ -385,10 +643,8 @@ async def slash_ban(interaction: discord.Interaction, member: discord.Member, re
         embed.add_field(name="Yetkili", value=f"{interaction.user}", inline=True)
         if reason: embed.add_field(name="Sebep", value=reason, inline=False)
         await interaction.response.send_message(embed=embed)
-        guild = interaction.guild
-        log_channel = discord.utils.get(guild.text_channels, name="denetim-log")
-        if log_channel:
-            await log_channel.send(embed=embed)
+        if bot.log_channels.wants_action(interaction.guild.id, "BAN"):
+            bot.log_dispatcher.send(interaction.guild, embed, priority=PRIORITY_HIGH)
     except Exception as e:
         await interaction.response.send_message(f"Hata: {str(e)}")
         logger.error("Slash ban hatası", exc_info=e)
@@ -403,38 +659,36 @@ async def slash_kick(interaction: discord.Interaction, member: discord.Member, r
         embed.add_field(name="Yetkili", value=f"{interaction.user}", inline=True)
         if reason: embed.add_field(name="Sebep", value=reason, inline=False)
         await interaction.response.send_message(embed=embed)
-        log_channel = discord.utils.get(interaction.guild.text_channels, name="denetim-log")
-        if log_channel:
-            await log_channel.send(embed=embed)
+        if bot.log_channels.wants_action(interaction.guild.id, "KICK"):
+            bot.log_dispatcher.send(interaction.guild, embed, priority=PRIORITY_HIGH)
     except Exception as e:
         await interaction.response.send_message(f"Hata: {str(e)}")
         logger.error("Slash kick hatası", exc_info=e)
 
 @tree.command(name="mute", description="Kullanıcıyı susturur (Yönetici)")
 @app_commands.checks.has_permissions(administrator=True)
-async def slash_mute(interaction: discord.Interaction, member: discord.Member, reason: str = None):
-    role = discord.utils.get(interaction.guild.roles, name="Muted")
-    if not role:
-        role = await interaction.guild.create_role(name="Muted")
-        for ch in interaction.guild.channels:
-            await ch.set_permissions(role, send_messages=False)
+@app_commands.describe(sure="Süre (örn. 10m, 2h, 1d); boş bırakılırsa süresiz")
+async def slash_mute(interaction: discord.Interaction, member: discord.Member, sure: str = None, reason: str = None):
+    duration = parse_duration(sure) if sure else None
+    if sure and duration is None:
+        return await interaction.response.send_message("Geçersiz süre! Örnek: 10m, 2h, 1d", ephemeral=True)
+    role = await bot.mute_roles.get_or_create(interaction.guild)
     try:
         await member.add_roles(role)
-        now = datetime.now(timezone.utc).isoformat()
-        async with aiosqlite.connect(db_manager.db_path) as db:
-            await db.execute(
-                "INSERT OR REPLACE INTO mutes (user_id, guild_id, muted_by, mute_reason, mute_date) VALUES (?, ?, ?, ?, ?)",
-                (member.id, interaction.guild.id, interaction.user.id, reason, now)
-            )
-            await db.commit()
+        unmute_date = datetime.now(timezone.utc) + duration if duration else None
+        await db_manager.add_mute(member.id, interaction.guild.id, interaction.user.id, reason, unmute_date)
+        if unmute_date:
+            bot.mute_scheduler.schedule(interaction.guild.id, member.id, unmute_date)
+        else:
+            bot.mute_scheduler.cancel(interaction.guild.id, member.id)
         embed = discord.Embed(title="Mute", color=0x5555ff, timestamp=datetime.now(timezone.utc))
         embed.add_field(name="Hedef", value=f"{member}", inline=True)
         embed.add_field(name="Yetkili", value=f"{interaction.user}", inline=True)
+        if unmute_date: embed.add_field(name="Bitiş", value=discord.utils.format_dt(unmute_date, 'R'), inline=True)
         if reason: embed.add_field(name="Sebep", value=reason, inline=False)
         await interaction.response.send_message(embed=embed)
-        log_channel = discord.utils.get(interaction.guild.text_channels, name="denetim-log")
-        if log_channel:
-            await log_channel.send(embed=embed)
+        if bot.log_channels.wants_action(interaction.guild.id, "MUTE"):
+            bot.log_dispatcher.send(interaction.guild, embed, priority=PRIORITY_HIGH)
     except Exception as e:
         await interaction.response.send_message(f"Hata: {str(e)}")
         logger.error("Slash mute hatası", exc_info=e)
@@ -442,23 +696,17 @@ async def slash_mute(interaction: discord.Interaction, member: discord.Member, r
 @tree.command(name="unmute", description="Kullanıcının susturmasını kaldırır (Yönetici)")
 @app_commands.checks.has_permissions(administrator=True)
 async def slash_unmute(interaction: discord.Interaction, member: discord.Member):
-    role = discord.utils.get(interaction.guild.roles, name="Muted")
+    role = await bot.mute_roles.get(interaction.guild)
     try:
         await member.remove_roles(role)
-        now = datetime.now(timezone.utc).isoformat()
-        async with aiosqlite.connect(db_manager.db_path) as db:
-            await db.execute(
-                "UPDATE mutes SET unmute_date=? WHERE user_id=? AND guild_id=?",
-                (now, member.id, interaction.guild.id)
-            )
-            await db.commit()
+        await db_manager.set_unmuted(member.id, interaction.guild.id)
+        bot.mute_scheduler.cancel(interaction.guild.id, member.id)
         embed = discord.Embed(title="Unmute", color=0x00ff00, timestamp=datetime.now(timezone.utc))
         embed.add_field(name="Hedef", value=f"{member}", inline=True)
         embed.add_field(name="Yetkili", value=f"{interaction.user}", inline=True)
         await interaction.response.send_message(embed=embed)
-        log_channel = discord.utils.get(interaction.guild.text_channels, name="denetim-log")
-        if log_channel:
-            await log_channel.send(embed=embed)
+        if bot.log_channels.wants_action(interaction.guild.id, "UNMUTE"):
+            bot.log_dispatcher.send(interaction.guild, embed, priority=PRIORITY_HIGH)
     except Exception as e:
         await interaction.response.send_message(f"Hata: {str(e)}")
         logger.error("Slash unmute hatası", exc_info=e)
@@ -473,16 +721,85 @@ async def slash_giverol(interaction: discord.Interaction, member: discord.Member
         embed.add_field(name="Yetkili", value=f"{interaction.user}", inline=True)
         embed.add_field(name="Rol", value=f"{role.name}", inline=False)
         await interaction.response.send_message(embed=embed)
-        log_channel = discord.utils.get(interaction.guild.text_channels, name="denetim-log")
-        if log_channel:
-            await log_channel.send(embed=embed)
+        bot.log_dispatcher.send(interaction.guild, embed, priority=PRIORITY_HIGH)
     except Exception as e:
         await interaction.response.send_message(f"Hata: {str(e)}")
         logger.error("Slash giverol hatası", exc_info=e)
 
+@tree.command(name="case", description="Moderasyon vakasını gösterir (Yönetici)")
+@app_commands.checks.has_permissions(administrator=True)
+async def slash_case(interaction: discord.Interaction, case_id: int):
+    await db_manager.flush_mod_logs()
+    row = await db_manager.get_case(interaction.guild.id, case_id)
+    if row is None:
+        return await interaction.response.send_message(f"#{case_id} numaralı vaka bulunamadı.", ephemeral=True)
+    await interaction.response.send_message(embed=case_embed(row))
+
+@tree.command(name="history", description="Kullanıcının moderasyon geçmişini gösterir (Yönetici)")
+@app_commands.checks.has_permissions(administrator=True)
+@app_commands.describe(yetkili="Kullanıcının hedef olduğu değil, yetkili olarak yaptığı işlemleri listele")
+async def slash_history(interaction: discord.Interaction, user: discord.User, yetkili: bool = False):
+    await db_manager.flush_mod_logs()
+    view = HistoryView(db_manager, interaction.guild.id, user, interaction.user.id, by_moderator=yetkili)
+    embed = await view.render()
+    if embed is None:
+        return await interaction.response.send_message("Kayıt bulunamadı.", ephemeral=True)
+    await interaction.response.send_message(embed=embed, view=view)
+    view.message = await interaction.original_response()
+
+@tree.command(name="export", description="Sunucunun moderasyon kayıtlarını sıkıştırılmış dosyalar olarak verir (Yönetici)")
+@app_commands.checks.has_permissions(administrator=True)
+@app_commands.checks.cooldown(1, 300.0, key=lambda i: i.guild_id)
+@app_commands.describe(bicim="Dosya biçimi (gzip ile sıkıştırılır)")
+async def slash_export(interaction: discord.Interaction, bicim: Literal["jsonl", "csv"] = "jsonl"):
+    await interaction.response.defer(ephemeral=True, thinking=True)
+    # Parça sınırı: sunucunun ek boyutu sınırı, mesaj gövdesi için pay bırakılarak
+    export = GuildExport(db_manager, interaction.guild.id, bicim, limit=interaction.guild.filesize_limit - 64 * 1024)
+    files = 0
+    try:
+        async for filename, data in export.parts():
+            await interaction.followup.send(file=discord.File(io.BytesIO(data), filename=filename), ephemeral=True)
+            files += 1
+    except Exception as e:
+        await interaction.followup.send(f"Dışa aktarma başarısız: {str(e)}", ephemeral=True)
+        return logger.error("Dışa aktarma hatası", exc_info=e)
+    summary = ", ".join(f"{table}: {count}" for table, count in export.counts.items())
+    await interaction.followup.send(f"Dışa aktarma tamamlandı ({files} dosya). {summary}", ephemeral=True)
+    logger.info(f"Dışa aktarma: {interaction.guild.name} ({bicim}, {summary}) - {interaction.user}")
+
+@tree.command(name="logconfig", description="Denetim kanalına hangi olayların loglanacağını ayarlar (Yönetici)")
+@app_commands.checks.has_permissions(administrator=True)
+@app_commands.describe(olay="Olay türü (boş: mevcut ayarları göster)", durum="Açık/kapalı (boş: tersine çevir)")
+async def slash_logconfig(
+    interaction: discord.Interaction,
+    olay: Literal[
+        "tumu", "message_delete", "message_edit", "member_join", "member_remove", "ban", "unban",
+        "kick", "mute", "unmute", "role_change"
+    ] = None,
+    durum: bool = None
+):
+    await interaction.response.defer(ephemeral=True)
+    resolver = bot.log_channels
+    mask = resolver.event_mask(interaction.guild.id)
+    if olay is not None:
+        if olay == "tumu":
+            changes = dict.fromkeys(CONFIGURABLE_EVENTS, True if durum is None else durum)
+        else:
+            changes = {olay: not (mask & EVENT_BITS[olay]) if durum is None else durum}
+        try:
+            mask = await resolver.set_events(interaction.guild, changes)
+        except Exception as e:
+            await interaction.followup.send(f"Hata: {str(e)}", ephemeral=True)
+            return logger.error("Log ayarı kaydedilemedi", exc_info=e)
+    embed = discord.Embed(title="Log Ayarları", color=0x00ffff)
+    embed.description = "\n".join(
+        f"{'✅' if mask & EVENT_BITS[name] else '❌'} {name}" for name in CONFIGURABLE_EVENTS
+    )
+    await interaction.followup.send(embed=embed, ephemeral=True)
+
 @bot.check
 async def forceban_check(ctx):
-    if await db_manager.is_forcebanned(ctx.author.id, ctx.guild.id):
+    if ctx.guild and db_manager.is_forcebanned(ctx.author.id, ctx.guild.id):
         await ctx.send("Sen bu sunucuda forcebanlısın!")
         return False
     return True
@@ -491,7 +808,7 @@ async def forceban_check(ctx):
 async def on_message(message):
     if message.author.bot:
         return
-    if await db_manager.is_forcebanned(message.author.id, message.guild.id):
+    if message.guild and db_manager.is_forcebanned(message.author.id, message.guild.id):
         try:
             await message.delete()
         except:
@@ -499,6 +816,14 @@ async def on_message(message):
         return
     await bot.process_commands(message)
 
-bot.loop.create_task(setup(bot))
-bot.run(TOKEN)
+if __name__ == "__main__":
+    # Cog'lar `from main import db_manager` kullanır; betik olarak çalışınca
+    # main.py ikinci kez içe aktarılıp ayrı bir bot/veritabanı oluşturmasın
+    sys.modules.setdefault("main", sys.modules[__name__])
+    # Başlatıcının durdurma sinyali de Ctrl+C gibi düzgün kapanış yapsın
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    if hasattr(signal, "SIGBREAK"):
+        signal.signal(signal.SIGBREAK, signal.default_int_handler)
+    bot.run(TOKEN, log_handler=None)
+    sys.exit(bot.exit_code)
 
@@ -0,0 +1,130 @@
+import asyncio
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+
+import discord
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+# main.py içe aktarılırken data/ ve logs/ çalışma dizininde oluşturulur
+os.chdir(tempfile.mkdtemp(prefix="modbot-tests-"))
+
+import main  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def runner():
+    # Bot, veritabanı ve cog görevleri tek bir olay döngüsüne bağlıdır
+    with asyncio.Runner() as runner:
+        yield runner
+
+
+@pytest.fixture(scope="session")
+def bot(runner):
+    runner.run(main.db_manager.initialize())
+    runner.run(main.bot.load_cogs())
+    yield main.bot
+    for name in list(main.bot.extensions):
+        runner.run(main.bot.unload_extension(name))
+    runner.run(main.db_manager.close())
+
+
+# Testlerin ortak sahte Discord nesneleri; yalnızca testlerin dokunduğu alanlar taşınır
+
+class FakeMember:
+    def __init__(self, member_id, roles=()):
+        self.id = member_id
+        self.roles = list(roles)
+        self.timeouts = []
+        self.kicked = False
+
+    def __str__(self):
+        return f"üye-{self.id}"
+
+    async def add_roles(self, *roles, reason=None):
+        self.roles.extend(roles)
+
+    async def remove_roles(self, *roles, reason=None):
+        for role in roles:
+            self.roles.remove(role)
+
+    async def timeout(self, duration, reason=None):
+        self.timeouts.append(duration)
+
+    async def kick(self, reason=None):
+        self.kicked = True
+
+
+class FakeChannel:
+    """@everyone için tek bir izin üzerine yazması tutan metin kanalı"""
+
+    def __init__(self, channel_id):
+        self.id = channel_id
+        self.overwrite = discord.PermissionOverwrite()
+
+    def overwrites_for(self, role):
+        return discord.PermissionOverwrite.from_pair(*self.overwrite.pair())
+
+    async def set_permissions(self, role, overwrite=None, reason=None):
+        self.overwrite = overwrite or discord.PermissionOverwrite()
+
+
+class FakeGuild:
+    def __init__(self, guild_id, members=(), shard_id=0, channels=0, audit_entry_ids=()):
+        self.id = guild_id
+        self.shard_id = shard_id
+        self.default_role = object()
+        self._members = {member.id: member for member in members}
+        self.text_channels = [FakeChannel(guild_id + i) for i in range(1, channels + 1)]
+        self.audit_entries = [
+            SimpleNamespace(id=entry_id, guild=self, action=discord.AuditLogAction.message_delete, user_id=5)
+            for entry_id in audit_entry_ids
+        ]
+        self.audit_requests = 0
+
+    def get_member(self, member_id):
+        return self._members.get(member_id)
+
+    def get_channel(self, channel_id):
+        return next((channel for channel in self.text_channels if channel.id == channel_id), None)
+
+    async def audit_logs(self, limit=100, after=None):
+        self.audit_requests += 1
+        for entry in self.audit_entries:
+            if entry.id > after.id:
+                yield entry
+
+
+class FakeContext:
+    def __init__(self, guild_id):
+        self.guild = FakeGuild(guild_id)
+        self.author = SimpleNamespace(id=42, guild_permissions=SimpleNamespace(administrator=True))
+        self.message = SimpleNamespace(jump_url="https://discord.com/channels/1/2/3")
+        self.sent = []
+
+    async def send(self, content=None, **kwargs):
+        self.sent.append(content if content is not None else kwargs.get("embed"))
+
+
+def fake_bot(guilds=(), mute_role=None, shard_count=None, shard_ids=None):
+    """Cog'ları ve zamanlayıcıları gerçek bot olmadan çalıştırmak için en küçük bot yüzeyi"""
+    by_id = {guild.id: guild for guild in guilds}
+    sent = []
+
+    async def get_role(guild):
+        return mute_role
+
+    async def wait_until_ready():
+        pass
+
+    return SimpleNamespace(
+        user=SimpleNamespace(id=1), shard_count=shard_count, shard_ids=shard_ids,
+        get_guild=by_id.get, wait_until_ready=wait_until_ready,
+        mute_roles=SimpleNamespace(get=get_role),
+        log_channels=SimpleNamespace(wants_action=lambda guild_id, action: True),
+        log_dispatcher=SimpleNamespace(send=lambda guild, embed, **kwargs: sent.append(embed)),
+        sent=sent,
+    )
@@ -0,0 +1,53 @@
+import pytest
+
+import main
+from conftest import FakeContext
+
+
+def test_profanity_list_changes_only_after_db_write(bot, runner, monkeypatch):
+    cog = bot.get_cog("Automod")
+    add, remove = bot.get_command("kufurekle"), bot.get_command("kufursil")
+    ctx = FakeContext(guild_id=8001)
+
+    async def failing_write(*args):
+        raise RuntimeError("veritabanı kilitli")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(main.db_manager, "add_profanity_words", failing_write)
+        with pytest.raises(RuntimeError):
+            runner.run(add(ctx, word="yenikelime"))
+    # Başarısız yazma varsayılan listeyi ve sunucu eşleştiricisini değiştirmez
+    matcher = runner.run(cog.get_matcher(ctx.guild.id))
+    assert matcher is cog.default_matcher and "yenikelime" not in matcher
+
+    runner.run(add(ctx, word="yenikelime"))
+    matcher = runner.run(cog.get_matcher(ctx.guild.id))
+    assert "yenikelime" in matcher and matcher is not cog.default_matcher
+    assert "yenikelime" not in cog.default_matcher
+    assert set(runner.run(main.db_manager.get_profanity_words(ctx.guild.id))) == matcher.terms
+
+    with monkeypatch.context() as patch:
+        patch.setattr(main.db_manager, "remove_profanity_word", failing_write)
+        with pytest.raises(RuntimeError):
+            runner.run(remove(ctx, word="yenikelime"))
+    assert "yenikelime" in matcher
+
+    runner.run(remove(ctx, word="yenikelime"))
+    assert "yenikelime" not in matcher
+    assert set(runner.run(main.db_manager.get_profanity_words(ctx.guild.id))) == matcher.terms
+
+
+def test_emptied_list_stays_empty_after_restart(bot, runner):
+    cog = bot.get_cog("Automod")
+    remove = bot.get_command("kufursil")
+    ctx = FakeContext(guild_id=8002)
+    for word in cog.profanity_list:
+        runner.run(remove(ctx, word=word))
+    assert ctx.sent[-1] == "Yasaklı kelime silindi. Listede 0 kelime var."
+
+    # Yeniden başlatma: önbellek boşalır, liste veritabanından okunur
+    cog.matchers.pop(ctx.guild.id)
+    matcher = runner.run(cog.get_matcher(ctx.guild.id))
+    assert matcher is not cog.default_matcher and len(matcher) == 0
+    assert runner.run(main.db_manager.get_profanity_words(ctx.guild.id)) == []
+    assert runner.run(main.db_manager.get_profanity_words(8003)) is None
@@ -0,0 +1,30 @@
+from datetime import timedelta
+
+import pytest
+from discord.ext import commands
+
+from utils.mute_scheduler import Duration, parse_duration
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("10m", timedelta(minutes=10)),
+    ("90sn", timedelta(seconds=90)),
+    ("1h30m", timedelta(hours=1, minutes=30)),
+    ("2g", timedelta(days=2)),
+    ("1sa15dk", timedelta(hours=1, minutes=15)),
+    ("1W", timedelta(weeks=1)),
+    (" 5 dk ", timedelta(minutes=5)),
+])
+def test_parse_duration(text, expected):
+    assert parse_duration(text) == expected
+
+
+@pytest.mark.parametrize("text", ["", "abc", "10", "10x", "0m", "m10", "1h 30m", "5m!"])
+def test_parse_duration_rejects(text):
+    assert parse_duration(text) is None
+
+
+def test_duration_converter(runner):
+    assert runner.run(Duration().convert(None, "2h")) == timedelta(hours=2)
+    with pytest.raises(commands.BadArgument):
+        runner.run(Duration().convert(None, "yarın"))
@@ -0,0 +1,29 @@
+import main
+from utils.export import EXPORT_TABLES
+
+
+def test_export_queries_page_through_guild_index(bot, runner):
+    db = main.db_manager
+    for table, columns in EXPORT_TABLES.items():
+        plan = runner.run(db.fetchall(
+            "EXPLAIN QUERY PLAN " + db.guild_rows_sql(table, columns), (1, 0, 1000)
+        ))
+        details = " | ".join(row[-1] for row in plan)
+        assert "TEMP B-TREE" not in details, (table, details)
+        assert f"idx_{table}_guild" in details, (table, details)
+
+
+def test_iter_guild_rows_returns_only_guild_rows_in_order(bot, runner):
+    db = main.db_manager
+
+    async def fill_and_read():
+        for i in range(25):
+            await db.add_mod_log(500 + i % 2, 1, i, "WARN", None, None)
+        await db.flush_mod_logs()
+        return [rows async for rows in db.iter_guild_rows("mod_logs", ("id", "target_id"), 500, batch_size=4)]
+
+    batches = runner.run(fill_and_read())
+    assert all(len(batch) <= 4 for batch in batches)
+    ids = [row[0] for batch in batches for row in batch]
+    assert ids == sorted(ids)
+    assert [row[1] for batch in batches for row in batch] == list(range(0, 25, 2))
@@ -0,0 +1,16 @@
+import main
+
+
+def test_every_extension_loads(bot):
+    expected = {f"{main.COGS_DIR.name}.{path.stem}" for path in main.COGS_DIR.glob("*.py")}
+    assert set(bot.extensions) == expected
+
+
+def test_moderation_tools_commands_registered(bot):
+    for name in ("warn", "warns", "clearwarns", "purge", "timeout", "lock", "unlock", "slowmode", "nick"):
+        command = bot.get_command(name)
+        assert command is not None, name
+        assert command.cog_name == "ModerationTools"
+    # main.Moderation komutları çift tanımlanmaz
+    for name in ("ban", "unban", "kick", "mute", "unmute"):
+        assert bot.get_command(name).cog_name == "Moderation"
@@ -0,0 +1,32 @@
+from utils.flood import FloodTracker
+
+
+def test_counts_messages_inside_window():
+    tracker = FloodTracker(threshold=3, window=5)
+    assert [tracker.hit(1, 2, 100.0 + i) for i in range(3)] == [1, 2, 3]
+    # 100.0 damgası pencereden çıktı
+    assert tracker.hit(1, 2, 105.5) == 3
+    assert tracker.hit(1, 2, 120.0) == 1
+
+
+def test_window_is_bounded_to_threshold_plus_one():
+    tracker = FloodTracker(threshold=3, window=60)
+    counts = [tracker.hit(1, 2, 100.0 + i * 0.01) for i in range(10)]
+    assert counts[-1] == 4
+    tracker.reset(1, 2)
+    assert tracker.hit(1, 2, 101.0) == 1
+
+
+def test_evicts_least_recently_active_and_sweeps_idle_keys():
+    tracker = FloodTracker(threshold=3, window=5, max_keys=2)
+    tracker.hit(1, 1, 100.0)
+    tracker.hit(1, 2, 100.0)
+    tracker.hit(1, 1, 101.0)  # 1 yeniden etkin, en eski 2
+    tracker.hit(1, 3, 101.0)
+    assert len(tracker) == 2 and tracker.evicted == 1
+    assert tracker.hit(1, 1, 101.5) == 3
+
+    assert tracker.sweep(104.0) == 0
+    assert tracker.sweep(106.2) == 1  # yalnızca 3 sessiz kaldı
+    assert tracker.sweep(107.0) == 1
+    assert len(tracker) == 0
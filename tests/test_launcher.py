@@ -0,0 +1,22 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_launcher_does_not_import_bot(tmp_path):
+    # Başka bir dizinden çalıştırılsa da main içe aktarılmamalı ve logs/ oluşmamalı
+    code = "import sys, launcher; assert 'main' not in sys.modules; print(launcher.BOT_SCRIPT)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=tmp_path, env={"PYTHONPATH": str(ROOT)},
+        capture_output=True, text=True, check=True
+    )
+    assert Path(result.stdout.strip()) == ROOT / "main.py"
+    assert not any(tmp_path.iterdir())
+
+
+def test_split_shards():
+    from launcher import split_shards
+    assert split_shards(10, 3) == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+    assert split_shards(2, 2) == [[0], [1]]
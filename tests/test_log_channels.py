@@ -0,0 +1,26 @@
+import json
+
+import pytest
+
+from utils.log_channels import ALL_EVENTS, EVENT_BITS, LOG_EVENTS, dump_log_events, parse_log_events
+
+
+def test_missing_or_broken_config_enables_everything():
+    assert parse_log_events(None) == ALL_EVENTS
+    assert parse_log_events("") == ALL_EVENTS
+    assert parse_log_events("{bozuk") == ALL_EVENTS
+
+
+def test_disabled_events_clear_their_bits_and_unknown_keys_are_ignored():
+    mask = parse_log_events(json.dumps({"ban": False, "kick": True, "eski_olay": False}))
+    assert mask == ALL_EVENTS & ~EVENT_BITS["ban"]
+
+
+@pytest.mark.parametrize("disabled", [(), ("message_delete",), ("mute", "unmute", "voice_state")])
+def test_dump_round_trips(disabled):
+    mask = ALL_EVENTS
+    for name in disabled:
+        mask &= ~EVENT_BITS[name]
+    raw = dump_log_events(mask)
+    assert list(json.loads(raw)) == list(LOG_EVENTS)
+    assert parse_log_events(raw) == mask
@@ -0,0 +1,30 @@
+import main
+from conftest import FakeGuild
+from utils.log_channels import ALL_EVENTS, EVENT_BITS
+
+
+def test_disabled_moderation_events_are_not_sent(bot, runner, monkeypatch):
+    guild = FakeGuild(9101)
+    sent = []
+    monkeypatch.setattr(bot, "get_guild", {guild.id: guild}.get)
+    monkeypatch.setattr(bot.log_dispatcher, "send", lambda guild, embed, **kwargs: sent.append(embed.title))
+    monkeypatch.setitem(bot.log_channels._event_masks, guild.id, ALL_EVENTS & ~EVENT_BITS["ban"] & ~EVENT_BITS["mute"])
+    moderation, automod = bot.get_cog("Moderation"), bot.get_cog("Automod")
+
+    async def scenario():
+        for action in ("BAN", "FORCEBAN", "KICK", "GIVEROL"):
+            await moderation.log_mod_action(guild.id, 1, 2, action, None, None)
+        await automod.log_action(guild.id, 2, "MUTE", "flood")
+        await main.db_manager.flush_mod_logs()
+        return await main.db_manager.fetchall("SELECT action FROM mod_logs WHERE guild_id = ?", (guild.id,))
+
+    logged = runner.run(scenario())
+    # Kapalı olaylar yalnızca denetim kanalına gönderilmez; vaka kaydı yine yazılır
+    assert sent == ["Moderasyon | KICK", "Moderasyon | GIVEROL"]
+    assert {action for action, in logged} == {"BAN", "FORCEBAN", "KICK", "GIVEROL"}
+
+
+def test_logconfig_offers_only_events_with_listeners():
+    choices = {choice.value for choice in main.tree.get_command("logconfig").get_parameter("olay").choices}
+    assert "voice_state" not in choices
+    assert {"ban", "unban", "kick", "mute", "unmute", "tumu"} <= choices
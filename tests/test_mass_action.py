@@ -0,0 +1,36 @@
+from types import SimpleNamespace
+
+import pytest
+
+from conftest import FakeGuild
+from utils.mass_action import mass_ban, parse_targets
+
+A, B = 111111111111111111, 222222222222222222
+
+
+def test_parse_targets_delete_option():
+    assert parse_targets(f"{A} <@{B}> spam botlar") == ([A, B], None, 0, "spam botlar")
+    ids, window, delete, reason = parse_targets(f"sil:1g {A} son:10m")
+    assert (ids, window.total_seconds(), delete, reason) == ([A], 600, 86400, None)
+    with pytest.raises(ValueError):
+        parse_targets(f"{A} sil:8g")
+    with pytest.raises(ValueError):
+        parse_targets(f"{A} sil:yarın")
+
+
+class BanGuild(FakeGuild):
+    def __init__(self, guild_id):
+        super().__init__(guild_id)
+        self.calls = []
+
+    async def bulk_ban(self, users, *, reason=None, delete_message_seconds=86400):
+        self.calls.append(delete_message_seconds)
+        return SimpleNamespace(banned=list(users), failed=[])
+
+
+def test_mass_ban_deletes_no_messages_by_default(runner):
+    guild = BanGuild(1)
+    banned, failed = runner.run(mass_ban(guild, [A, B], "toplu"))
+    assert (banned, failed) == ([A, B], [])
+    runner.run(mass_ban(guild, [A], "toplu", 3600))
+    assert guild.calls == [0, 3600]
@@ -0,0 +1,40 @@
+import math
+
+from utils.metrics import Gauge, MetricsRegistry, statement_label
+
+
+def test_statement_label():
+    assert statement_label("SELECT 1 FROM forcebans WHERE user_id = ?") == "SELECT forcebans"
+    assert statement_label("insert into mod_logs (guild_id) VALUES (?)") == "INSERT mod_logs"
+    assert statement_label("UPDATE mutes SET active=0") == "UPDATE mutes"
+    assert statement_label("PRAGMA journal_mode=WAL") == "PRAGMA"
+    assert statement_label("") == "?"
+
+
+def test_render_histogram_counter_and_gauges():
+    registry = MetricsRegistry()
+    latency = registry.histogram("t_seconds", "Süre", ("kind",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5.0):
+        latency.observe(("read",), value)
+    errors = registry.counter("t_errors_total", "Hatalar", ("reason",))
+    errors.inc(('a "b"\n',), 2)
+
+    def broken():
+        raise RuntimeError("toplayıcı hatası")
+
+    registry.add_collector(lambda: [Gauge("t_lag", "Gecikme", ("shard",)).add((0,), math.nan).add((1,), 0.25)])
+    registry.add_collector(broken)
+
+    lines = registry.render().splitlines()
+    assert lines[:7] == [
+        "# HELP t_seconds Süre",
+        "# TYPE t_seconds histogram",
+        't_seconds_bucket{kind="read",le="0.1"} 1',
+        't_seconds_bucket{kind="read",le="1"} 2',
+        't_seconds_bucket{kind="read",le="+Inf"} 3',
+        't_seconds_sum{kind="read"} 5.55',
+        't_seconds_count{kind="read"} 3',
+    ]
+    assert 't_errors_total{reason="a \\"b\\"\\n"} 2' in lines
+    assert "# TYPE t_lag gauge" in lines
+    assert 't_lag{shard="0"} NaN' in lines and 't_lag{shard="1"} 0.25' in lines
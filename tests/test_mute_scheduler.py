@@ -0,0 +1,92 @@
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import discord
+
+import main
+from conftest import FakeGuild, FakeMember, fake_bot
+from utils.mute_scheduler import MuteScheduler
+
+# (guild_id >> 22) % 2: OWN_GUILD shard 0'da, OTHER_GUILD shard 1'de
+OWN_GUILD = 10 << 22
+OTHER_GUILD = 11 << 22
+
+
+async def active_mutes(db):
+    return set(await db.fetchall("SELECT guild_id, user_id FROM mutes WHERE active = 1"))
+
+
+def test_worker_only_expires_mutes_of_its_own_shards(bot, runner):
+    db = main.db_manager
+    role = object()
+    member = FakeMember(77, [role])
+    worker = fake_bot([FakeGuild(OWN_GUILD, [member])], role, shard_count=2, shard_ids=[0])
+    overdue = datetime.now(timezone.utc) - timedelta(minutes=5)
+
+    async def scenario():
+        for guild_id in (OWN_GUILD, OTHER_GUILD):
+            await db.add_mute(77, guild_id, 1, "test", overdue)
+        pending = await db.get_pending_unmutes(2, [0])
+        assert {guild_id for guild_id, _, _ in pending} == {OWN_GUILD}
+
+        scheduler = MuteScheduler(worker, db)
+        await scheduler.start()
+        assert len(scheduler) == 1
+        scheduler.stop()
+        # Başka işlemin sunucusu gelse bile (ör. yeniden başlatma sırasında) kaydı kapatılmaz
+        await scheduler._expire_batch([(OWN_GUILD, 77), (OTHER_GUILD, 77)])
+        await db.flush_mod_logs()
+        return await active_mutes(db)
+
+    remaining = runner.run(scenario())
+    assert (OTHER_GUILD, 77) in remaining
+    assert (OWN_GUILD, 77) not in remaining
+    assert role not in member.roles
+
+
+class FlakyMember(FakeMember):
+    """İlk remove_roles çağrısında geçici bir Discord hatası verir"""
+
+    failures = 1
+
+    async def remove_roles(self, *roles, reason=None):
+        if self.failures:
+            self.failures -= 1
+            raise discord.HTTPException(SimpleNamespace(status=503, reason="Service Unavailable"), "geçici hata")
+        await super().remove_roles(*roles, reason=reason)
+
+
+def test_failed_unmute_is_retried_with_backoff(bot, runner):
+    db = main.db_manager
+    role = object()
+    guild_id = 12 << 22  # shard 0
+    member = FlakyMember(78, [role])
+    scheduler = MuteScheduler(fake_bot([FakeGuild(guild_id, [member])], role, shard_count=2, shard_ids=[0]), db)
+    key = (guild_id, 78)
+
+    async def expire_once():
+        await scheduler._expire_batch([key])
+        await db.flush_mod_logs()
+        return await active_mutes(db)
+
+    runner.run(db.add_mute(78, guild_id, 1, "test", datetime.now(timezone.utc) - timedelta(minutes=5)))
+    before = time.time()
+    assert key in runner.run(expire_once())
+    # Kayıt açık kalır ve ~60 sn sonrasına yeniden zamanlanır
+    assert before + 59 <= scheduler._expiry[key] <= time.time() + 61
+    assert scheduler._attempts[key] == 1
+
+    assert scheduler._pop_due(scheduler._expiry[key]) == [key]
+    assert key not in runner.run(expire_once())
+    assert role not in member.roles
+    assert key not in scheduler._attempts
+
+
+def test_retry_backoff_is_capped():
+    scheduler = MuteScheduler(fake_bot(), db_manager=None)
+    key = (1, 2)
+    for attempt in range(8):
+        scheduler._retry([key])
+        delay = scheduler._expiry.pop(key) - time.time()
+        assert abs(delay - min(60 * 2 ** attempt, 3600)) < 1
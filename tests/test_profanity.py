@@ -0,0 +1,55 @@
+from utils.profanity import ProfanityMatcher, normalize
+
+
+def test_turkish_casefolding_and_leetspeak():
+    assert normalize("İĞNE ışık Şü") == "igne isik su"
+    # Her karakter tek karaktere eşlenir; konumlar korunur
+    assert len(normalize("ÇÖĞÜŞİı")) == len("ÇÖĞÜŞİı")
+    matcher = ProfanityMatcher(["salak"])
+    for text in ("SALAK", "Sâlak", "s4l4k", "$alak", "SaLaK"):
+        assert matcher.search(text) == "salak"
+    # "İ" ve "I" ikisi de "i"ye katlanır
+    assert ProfanityMatcher(["igrenc"]).search("İĞRENÇ") == "igrenc"
+    assert ProfanityMatcher(["igrenc"]).search("IGRENC") == "igrenc"
+
+
+def test_matches_inside_words_and_across_boundaries():
+    matcher = ProfanityMatcher(["aptal"])
+    # Eşleşme alt dizgedir: kelimeye gömülü ya da noktalamayla çevrili terimler de yakalanır
+    assert matcher.search("sen aptalsın") == "aptal"
+    assert matcher.search("xxaptalxx") == "aptal"
+    assert matcher.search("(aptal)") == "aptal"
+    # Arada boşluk ya da başka karakter varsa terim bölünmüş sayılır
+    assert matcher.search("ap tal") is None
+    assert matcher.search("") is None
+
+
+def test_overlapping_terms_are_all_reported():
+    matcher = ProfanityMatcher(["he", "she", "his", "hers"])
+    assert sorted(matcher.find_all("ushers")) == ["he", "hers", "she"]
+    # Sözlük bağlantısı: uzun terimin içindeki kısa terim de bulunur
+    nested = ProfanityMatcher(["abcd", "bc", "c"])
+    assert sorted(nested.find_all("abcd")) == ["abcd", "bc", "c"]
+    assert nested.search("xbcx") == "bc"
+
+
+def test_add_remove_and_rebuild():
+    matcher = ProfanityMatcher(["kotu"])
+    assert matcher.add("Çirkin") and not matcher.add("cirkin")
+    assert "ÇİRKİN" in matcher and len(matcher) == 2
+    # build() çağrılmadan aramak otomatı yeniden kurar
+    assert matcher.search("çok çirkin") == "cirkin"
+
+    matcher.add("kotuluk")
+    matcher.build()
+    assert matcher.find_all("kotuluk") == ["kotu", "kotuluk"]
+    assert matcher.remove("kotu") and not matcher.remove("kotu")
+    matcher.build()
+    # Ortak önek düğümleri kalır ama silinen terim artık raporlanmaz
+    assert matcher.find_all("kotuluk") == ["kotuluk"]
+    assert matcher.search("kotu") is None
+    assert matcher.terms == {"cirkin", "kotuluk"}
+
+    for term in list(matcher.terms):
+        matcher.remove(term)
+    assert matcher.search("kotuluk cirkin") is None and len(matcher) == 0
@@ -0,0 +1,94 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from conftest import FakeContext
+from utils import purge
+from utils.purge import PurgeFilter, PurgeJob, PurgeView
+
+
+def test_purge_command_routes_through_run_purge(bot, runner, monkeypatch):
+    calls = []
+
+    async def fake_run_purge(bot_, ctx, limit, check, action):
+        calls.append((bot_, limit, check, action))
+
+    command = bot.get_command("purge")
+    assert command is not None and command.cog_name == "ModerationTools"
+    # load_extension modülü yeniden oluşturur; yükleneni yamalamak için komutun kendi globals'ı kullanılır
+    monkeypatch.setitem(command.callback.__globals__, "run_purge", fake_run_purge)
+    ctx = FakeContext(guild_id=7101)
+
+    runner.run(command(ctx, 50, filtre='<@123456789012345678> icerir:"reklam" ek'))
+
+    [(bot_, limit, check, action)] = calls
+    assert bot_ is bot and limit == 50 and action == "PURGE"
+    assert isinstance(check, PurgeFilter)
+    assert (check.author_id, check.contains, check.attachments) == (123456789012345678, "reklam", True)
+
+
+def test_help_lists_only_registered_purge_commands(bot):
+    # Help.py "/nuke [filtre] | /purge <sayı> [filtre]" satırını gösterir
+    assert bot.get_command("nuke") is not None
+    assert bot.get_command("purge") is not None
+
+
+class FakeMessage:
+    def __init__(self, message_id, age, deleted):
+        self.id = message_id
+        self.created_at = datetime.now(timezone.utc) - age
+        self.author = SimpleNamespace(id=1, bot=False)
+        self.content = ""
+        self.attachments = []
+        self._deleted = deleted
+
+    async def delete(self):
+        self._deleted.append(("tekil", self.id))
+
+
+class PurgeChannel:
+    def __init__(self, ages):
+        self.id = 9001
+        self.deleted = []
+        self.messages = [FakeMessage(i, age, self.deleted) for i, age in enumerate(ages)]
+
+    async def history(self, limit=None, before=None):
+        for message in self.messages:
+            yield message
+
+    async def delete_messages(self, messages):
+        self.deleted.extend(("toplu", m.id) for m in messages)
+
+
+def test_bulk_cutoff_is_checked_against_current_time(runner, monkeypatch):
+    channel = PurgeChannel([timedelta(days=1), timedelta(days=2), timedelta(days=20)])
+    job = PurgeJob(channel, None, PurgeFilter())
+    runner.run(job.run())
+    assert set(channel.deleted) == {("toplu", 0), ("toplu", 1), ("tekil", 2)}
+
+    # Tarama ile toplu silme arasında sınır kayarsa eskiyen mesaj tekil silinir
+    channel = PurgeChannel([timedelta(days=1), timedelta(days=14) - timedelta(minutes=6)])
+    cutoffs = iter([timedelta(days=20), timedelta(days=20), timedelta(days=14) - timedelta(minutes=10)])
+    monkeypatch.setattr(purge, "bulk_cutoff", lambda: datetime.now(timezone.utc) - next(cutoffs))
+    job = PurgeJob(channel, None, PurgeFilter())
+    runner.run(job.run())
+    assert set(channel.deleted) == {("toplu", 0), ("tekil", 1)}
+
+
+def test_cancel_after_completion_is_a_noop(runner):
+    job = PurgeJob(PurgeChannel([timedelta(hours=1)]), None, PurgeFilter())
+    runner.run(job.run())
+    assert job.finished and not job.cancel() and not job.cancelled
+
+    edits = []
+
+    async def edit_message(**kwargs):
+        edits.append(kwargs)
+
+    async def press():
+        view = PurgeView(job, author_id=1)
+        interaction = SimpleNamespace(response=SimpleNamespace(edit_message=edit_message))
+        await view.cancel.callback(interaction)
+        return view
+
+    view = runner.run(press())
+    assert edits == [{"view": None}] and view.is_finished() and not job.cancelled
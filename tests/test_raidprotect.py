@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta, timezone
+import pytest
+
+import main
+from Cogs.raidprotect import RaidProtect
+from conftest import FakeGuild, fake_bot
+
+
+def test_shard_ready_catches_up_only_that_shards_guilds(runner):
+    own = FakeGuild(1, shard_id=0, audit_entry_ids=[101, 102])
+    other = FakeGuild(2, shard_id=1, audit_entry_ids=[201, 202])
+    cog = RaidProtect(fake_bot([own, other]), db_manager=None)
+    cog.cursors = {own.id: 100, other.id: 200}
+
+    async def scenario():
+        # Başlangıçtaki ilk READY'ler tarama yapmaz
+        await cog.on_shard_ready(0)
+        await cog.on_shard_ready(1)
+        assert own.audit_requests == other.audit_requests == 0
+        # Yalnızca shard 0 yeniden IDENTIFY oldu
+        await cog.on_shard_ready(0)
+
+    runner.run(scenario())
+    assert own.audit_requests == 1 and cog.cursors[own.id] == 102
+    assert other.audit_requests == 0 and cog.cursors[other.id] == 200
+
+
+def test_failed_lockdown_does_not_leave_guild_flagged(bot, runner, monkeypatch):
+    db = main.db_manager
+    guild = FakeGuild(500, channels=2)
+    cog = RaidProtect(fake_bot([guild]), db)
+
+    async def broken_save(*args):
+        raise RuntimeError("disk dolu")
+
+    monkeypatch.setattr(db, "save_lockdown_snapshot", broken_save)
+    with pytest.raises(RuntimeError):
+        runner.run(cog.lockdown(guild, "test", auto=True))
+    assert guild.id not in cog.locked_guilds
+    assert not cog._unlock_tasks
+
+
+def test_stored_lockdown_is_adopted_and_auto_unlocked(bot, runner):
+    db = main.db_manager
+    guild = FakeGuild(600, channels=2)
+    worker = fake_bot([guild])
+
+    async def scenario():
+        first = RaidProtect(worker, db)
+        assert await first.lockdown(guild, "test", auto=True) == (2, 2)
+        assert all(ch.overwrite.send_messages is False for ch in guild.text_channels)
+        # Yeniden başlatma: kilit ve otomatik kaldırma kayıttan geri yüklenir
+        await first.cog_unload()
+        await db.save_lockdown_snapshot(
+            guild.id, await db.get_lockdown_snapshot(guild.id), datetime.now(timezone.utc) - timedelta(seconds=1)
+        )
+        restarted = RaidProtect(worker, db)
+        await restarted.cog_load()
+        restarted.raid_sweeper.cancel()
+        assert guild.id in restarted.locked_guilds
+        # Kayıtlı kilit ikinci kez kilitlenmez ve 0/0 raporlanmaz
+        assert await restarted.lockdown(guild, "tekrar") is None
+        await restarted._unlock_tasks[guild.id]
+        return restarted
+
+    restarted = runner.run(scenario())
+    assert guild.id not in restarted.locked_guilds
+    assert all(ch.overwrite.send_messages is None for ch in guild.text_channels)
+    assert runner.run(db.get_lockdown(guild.id)) is None
@@ -0,0 +1,31 @@
+from types import SimpleNamespace
+
+import pytest
+
+from conftest import FakeContext, FakeMember
+
+
+@pytest.fixture
+def bot_user(bot, monkeypatch):
+    # escalate() yaptırımı botun kendi ID'siyle loglar
+    monkeypatch.setattr(bot._connection, "user", SimpleNamespace(id=1), raising=False)
+
+
+def test_warn_commands_through_loaded_bot(bot, runner, bot_user):
+    ctx, member = FakeContext(guild_id=7001), FakeMember(9001)
+    warn, warns, clearwarns = (bot.get_command(name) for name in ("warn", "warns", "clearwarns"))
+
+    for i in range(3):
+        runner.run(warn(ctx, member, reason=f"sebep {i}"))
+    assert "toplam 3 uyarı" in ctx.sent[-2]
+    assert len(member.timeouts) == 1
+
+    runner.run(warns(ctx, member))
+    embed = ctx.sent[-1]
+    assert embed.title == f"{member} - 3 uyarı"
+    assert [field.value.split(" (")[0] for field in embed.fields] == ["sebep 2", "sebep 1", "sebep 0"]
+
+    runner.run(clearwarns(ctx, member))
+    assert ctx.sent[-1] == "Uyarılar silindi. (3)"
+    runner.run(warns(ctx, member))
+    assert ctx.sent[-1] == "Uyarısı yok."
@@ -0,0 +1,47 @@
+from utils.window_counter import WindowCounter
+
+
+def test_hits_in_one_window_are_counted_exactly():
+    counter = WindowCounter(5, 10)
+    assert [counter.hit(1, 2, "KICK", 100.0 + i * 0.1) for i in range(5)] == [1, 2, 3, 4, 5]
+    assert counter.count(1, 2, "KICK", 100.5) == 5
+    assert counter.count(1, 2, "BAN", 100.5) == 0
+
+
+def test_count_ages_like_hit():
+    counter = WindowCounter(5, 10)
+    for i in range(4):
+        counter.hit(1, 2, "KICK", 100.0 + i)
+    # Sonraki kovanın yarısı geçti: önceki kovanın yarısı pencerede sayılır
+    assert counter.count(1, 2, "KICK", 115.0) == 2
+    assert counter.hit(1, 2, "KICK", 115.0) == 3
+    # İki kova geride kalan işlemler sayılmaz
+    assert counter.count(1, 2, "KICK", 131.0) == 0
+    assert counter.hit(1, 2, "KICK", 131.0) == 1
+
+
+def test_per_guild_window_and_reconfigure_clears_guild():
+    counter = WindowCounter(5, 10)
+    counter.hit(1, 2, "KICK", 100.0)
+    counter.hit(3, 2, "KICK", 100.0)
+    counter.configure(1, 3, 60)
+    assert counter.threshold(1) == 3 and counter.window(1) == 60
+    assert counter.count(1, 2, "KICK", 100.0) == 0
+    assert counter.count(3, 2, "KICK", 100.0) == 1
+    # 60 sn'lik pencerede 50 sn sonraki işlem aynı kovadadır
+    counter.hit(1, 2, "KICK", 120.0)
+    assert counter.hit(1, 2, "KICK", 170.0) == 2
+
+
+def test_keys_are_bounded_and_swept():
+    counter = WindowCounter(5, 10, max_keys=10)
+    for actor_id in range(100):
+        counter.hit(1, actor_id, "KICK", 100.0)
+    assert len(counter) <= 10
+    assert counter.evicted >= 90
+    # En son dokunulan anahtar kuşak döndürmesinden sağ çıkar
+    assert counter.count(1, 99, "KICK", 100.0) == 1
+
+    assert counter.sweep(115.0) == 0
+    removed = counter.sweep(125.0)
+    assert removed > 0 and len(counter) == 0
@@ -0,0 +1,169 @@
+import re
+import time
+from bisect import bisect_left
+from functools import cached_property
+
+# Gecikme histogramı kova sınırları (mikrosaniye)
+LATENCY_BUCKETS_US = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 5000)
+
+URL_REGEX = re.compile(r"https?://\S+")
+
+
+class MessageContext:
+    """Mesaj başına bir kez hesaplanan ortak veriler; her alan ilk ihtiyaçta hesaplanır"""
+
+    def __init__(self, message, matcher=None):
+        self.message = message
+        self.content: str = message.content
+        self.guild_id: int = message.guild.id
+        self.author_id: int = message.author.id
+        self.matcher = matcher
+
+    @cached_property
+    def length(self) -> int:
+        return len(self.content)
+
+    @cached_property
+    def upper_count(self) -> int:
+        return sum(map(str.isupper, self.content))
+
+    @cached_property
+    def url_spans(self) -> list[tuple[int, int]]:
+        return [m.span() for m in URL_REGEX.finditer(self.content)]
+
+
+class RuleStats:
+    __slots__ = ("evaluations", "hits", "total_ns", "buckets")
+
+    def __init__(self):
+        self.evaluations = 0
+        self.hits = 0
+        self.total_ns = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_US) + 1)
+
+    def record(self, elapsed_ns: int, hit: bool):
+        self.evaluations += 1
+        self.total_ns += elapsed_ns
+        self.buckets[bisect_left(LATENCY_BUCKETS_US, elapsed_ns / 1000)] += 1
+        if hit:
+            self.hits += 1
+
+    def percentile_us(self, q: float) -> float:
+        """Histogramdan yaklaşık yüzdelik (kova üst sınırı)"""
+        if not self.evaluations:
+            return 0.0
+        rank = q * self.evaluations
+        seen = 0
+        for i, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                return LATENCY_BUCKETS_US[i] if i < len(LATENCY_BUCKETS_US) else float("inf")
+        return float("inf")
+
+
+class Rule:
+    """Otomatik moderasyon kuralı. `cost` küçük olan önce çalışır."""
+
+    name = ""
+    cost = 0
+    needs: tuple[str, ...] = ()
+    reason = ""
+    notice = ""
+    delete_message = True
+
+    def __init__(self):
+        self.stats = RuleStats()
+
+    def check(self, ctx: MessageContext) -> bool:
+        raise NotImplementedError
+
+
+class FloodRule(Rule):
+    name = "flood"
+    cost = 1
+    reason = "Flood"
+    notice = "flood"
+    delete_message = False
+
+    def __init__(self, tracker):
+        super().__init__()
+        self.tracker = tracker
+
+    def check(self, ctx):
+        if self.tracker.hit(ctx.guild_id, ctx.author_id) > self.tracker.threshold:
+            self.tracker.reset(ctx.guild_id, ctx.author_id)
+            return True
+        return False
+
+
+class LinkRule(Rule):
+    name = "link"
+    cost = 2
+    needs = ("url_spans",)
+    reason = "Link paylaşımı"
+    notice = "link paylaşımı"
+
+    def check(self, ctx):
+        return bool(ctx.url_spans)
+
+
+class CapsRule(Rule):
+    name = "caps"
+    cost = 3
+    needs = ("length", "upper_count")
+    reason = "Caps spam"
+    notice = "caps"
+
+    def __init__(self, threshold: float, min_length: int = 5):
+        super().__init__()
+        self.threshold = threshold
+        self.min_length = min_length
+
+    def check(self, ctx):
+        if ctx.length < self.min_length:
+            return False
+        return ctx.upper_count / ctx.length >= self.threshold
+
+
+class ProfanityRule(Rule):
+    name = "kufur"
+    cost = 4
+    needs = ("matcher",)
+    reason = "Küfür"
+    notice = "küfür"
+
+    def check(self, ctx):
+        return ctx.matcher is not None and ctx.matcher.search(ctx.content) is not None
+
+
+class RuleEngine:
+    def __init__(self, rules):
+        self.rules = sorted(rules, key=lambda rule: rule.cost)
+        self.by_name = {rule.name: rule for rule in self.rules}
+
+    def needs(self, name: str, disabled=frozenset()) -> bool:
+        return any(name in rule.needs for rule in self.rules if rule.name not in disabled)
+
+    def evaluate(self, ctx: MessageContext, disabled=frozenset()) -> Rule | None:
+        """Kuralları ucuzdan pahalıya çalıştırır, ilk tetiklenen kuralda durur"""
+        for rule in self.rules:
+            if rule.name in disabled:
+                continue
+            start = time.perf_counter_ns()
+            hit = rule.check(ctx)
+            rule.stats.record(time.perf_counter_ns() - start, hit)
+            if hit:
+                return rule
+        return None
+
+    def stats(self) -> dict:
+        return {
+            rule.name: {
+                "evaluations": rule.stats.evaluations,
+                "hits": rule.stats.hits,
+                "avg_us": rule.stats.total_ns / rule.stats.evaluations / 1000 if rule.stats.evaluations else 0.0,
+                "p50_us": rule.stats.percentile_us(0.5),
+                "p99_us": rule.stats.percentile_us(0.99),
+            }
+            for rule in self.rules
+        }
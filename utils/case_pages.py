@@ -0,0 +1,102 @@
+from datetime import datetime
+
+import discord
+
+PAGE_SIZE = 10
+
+ACTION_COLORS = {
+    "BAN": 0xff0000,
+    "FORCEBAN": 0xff0000,
+    "KICK": 0xffaa00,
+    "MUTE": 0x5555ff,
+    "UNMUTE": 0x00ff00,
+    "WARN": 0xffaa00,
+}
+
+
+def case_embed(row) -> discord.Embed:
+    case_id, moderator_id, target_id, action, reason, timestamp, message_link = row
+    embed = discord.Embed(
+        title=f"Vaka #{case_id} - {action}",
+        color=ACTION_COLORS.get(action, 0x888888),
+        timestamp=datetime.fromisoformat(timestamp)
+    )
+    embed.add_field(name="Hedef", value=f"<@{target_id}> ({target_id})", inline=True)
+    embed.add_field(name="Yetkili", value=f"<@{moderator_id}>", inline=True)
+    embed.add_field(name="Sebep", value=(reason or "Sebep yok")[:1024], inline=False)
+    if message_link:
+        embed.add_field(name="Mesaj", value=f"[Jump]({message_link})", inline=False)
+    return embed
+
+
+class HistoryView(discord.ui.View):
+    """mod_logs geçmişini keyset imleçleriyle sayfalar.
+
+    Her sayfanın başlangıç imleci (timestamp, id) saklanır; geri gitmek
+    önceki imleci yeniden sorgular, OFFSET kullanılmaz.
+    """
+
+    def __init__(self, db_manager, guild_id: int, member: discord.abc.User, author_id: int,
+                 by_moderator: bool = False, timeout: float = 180):
+        super().__init__(timeout=timeout)
+        self.db = db_manager
+        self.guild_id = guild_id
+        self.member = member
+        self.author_id = author_id
+        self.by_moderator = by_moderator
+        self.message: discord.Message | None = None
+        self._cursors: list[tuple[str, int] | None] = [None]
+        self._page = 0
+
+    async def render(self) -> discord.Embed | None:
+        rows = await self.db.get_history(
+            self.guild_id, self.member.id, self.by_moderator,
+            before=self._cursors[self._page], limit=PAGE_SIZE + 1
+        )
+        if not rows and self._page == 0:
+            return None
+        has_next = len(rows) > PAGE_SIZE
+        rows = rows[:PAGE_SIZE]
+        if has_next and len(self._cursors) == self._page + 1:
+            self._cursors.append((rows[-1][5], rows[-1][0]))
+        self.previous.disabled = self._page == 0
+        self.next.disabled = not has_next
+
+        role = "yetkili olarak" if self.by_moderator else "hedef olarak"
+        embed = discord.Embed(title=f"{self.member} - geçmiş ({role})", color=0xffaa00)
+        for case_id, moderator_id, target_id, action, reason, timestamp, _ in rows:
+            date = discord.utils.format_dt(datetime.fromisoformat(timestamp), "f")
+            other = f"<@{target_id}>" if self.by_moderator else f"<@{moderator_id}>"
+            embed.add_field(
+                name=f"#{case_id} {action} - {date}",
+                value=f"{reason or 'Sebep yok'} ({other})"[:1024],
+                inline=False
+            )
+        embed.set_footer(text=f"Sayfa {self._page + 1}")
+        return embed
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.author_id:
+            await interaction.response.send_message("Bu sayfaları yalnızca komutu kullanan değiştirebilir.", ephemeral=True)
+            return False
+        return True
+
+    async def on_timeout(self):
+        self.previous.disabled = True
+        self.next.disabled = True
+        if self.message is not None:
+            try:
+                await self.message.edit(view=self)
+            except discord.HTTPException:
+                pass
+
+    @discord.ui.button(label="◀ Önceki", style=discord.ButtonStyle.secondary)
+    async def previous(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self._page = max(self._page - 1, 0)
+        await interaction.response.edit_message(embed=await self.render(), view=self)
+
+    @discord.ui.button(label="Sonraki ▶", style=discord.ButtonStyle.secondary)
+    async def next(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if self._page + 1 < len(self._cursors):
+            self._page += 1
+        await interaction.response.edit_message(embed=await self.render(), view=self)
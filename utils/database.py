@@ -0,0 +1,663 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+import aiosqlite
+
+from utils.metrics import DB_HELD_SECONDS, DB_STATEMENT_SECONDS, DB_WAIT_SECONDS, statement_label
+
+logger = logging.getLogger("ModerationBot.database")
+
+
+class DatabaseManager:
+    # Bağlantı başına uygulanan SQLite ayarları (WAL + daha az fsync)
+    PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-16000",
+        "PRAGMA mmap_size=134217728",
+        "PRAGMA busy_timeout=5000",
+    )
+
+    def __init__(self, db_path: str = "data/moderation.db", pool_size: int = 4,
+                 mod_log_queue_size: int = 5000, mod_log_batch_size: int = 200, mod_log_flush_interval: float = 1.0):
+        self.db_path = db_path
+        self.db_dir = Path(db_path).parent
+        self.db_dir.mkdir(parents=True, exist_ok=True)
+        self.pool_size = pool_size
+        self._writer: aiosqlite.Connection | None = None
+        self._write_lock = asyncio.Lock()
+        self._readers: asyncio.Queue | None = None
+        self._reader_conns: list[aiosqlite.Connection] = []
+        # guild_id -> forcebanlı user_id kümesi; mesaj yolunda veritabanına gidilmez
+        self._forcebans: dict[int, set[int]] = {}
+        self.forceban_lookups = 0
+        self.forceban_hits = 0
+        # mod_logs satırları için write-behind kuyruğu
+        self.mod_log_batch_size = mod_log_batch_size
+        self.mod_log_flush_interval = mod_log_flush_interval
+        self._mod_log_queue: asyncio.Queue = asyncio.Queue(maxsize=mod_log_queue_size)
+        self._mod_log_wakeup = asyncio.Event()
+        self._mod_log_task: asyncio.Task | None = None
+        self.mod_log_flushes = 0
+        self.mod_log_rows_written = 0
+        self.mod_log_last_flush_ms = 0.0
+        self.mod_log_max_flush_ms = 0.0
+        logger.info(f"Veritabanı yöneticisi başlatılıyor: {db_path}")
+
+    async def _connect(self) -> aiosqlite.Connection:
+        # cached_statements: aynı SQL metinleri bağlantı üzerinde hazırlanmış olarak tekrar kullanılır
+        conn = await aiosqlite.connect(self.db_path, cached_statements=256)
+        for pragma in self.PRAGMAS:
+            await conn.execute(pragma)
+        return conn
+
+    async def initialize(self):
+        if self._writer is not None:
+            return
+        db = await self._connect()
+        self._writer = db
+        await db.execute('''
+            CREATE TABLE IF NOT EXISTS forcebans (
+                user_id INTEGER NOT NULL,
+                guild_id INTEGER NOT NULL,
+                banned_by INTEGER NOT NULL,
+                ban_reason TEXT,
+                ban_date TEXT NOT NULL,
+                PRIMARY KEY (user_id, guild_id)
+            )
+        ''')
+        await db.execute('''
+            CREATE TABLE IF NOT EXISTS mutes (
+                user_id INTEGER NOT NULL,
+                guild_id INTEGER NOT NULL,
+                muted_by INTEGER NOT NULL,
+                mute_reason TEXT,
+                mute_date TEXT NOT NULL,
+                unmute_date TEXT,
+                active INTEGER NOT NULL DEFAULT 1,
+                PRIMARY KEY (user_id, guild_id)
+            )
+        ''')
+        async with db.execute("PRAGMA table_info(mutes)") as cursor:
+            columns = {row[1] for row in await cursor.fetchall()}
+        if "active" not in columns:
+            # Eski şemada unmute_date yalnızca elle kaldırma zamanıydı
+            await db.execute("ALTER TABLE mutes ADD COLUMN active INTEGER NOT NULL DEFAULT 1")
+            await db.execute("UPDATE mutes SET active = 0 WHERE unmute_date IS NOT NULL")
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_mutes_pending ON mutes (unmute_date) "
+            "WHERE active = 1 AND unmute_date IS NOT NULL"
+        )
+        await db.execute('''
+            CREATE TABLE IF NOT EXISTS log_channels (
+                guild_id INTEGER PRIMARY KEY,
+                channel_id INTEGER NOT NULL,
+                log_events TEXT NOT NULL DEFAULT '{"message_delete":true,"message_edit":true,"member_join":true,"member_remove":true,"ban":true,"unban":true,"kick":true,"mute":true,"unmute":true,"role_change":true,"voice_state":true}'
+            )
+        ''')
+        await db.execute('''
+            CREATE TABLE IF NOT EXISTS mute_roles (
+                guild_id INTEGER PRIMARY KEY,
+                role_id INTEGER NOT NULL
+            )
+        ''')
+        await db.execute('''
+            CREATE TABLE IF NOT EXISTS mod_logs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                target_id INTEGER NOT NULL,
+                action TEXT NOT NULL,
+                reason TEXT,
+                timestamp TEXT NOT NULL,
+                message_link TEXT
+            )
+        ''')
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_mod_logs_target ON mod_logs (guild_id, target_id, timestamp)"
+        )
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_mod_logs_moderator ON mod_logs (guild_id, user_id, timestamp)"
+        )
+        # Dışa aktarma sunucu başına id sırasıyla sayfalar; sıralama için geçici B-tree gerekmez
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_mod_logs_guild ON mod_logs (guild_id, id)")
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_forcebans_guild ON forcebans (guild_id)")
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_mutes_guild ON mutes (guild_id)")
+        await db.execute('''
+            CREATE TABLE IF NOT EXISTS profanity_words (
+                guild_id INTEGER NOT NULL,
+                word TEXT NOT NULL,
+                PRIMARY KEY (guild_id, word)
+            )
+        ''')
+        # Kendi listesi olan sunucular; son kelime silinse de kayıt kalır, boş liste varsayılana dönmez
+        await db.execute('''
+            CREATE TABLE IF NOT EXISTS profanity_lists (
+                guild_id INTEGER PRIMARY KEY
+            )
+        ''')
+        await db.execute("INSERT OR IGNORE INTO profanity_lists (guild_id) SELECT DISTINCT guild_id FROM profanity_words")
+        await db.execute('''
+            CREATE TABLE IF NOT EXISTS automod_disabled_rules (
+                guild_id INTEGER NOT NULL,
+                rule TEXT NOT NULL,
+                PRIMARY KEY (guild_id, rule)
+            )
+        ''')
+        await db.execute('''
+            CREATE TABLE IF NOT EXISTS raid_config (
+                guild_id INTEGER PRIMARY KEY,
+                threshold INTEGER NOT NULL,
+                window_seconds INTEGER NOT NULL
+            )
+        ''')
+        await db.execute('''
+            CREATE TABLE IF NOT EXISTS lockdown_snapshots (
+                guild_id INTEGER NOT NULL,
+                channel_id INTEGER NOT NULL,
+                allow INTEGER NOT NULL,
+                deny INTEGER NOT NULL,
+                PRIMARY KEY (guild_id, channel_id)
+            )
+        ''')
+        # Anlık görüntü kanal listesi boş olabilir; kilidin kendisi ve otomatik kaldırma zamanı ayrı tutulur
+        await db.execute('''
+            CREATE TABLE IF NOT EXISTS lockdowns (
+                guild_id INTEGER PRIMARY KEY,
+                unlock_at TEXT
+            )
+        ''')
+        # Bu tablodan önce alınmış anlık görüntüler elle kaldırılacak kilitler olarak taşınır
+        await db.execute(
+            "INSERT OR IGNORE INTO lockdowns (guild_id, unlock_at) SELECT DISTINCT guild_id, NULL FROM lockdown_snapshots"
+        )
+        await db.execute('''
+            CREATE TABLE IF NOT EXISTS warnings (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                moderator_id INTEGER NOT NULL,
+                reason TEXT,
+                timestamp TEXT NOT NULL
+            )
+        ''')
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_warnings_member ON warnings (guild_id, user_id, timestamp)"
+        )
+        await db.execute('''
+            CREATE TABLE IF NOT EXISTS bot_state (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            )
+        ''')
+        await db.commit()
+        self._forcebans = await self._load_forcebans(db)
+
+        self._readers = asyncio.Queue()
+        for _ in range(self.pool_size):
+            conn = await self._connect()
+            self._reader_conns.append(conn)
+            self._readers.put_nowait(conn)
+        self._mod_log_task = asyncio.create_task(self._mod_log_writer())
+        logger.info(f"Veritabanı tabloları başarıyla oluşturuldu (WAL, {self.pool_size} okuma bağlantısı)")
+        logger.info(f"Forceban indeksi yüklendi: {sum(len(u) for u in self._forcebans.values())} kayıt")
+
+    async def close(self):
+        if self._writer is None:
+            return
+        await self.flush_mod_logs()
+        self._mod_log_task.cancel()
+        self._mod_log_task = None
+        async with self._write_lock:
+            await self._writer.close()
+            self._writer = None
+        for conn in self._reader_conns:
+            await conn.close()
+        self._reader_conns.clear()
+        self._readers = None
+        logger.info("Veritabanı bağlantıları kapatıldı")
+
+    @asynccontextmanager
+    async def reader(self):
+        """Havuzdan bir okuma bağlantısı ödünç al"""
+        start = time.perf_counter()
+        conn = await self._readers.get()
+        acquired = time.perf_counter()
+        DB_WAIT_SECONDS.observe(("read",), acquired - start)
+        try:
+            yield conn
+        finally:
+            self._readers.put_nowait(conn)
+            DB_HELD_SECONDS.observe(("read",), time.perf_counter() - acquired)
+
+    @asynccontextmanager
+    async def transaction(self):
+        """Tek yazma bağlantısı üzerinde kilitli, atomik bir işlem"""
+        start = time.perf_counter()
+        async with self._write_lock:
+            acquired = time.perf_counter()
+            DB_WAIT_SECONDS.observe(("write",), acquired - start)
+            try:
+                # Birden fazla işlem aynı dosyaya yazabilir: yazma kilidini baştan al,
+                # okumadan yazmaya geçişte SQLITE_BUSY alınmasın
+                if not self._writer.in_transaction:
+                    await self._writer.execute("BEGIN IMMEDIATE")
+                yield self._writer
+                await self._writer.commit()
+            except Exception:
+                await self._writer.rollback()
+                raise
+            finally:
+                DB_HELD_SECONDS.observe(("write",), time.perf_counter() - acquired)
+
+    async def execute(self, sql: str, params: tuple = ()) -> int:
+        start = time.perf_counter()
+        try:
+            async with self.transaction() as db:
+                cursor = await db.execute(sql, params)
+                return cursor.rowcount
+        finally:
+            DB_STATEMENT_SECONDS.observe((statement_label(sql),), time.perf_counter() - start)
+
+    async def fetchone(self, sql: str, params: tuple = ()):
+        start = time.perf_counter()
+        try:
+            async with self.reader() as db:
+                async with db.execute(sql, params) as cursor:
+                    return await cursor.fetchone()
+        finally:
+            DB_STATEMENT_SECONDS.observe((statement_label(sql),), time.perf_counter() - start)
+
+    async def fetchall(self, sql: str, params: tuple = ()):
+        start = time.perf_counter()
+        try:
+            async with self.reader() as db:
+                async with db.execute(sql, params) as cursor:
+                    return await cursor.fetchall()
+        finally:
+            DB_STATEMENT_SECONDS.observe((statement_label(sql),), time.perf_counter() - start)
+
+    @staticmethod
+    async def _load_forcebans(db: aiosqlite.Connection) -> dict[int, set[int]]:
+        index: dict[int, set[int]] = {}
+        async with db.execute("SELECT guild_id, user_id FROM forcebans") as cursor:
+            async for guild_id, user_id in cursor:
+                index.setdefault(guild_id, set()).add(user_id)
+        return index
+
+    async def add_forceban(self, user_id: int, guild_id: int, banned_by: int, reason: str):
+        await self.execute(
+            "INSERT OR REPLACE INTO forcebans (user_id, guild_id, banned_by, ban_reason, ban_date) VALUES (?, ?, ?, ?, ?)",
+            (user_id, guild_id, banned_by, reason, datetime.now(timezone.utc).isoformat())
+        )
+        self._forcebans.setdefault(guild_id, set()).add(user_id)
+
+    async def remove_forceban(self, user_id: int, guild_id: int) -> bool:
+        rowcount = await self.execute(
+            "DELETE FROM forcebans WHERE user_id = ? AND guild_id = ?",
+            (user_id, guild_id)
+        )
+        banned = self._forcebans.get(guild_id)
+        if banned is not None:
+            banned.discard(user_id)
+            if not banned:
+                del self._forcebans[guild_id]
+        return rowcount > 0
+
+    def is_forcebanned(self, user_id: int, guild_id: int) -> bool:
+        """Bellekteki indeksten O(1) kontrol"""
+        self.forceban_lookups += 1
+        banned = self._forcebans.get(guild_id)
+        if banned is not None and user_id in banned:
+            self.forceban_hits += 1
+            return True
+        return False
+
+    def forceban_stats(self) -> dict:
+        return {
+            "lookups": self.forceban_lookups,
+            "hits": self.forceban_hits,
+            "hit_rate": self.forceban_hits / self.forceban_lookups if self.forceban_lookups else 0.0,
+            "guilds": len(self._forcebans),
+            "entries": sum(len(u) for u in self._forcebans.values()),
+        }
+
+    async def verify_forceban_index(self) -> int:
+        """Bellekteki indeksi tabloyla karşılaştır, sapma varsa düzelt"""
+        async with self._write_lock:
+            fresh = await self._load_forcebans(self._writer)
+            drift = 0
+            for guild_id in fresh.keys() | self._forcebans.keys():
+                drift += len(fresh.get(guild_id, set()) ^ self._forcebans.get(guild_id, set()))
+            self._forcebans = fresh
+        if drift:
+            logger.warning(f"Forceban indeksi tabloyla uyuşmuyordu, {drift} kayıt düzeltildi")
+        return drift
+
+    async def add_mute(self, user_id: int, guild_id: int, muted_by: int, reason: str | None, unmute_date: datetime | None = None):
+        await self.execute(
+            "INSERT OR REPLACE INTO mutes (user_id, guild_id, muted_by, mute_reason, mute_date, unmute_date, active) VALUES (?, ?, ?, ?, ?, ?, 1)",
+            (user_id, guild_id, muted_by, reason, datetime.now(timezone.utc).isoformat(),
+             unmute_date.isoformat() if unmute_date else None)
+        )
+
+    async def set_unmuted(self, user_id: int, guild_id: int):
+        await self.execute(
+            "UPDATE mutes SET unmute_date=?, active=0 WHERE user_id=? AND guild_id=?",
+            (datetime.now(timezone.utc).isoformat(), user_id, guild_id)
+        )
+
+    async def set_unmuted_many(self, expired: list[tuple[int, int]]):
+        """Süresi dolan (guild_id, user_id) kayıtlarını tek işlemde kapat"""
+        now = datetime.now(timezone.utc).isoformat()
+        async with self.transaction() as db:
+            await db.executemany(
+                "UPDATE mutes SET active=0 WHERE guild_id=? AND user_id=? AND active=1 "
+                "AND unmute_date IS NOT NULL AND unmute_date <= ?",
+                [(guild_id, user_id, now) for guild_id, user_id in expired]
+            )
+
+    async def get_pending_unmutes(self, shard_count: int | None = None,
+                                  shard_ids: list[int] | None = None) -> list[tuple[int, int, str]]:
+        """shard_ids verilirse yalnızca bu işlemin shard'larındaki sunucuların kayıtları"""
+        sql = "SELECT guild_id, user_id, unmute_date FROM mutes WHERE active = 1 AND unmute_date IS NOT NULL"
+        if shard_ids is None:
+            return await self.fetchall(sql)
+        placeholders = ", ".join("?" * len(shard_ids))
+        return await self.fetchall(
+            f"{sql} AND ((guild_id >> 22) % ?) IN ({placeholders})", (shard_count or 1, *shard_ids)
+        )
+
+    async def get_log_channels(self) -> dict[int, int]:
+        rows = await self.fetchall("SELECT guild_id, channel_id FROM log_channels")
+        return dict(rows)
+
+    async def set_log_channel(self, guild_id: int, channel_id: int):
+        await self.execute(
+            "INSERT INTO log_channels (guild_id, channel_id) VALUES (?, ?) "
+            "ON CONFLICT(guild_id) DO UPDATE SET channel_id = excluded.channel_id",
+            (guild_id, channel_id)
+        )
+
+    async def get_log_events(self) -> dict[int, str]:
+        rows = await self.fetchall("SELECT guild_id, log_events FROM log_channels")
+        return dict(rows)
+
+    async def set_log_events(self, guild_id: int, channel_id: int, log_events: str):
+        await self.execute(
+            "INSERT INTO log_channels (guild_id, channel_id, log_events) VALUES (?, ?, ?) "
+            "ON CONFLICT(guild_id) DO UPDATE SET log_events = excluded.log_events",
+            (guild_id, channel_id, log_events)
+        )
+
+    async def get_profanity_words(self, guild_id: int) -> list[str] | None:
+        """Sunucunun kendi listesi; hiç özelleştirilmemişse None (boş liste ayrı bir durumdur)"""
+        if await self.fetchone("SELECT 1 FROM profanity_lists WHERE guild_id = ?", (guild_id,)) is None:
+            return None
+        rows = await self.fetchall("SELECT word FROM profanity_words WHERE guild_id = ?", (guild_id,))
+        return [word for (word,) in rows]
+
+    async def add_profanity_words(self, guild_id: int, words: list[str]):
+        async with self.transaction() as db:
+            await db.execute("INSERT OR IGNORE INTO profanity_lists (guild_id) VALUES (?)", (guild_id,))
+            await db.executemany(
+                "INSERT OR IGNORE INTO profanity_words (guild_id, word) VALUES (?, ?)",
+                [(guild_id, word) for word in words]
+            )
+
+    async def remove_profanity_word(self, guild_id: int, word: str) -> bool:
+        rowcount = await self.execute(
+            "DELETE FROM profanity_words WHERE guild_id = ? AND word = ?",
+            (guild_id, word)
+        )
+        return rowcount > 0
+
+    async def get_disabled_rules(self, guild_id: int) -> list[str]:
+        rows = await self.fetchall("SELECT rule FROM automod_disabled_rules WHERE guild_id = ?", (guild_id,))
+        return [rule for (rule,) in rows]
+
+    async def set_rule_enabled(self, guild_id: int, rule: str, enabled: bool):
+        if enabled:
+            await self.execute("DELETE FROM automod_disabled_rules WHERE guild_id = ? AND rule = ?", (guild_id, rule))
+        else:
+            await self.execute("INSERT OR IGNORE INTO automod_disabled_rules (guild_id, rule) VALUES (?, ?)", (guild_id, rule))
+
+    async def get_mute_roles(self) -> dict[int, int]:
+        rows = await self.fetchall("SELECT guild_id, role_id FROM mute_roles")
+        return dict(rows)
+
+    async def set_mute_role(self, guild_id: int, role_id: int):
+        await self.execute(
+            "INSERT OR REPLACE INTO mute_roles (guild_id, role_id) VALUES (?, ?)",
+            (guild_id, role_id)
+        )
+
+    async def get_raid_config(self, guild_id: int) -> tuple[int, int] | None:
+        return await self.fetchone("SELECT threshold, window_seconds FROM raid_config WHERE guild_id = ?", (guild_id,))
+
+    async def set_raid_config(self, guild_id: int, threshold: int, window_seconds: int):
+        await self.execute(
+            "INSERT OR REPLACE INTO raid_config (guild_id, threshold, window_seconds) VALUES (?, ?, ?)",
+            (guild_id, threshold, window_seconds)
+        )
+
+    async def save_lockdown_snapshot(self, guild_id: int, overwrites: list[tuple[int, int, int]],
+                                     unlock_at: datetime | None = None):
+        """(channel_id, allow, deny) listesini ve kilidi tek işlemde kaydet"""
+        async with self.transaction() as db:
+            await db.execute("DELETE FROM lockdown_snapshots WHERE guild_id = ?", (guild_id,))
+            await db.executemany(
+                "INSERT INTO lockdown_snapshots (guild_id, channel_id, allow, deny) VALUES (?, ?, ?, ?)",
+                [(guild_id, channel_id, allow, deny) for channel_id, allow, deny in overwrites]
+            )
+            await db.execute(
+                "INSERT OR REPLACE INTO lockdowns (guild_id, unlock_at) VALUES (?, ?)",
+                (guild_id, unlock_at.isoformat() if unlock_at else None)
+            )
+
+    async def get_lockdown_snapshot(self, guild_id: int) -> list[tuple[int, int, int]]:
+        return await self.fetchall(
+            "SELECT channel_id, allow, deny FROM lockdown_snapshots WHERE guild_id = ?", (guild_id,)
+        )
+
+    async def get_lockdown(self, guild_id: int) -> tuple[str | None] | None:
+        """Kayıtlı kilit varsa (unlock_at,), yoksa None"""
+        return await self.fetchone("SELECT unlock_at FROM lockdowns WHERE guild_id = ?", (guild_id,))
+
+    async def get_lockdowns(self, shard_count: int | None = None,
+                            shard_ids: list[int] | None = None) -> list[tuple[int, str | None]]:
+        """shard_ids verilirse yalnızca bu işlemin shard'larındaki sunucuların kilitleri"""
+        sql = "SELECT guild_id, unlock_at FROM lockdowns"
+        if shard_ids is None:
+            return await self.fetchall(sql)
+        placeholders = ", ".join("?" * len(shard_ids))
+        return await self.fetchall(
+            f"{sql} WHERE ((guild_id >> 22) % ?) IN ({placeholders})", (shard_count or 1, *shard_ids)
+        )
+
+    async def clear_lockdown_snapshot(self, guild_id: int):
+        async with self.transaction() as db:
+            await db.execute("DELETE FROM lockdown_snapshots WHERE guild_id = ?", (guild_id,))
+            await db.execute("DELETE FROM lockdowns WHERE guild_id = ?", (guild_id,))
+
+    async def add_warning(self, guild_id: int, user_id: int, moderator_id: int, reason: str | None) -> tuple[int, int]:
+        """Uyarıyı ekler; (uyarı ID'si, kullanıcının toplam uyarı sayısı) döndürür"""
+        async with self.transaction() as db:
+            cursor = await db.execute(
+                "INSERT INTO warnings (guild_id, user_id, moderator_id, reason, timestamp) VALUES (?, ?, ?, ?, ?)",
+                (guild_id, user_id, moderator_id, reason, datetime.now(timezone.utc).isoformat())
+            )
+            warning_id = cursor.lastrowid
+            async with db.execute(
+                "SELECT COUNT(*) FROM warnings WHERE guild_id = ? AND user_id = ?", (guild_id, user_id)
+            ) as cursor:
+                (count,) = await cursor.fetchone()
+        return warning_id, count
+
+    async def count_warnings(self, guild_id: int, user_id: int) -> int:
+        (count,) = await self.fetchone(
+            "SELECT COUNT(*) FROM warnings WHERE guild_id = ? AND user_id = ?", (guild_id, user_id)
+        )
+        return count
+
+    async def get_warnings(self, guild_id: int, user_id: int, before_id: int | None = None, limit: int = 10):
+        """En yeniden eskiye keyset sayfalama; before_id verilirse o uyarıdan öncekiler"""
+        if before_id is None:
+            return await self.fetchall(
+                "SELECT id, moderator_id, reason, timestamp FROM warnings "
+                "WHERE guild_id = ? AND user_id = ? ORDER BY timestamp DESC, id DESC LIMIT ?",
+                (guild_id, user_id, limit)
+            )
+        return await self.fetchall(
+            "SELECT id, moderator_id, reason, timestamp FROM warnings "
+            "WHERE guild_id = ? AND user_id = ? "
+            "AND (timestamp, id) < (SELECT timestamp, id FROM warnings WHERE id = ?) "
+            "ORDER BY timestamp DESC, id DESC LIMIT ?",
+            (guild_id, user_id, before_id, limit)
+        )
+
+    async def clear_warnings(self, guild_id: int, user_id: int) -> int:
+        return await self.execute(
+            "DELETE FROM warnings WHERE guild_id = ? AND user_id = ?", (guild_id, user_id)
+        )
+
+    async def get_case(self, guild_id: int, case_id: int):
+        return await self.fetchone(
+            "SELECT id, user_id, target_id, action, reason, timestamp, message_link FROM mod_logs "
+            "WHERE id = ? AND guild_id = ?",
+            (case_id, guild_id)
+        )
+
+    async def get_history(self, guild_id: int, member_id: int, by_moderator: bool = False,
+                          before: tuple[str, int] | None = None, limit: int = 10):
+        """Hedefe (veya yetkiliye) göre kayıtlar, en yeniden eskiye keyset sayfalama.
+
+        before: bir önceki sayfanın son satırının (timestamp, id) değeri.
+        """
+        column = "user_id" if by_moderator else "target_id"
+        sql = (
+            "SELECT id, user_id, target_id, action, reason, timestamp, message_link FROM mod_logs "
+            f"WHERE guild_id = ? AND {column} = ? "
+        )
+        params = [guild_id, member_id]
+        if before is not None:
+            sql += "AND (timestamp, id) < (?, ?) "
+            params.extend(before)
+        sql += "ORDER BY timestamp DESC, id DESC LIMIT ?"
+        params.append(limit)
+        return await self.fetchall(sql, tuple(params))
+
+    @staticmethod
+    def guild_rows_sql(table: str, columns: tuple[str, ...]) -> str:
+        # (guild_id) indeksleri rowid'yi de içerir: grup başına indeks aralığı okunur, sıralama yapılmaz
+        return (
+            f"SELECT rowid, {', '.join(columns)} FROM {table} "
+            "WHERE guild_id = ? AND rowid > ? ORDER BY rowid LIMIT ?"
+        )
+
+    async def iter_guild_rows(self, table: str, columns: tuple[str, ...], guild_id: int, batch_size: int = 1000):
+        """Sunucunun satırlarını rowid sırasıyla gruplar halinde verir.
+
+        Her grup ayrı bir sorgudur; bağlantı gruplar arasında havuza döner.
+        Tablo ve sütun adları utils.export.EXPORT_TABLES'tan gelir, kullanıcıdan değil.
+        """
+        sql = self.guild_rows_sql(table, columns)
+        last = 0
+        while True:
+            rows = await self.fetchall(sql, (guild_id, last, batch_size))
+            if not rows:
+                return
+            last = rows[-1][0]
+            yield [row[1:] for row in rows]
+
+    async def record_mass_action(self, guild_id: int, moderator_id: int, action: str, target_ids: list[int],
+                                 reason: str | None, message_link: str | None, forceban: bool = False):
+        """Toplu işlemin forcebans ve mod_logs satırlarını tek işlemde yazar"""
+        now = datetime.now(timezone.utc).isoformat()
+        async with self.transaction() as db:
+            if forceban:
+                await db.executemany(
+                    "INSERT OR REPLACE INTO forcebans (user_id, guild_id, banned_by, ban_reason, ban_date) VALUES (?, ?, ?, ?, ?)",
+                    [(user_id, guild_id, moderator_id, reason, now) for user_id in target_ids]
+                )
+            await db.executemany(
+                "INSERT INTO mod_logs (guild_id, user_id, target_id, action, reason, timestamp, message_link) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(guild_id, moderator_id, user_id, action, reason, now, message_link) for user_id in target_ids]
+            )
+        if forceban:
+            self._forcebans.setdefault(guild_id, set()).update(target_ids)
+
+    async def get_state(self, key: str) -> str | None:
+        row = await self.fetchone("SELECT value FROM bot_state WHERE key = ?", (key,))
+        return row[0] if row else None
+
+    async def set_state(self, key: str, value: str):
+        await self.execute(
+            "INSERT INTO bot_state (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value)
+        )
+
+    async def add_mod_log(self, guild_id: int, user_id: int, target_id: int, action: str, reason: str | None, message_link: str | None):
+        """Satırı kuyruğa ekle; kuyruk doluysa yer açılana kadar bekler"""
+        await self._mod_log_queue.put(
+            (guild_id, user_id, target_id, action, reason, datetime.now(timezone.utc).isoformat(), message_link)
+        )
+        if self._mod_log_queue.qsize() >= self.mod_log_batch_size:
+            self._mod_log_wakeup.set()
+
+    async def flush_mod_logs(self):
+        """Kuyrukta bekleyen tüm mod_logs satırları yazılana kadar bekle"""
+        if self._mod_log_task is None:
+            return
+        self._mod_log_wakeup.set()
+        await self._mod_log_queue.join()
+
+    async def _mod_log_writer(self):
+        queue = self._mod_log_queue
+        while True:
+            batch = [await queue.get()]
+            if queue.qsize() + 1 < self.mod_log_batch_size:
+                try:
+                    await asyncio.wait_for(self._mod_log_wakeup.wait(), self.mod_log_flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+            self._mod_log_wakeup.clear()
+            while len(batch) < self.mod_log_batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            start = time.perf_counter()
+            try:
+                async with self.transaction() as db:
+                    await db.executemany(
+                        "INSERT INTO mod_logs (guild_id, user_id, target_id, action, reason, timestamp, message_link) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        batch
+                    )
+            except Exception as e:
+                logger.error(f"mod_logs toplu yazımı başarısız, {len(batch)} satır kaybedildi", exc_info=e)
+            else:
+                elapsed = (time.perf_counter() - start) * 1000
+                self.mod_log_flushes += 1
+                self.mod_log_rows_written += len(batch)
+                self.mod_log_last_flush_ms = elapsed
+                self.mod_log_max_flush_ms = max(self.mod_log_max_flush_ms, elapsed)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+            if not queue.empty():
+                self._mod_log_wakeup.set()
+
+    def mod_log_stats(self) -> dict:
+        return {
+            "queue_depth": self._mod_log_queue.qsize(),
+            "queue_max": self._mod_log_queue.maxsize,
+            "flushes": self.mod_log_flushes,
+            "rows_written": self.mod_log_rows_written,
+            "last_flush_ms": self.mod_log_last_flush_ms,
+            "max_flush_ms": self.mod_log_max_flush_ms,
+        }
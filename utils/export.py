@@ -0,0 +1,111 @@
+import asyncio
+import csv
+import gzip
+import io
+import json
+import zlib
+
+# Tablo adı -> dışa aktarılan sütunlar (guild_id her satırda aynı olduğu için yok)
+EXPORT_TABLES = {
+    "mod_logs": ("id", "user_id", "target_id", "action", "reason", "timestamp", "message_link"),
+    "forcebans": ("user_id", "banned_by", "ban_reason", "ban_date"),
+    "mutes": ("user_id", "muted_by", "mute_reason", "mute_date", "unmute_date", "active"),
+}
+
+FORMATS = ("jsonl", "csv")
+
+
+class GzipParts:
+    """Satır gruplarını gzip'e yazar, boyut sınırına yaklaşınca parçayı kapatır.
+
+    Her grup sonrası Z_SYNC_FLUSH yapıldığı için tampon boyutu gerçek sıkıştırılmış
+    boyuttur; bir sonraki grup en kötü durumda ham boyutu kadar yer kaplar.
+    Bellekte en fazla bir parça (sınır kadar) tutulur. Metotlar iş parçacığında çalışır.
+    """
+
+    OVERHEAD = 64
+
+    def __init__(self, columns: tuple[str, ...], fmt: str, limit: int):
+        self.columns = columns
+        self.fmt = fmt
+        self.limit = limit
+        self.rows = 0
+        self._part_rows = 0
+        self._buffer: io.BytesIO | None = None
+        self._gzip: gzip.GzipFile | None = None
+
+    def _open(self):
+        self._buffer = io.BytesIO()
+        self._gzip = gzip.GzipFile(fileobj=self._buffer, mode="wb", mtime=0)
+        self._part_rows = 0
+        if self.fmt == "csv":
+            self._gzip.write(self._encode([self.columns]))
+
+    def _close(self) -> bytes:
+        self._gzip.close()
+        data = self._buffer.getvalue()
+        self._buffer = self._gzip = None
+        return data
+
+    def _encode(self, rows) -> bytes:
+        if self.fmt == "csv":
+            out = io.StringIO()
+            csv.writer(out).writerows(rows)
+            return out.getvalue().encode("utf-8")
+        columns = self.columns
+        return "".join(
+            json.dumps(dict(zip(columns, row)), ensure_ascii=False) + "\n" for row in rows
+        ).encode("utf-8")
+
+    def write(self, rows) -> bytes | None:
+        """Grubu yazar; önceki parça dolduysa kapatılıp döndürülür"""
+        raw = self._encode(rows)
+        finished = None
+        if self._gzip is None:
+            self._open()
+        elif self._part_rows and self._buffer.tell() + len(raw) + self.OVERHEAD > self.limit:
+            finished = self._close()
+            self._open()
+        self._gzip.write(raw)
+        self._gzip.flush(zlib.Z_SYNC_FLUSH)
+        self._part_rows += len(rows)
+        self.rows += len(rows)
+        return finished
+
+    def finish(self) -> bytes | None:
+        return self._close() if self._gzip is not None else None
+
+
+class GuildExport:
+    """Bir sunucunun kayıtlarını tablo tablo, sıkıştırılmış parçalar halinde üretir"""
+
+    def __init__(self, db_manager, guild_id: int, fmt: str = "jsonl",
+                 limit: int = 8 * 1024 * 1024, batch_size: int = 1000):
+        if fmt not in FORMATS:
+            raise ValueError(f"Bilinmeyen biçim: {fmt}")
+        self.db = db_manager
+        self.guild_id = guild_id
+        self.fmt = fmt
+        self.limit = limit
+        self.batch_size = batch_size
+        self.counts: dict[str, int] = {}
+
+    async def parts(self):
+        """(dosya adı, gzip verisi) çiftleri; bir parça gönderilmeden sonraki okunmaz"""
+        await self.db.flush_mod_logs()
+        for table, columns in EXPORT_TABLES.items():
+            writer = GzipParts(columns, self.fmt, self.limit)
+            number = 0
+            async for rows in self.db.iter_guild_rows(table, columns, self.guild_id, self.batch_size):
+                data = await asyncio.to_thread(writer.write, rows)
+                if data is not None:
+                    number += 1
+                    yield self._filename(table, number), data
+            data = await asyncio.to_thread(writer.finish)
+            if data is not None:
+                number += 1
+                yield self._filename(table, number), data
+            self.counts[table] = writer.rows
+
+    def _filename(self, table: str, number: int) -> str:
+        return f"{table}-{self.guild_id}-{number}.{self.fmt}.gz"
@@ -0,0 +1,75 @@
+import sys
+import time
+from collections import OrderedDict, deque
+
+
+class FloodTracker:
+    """(guild_id, user_id) başına sabit boyutlu kayan pencere.
+
+    Her anahtar en fazla `threshold + 1` zaman damgası tutar. Sözlük son
+    etkinliğe göre sıralı tutulur; böylece hem bellek sınırı aşıldığında
+    hem de süpürmede en uzun süredir sessiz olanlar baştan atılır.
+    """
+
+    __slots__ = ("threshold", "window", "max_keys", "_windows", "evicted")
+
+    def __init__(self, threshold: int, window: float, max_keys: int = 50_000):
+        self.threshold = threshold
+        self.window = window
+        self.max_keys = max_keys
+        self._windows: OrderedDict[tuple[int, int], deque] = OrderedDict()
+        self.evicted = 0
+
+    def __len__(self):
+        return len(self._windows)
+
+    def hit(self, guild_id: int, user_id: int, now: float | None = None) -> int:
+        """Mesajı kaydeder ve penceredeki mesaj sayısını döndürür"""
+        if now is None:
+            now = time.monotonic()
+        key = (guild_id, user_id)
+        windows = self._windows
+        stamps = windows.get(key)
+        if stamps is None:
+            if len(windows) >= self.max_keys:
+                windows.popitem(last=False)
+                self.evicted += 1
+            stamps = windows[key] = deque(maxlen=self.threshold + 1)
+        else:
+            windows.move_to_end(key)
+        cutoff = now - self.window
+        while stamps and stamps[0] <= cutoff:
+            stamps.popleft()
+        stamps.append(now)
+        return len(stamps)
+
+    def reset(self, guild_id: int, user_id: int):
+        self._windows.pop((guild_id, user_id), None)
+
+    def sweep(self, now: float | None = None) -> int:
+        """Pencere süresince mesaj atmamış anahtarları siler"""
+        if now is None:
+            now = time.monotonic()
+        cutoff = now - self.window
+        removed = 0
+        windows = self._windows
+        while windows:
+            stamps = next(iter(windows.values()))
+            if stamps[-1] > cutoff:
+                break
+            windows.popitem(last=False)
+            removed += 1
+        self.evicted += removed
+        return removed
+
+    def stats(self) -> dict:
+        windows = self._windows
+        size = sys.getsizeof(windows)
+        for key, stamps in windows.items():
+            size += sys.getsizeof(key) + sys.getsizeof(stamps) + len(stamps) * sys.getsizeof(0.0)
+        return {
+            "keys": len(windows),
+            "max_keys": self.max_keys,
+            "bytes": size,
+            "evicted": self.evicted,
+        }
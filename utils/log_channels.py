@@ -0,0 +1,147 @@
+import asyncio
+import json
+import logging
+
+import discord
+
+LOG_CHANNEL_NAME = "denetim-log"
+
+# log_channels.log_events anahtarları; sıra bit konumunu belirler, değiştirilmemeli
+LOG_EVENTS = (
+    "message_delete", "message_edit", "member_join", "member_remove", "ban", "unban",
+    "kick", "mute", "unmute", "role_change", "voice_state",
+)
+EVENT_BITS = {name: 1 << i for i, name in enumerate(LOG_EVENTS)}
+ALL_EVENTS = (1 << len(LOG_EVENTS)) - 1
+# /logconfig'te sunulanlar; voice_state için dinleyici olmadığından kapatmak bir şey değiştirmez
+CONFIGURABLE_EVENTS = tuple(name for name in LOG_EVENTS if name != "voice_state")
+# Moderasyon eylemi -> bağlı olduğu olay; eşlenmeyen eylemler (GIVEROL vb.) her zaman loglanır
+ACTION_EVENTS = {
+    "BAN": EVENT_BITS["ban"], "FORCEBAN": EVENT_BITS["ban"], "MASSBAN": EVENT_BITS["ban"],
+    "UNBAN": EVENT_BITS["unban"],
+    "KICK": EVENT_BITS["kick"], "MASSKICK": EVENT_BITS["kick"],
+    "MUTE": EVENT_BITS["mute"], "UNMUTE": EVENT_BITS["unmute"],
+}
+
+logger = logging.getLogger("ModerationBot.log_channels")
+
+_MISSING = object()
+
+
+def parse_log_events(raw: str | None) -> int:
+    """log_events JSON'unu bit maskesine çevirir; eksik ya da bozuk anahtarlar açık sayılır"""
+    try:
+        data = json.loads(raw) if raw else {}
+    except ValueError:
+        return ALL_EVENTS
+    mask = ALL_EVENTS
+    for name, enabled in data.items():
+        bit = EVENT_BITS.get(name)
+        if bit is not None and not enabled:
+            mask &= ~bit
+    return mask
+
+
+def dump_log_events(mask: int) -> str:
+    return json.dumps({name: bool(mask & bit) for name, bit in EVENT_BITS.items()}, separators=(",", ":"))
+
+
+class LogChannelResolver:
+    """Sunucu başına denetim kanalı ID'sini ve olay filtresini log_channels tablosunda ve bellekte tutar"""
+
+    def __init__(self, bot, db_manager):
+        self.bot = bot
+        self.db = db_manager
+        # guild_id -> channel_id; None = sunucuda denetim kanalı yok
+        self._channel_ids: dict[int, int | None] = {}
+        # guild_id -> açık olayların bit maskesi; kaydı olmayan sunucuda hepsi açık
+        self._event_masks: dict[int, int] = {}
+        self._config_lock = asyncio.Lock()
+        self._loaded = False
+        bot.add_listener(self.on_guild_channel_create)
+        bot.add_listener(self.on_guild_channel_delete)
+        bot.add_listener(self.on_guild_channel_update)
+
+    async def load(self):
+        rows = await self.db.get_log_channels()
+        self._channel_ids.update(rows)
+        for guild_id, raw in (await self.db.get_log_events()).items():
+            self._event_masks[guild_id] = parse_log_events(raw)
+        self._loaded = True
+        logger.info(f"Denetim kanalı önbelleği yüklendi: {len(rows)} sunucu")
+
+    async def get(self, guild: discord.Guild) -> discord.TextChannel | None:
+        if not self._loaded:
+            await self.load()
+        channel_id = self._channel_ids.get(guild.id, _MISSING)
+        if channel_id is None:
+            return None
+        if channel_id is not _MISSING:
+            channel = guild.get_channel(channel_id)
+            if channel is not None:
+                return channel
+        # Önbellekte yok ya da kanal artık yok: bir kez tara ve sonucu sakla
+        channel = discord.utils.get(guild.text_channels, name=LOG_CHANNEL_NAME)
+        await self._remember(guild.id, channel)
+        return channel
+
+    async def get_or_create(self, guild: discord.Guild) -> discord.TextChannel:
+        """Denetim kanalı varsa döndür, yoksa oluştur"""
+        channel = await self.get(guild)
+        if not channel:
+            overwrites = {guild.default_role: discord.PermissionOverwrite(send_messages=True)}
+            channel = await guild.create_text_channel(LOG_CHANNEL_NAME, overwrites=overwrites)
+            await self._remember(guild.id, channel)
+        return channel
+
+    async def _remember(self, guild_id: int, channel: discord.TextChannel | None):
+        if channel is None:
+            self._channel_ids[guild_id] = None
+            return
+        if self._channel_ids.get(guild_id) != channel.id:
+            await self.db.set_log_channel(guild_id, channel.id)
+        self._channel_ids[guild_id] = channel.id
+
+    def wants(self, guild_id: int, bit: int) -> bool:
+        """Dinleyicilerin biçimlendirmeden önce çağırdığı O(1) kontrol"""
+        return self._event_masks.get(guild_id, ALL_EVENTS) & bit != 0
+
+    def wants_action(self, guild_id: int, action: str) -> bool:
+        """Moderasyon eylemi embed'i oluşturulmadan önce; eşlenmeyen eylemler için her zaman True"""
+        bit = ACTION_EVENTS.get(action)
+        return bit is None or self.wants(guild_id, bit)
+
+    def event_mask(self, guild_id: int) -> int:
+        return self._event_masks.get(guild_id, ALL_EVENTS)
+
+    async def set_events(self, guild: discord.Guild, changes: dict[str, bool]) -> int:
+        """Veritabanını ve önbelleği birlikte günceller; yazma başarısızsa önbellek değişmez"""
+        async with self._config_lock:
+            channel = await self.get_or_create(guild)
+            mask = self.event_mask(guild.id)
+            for name, enabled in changes.items():
+                mask = mask | EVENT_BITS[name] if enabled else mask & ~EVENT_BITS[name]
+            await self.db.set_log_events(guild.id, channel.id, dump_log_events(mask))
+            self._event_masks[guild.id] = mask
+        return mask
+
+    def invalidate(self, guild_id: int):
+        self._channel_ids.pop(guild_id, None)
+
+    async def on_guild_channel_create(self, channel):
+        if isinstance(channel, discord.TextChannel) and channel.name == LOG_CHANNEL_NAME:
+            if self._channel_ids.get(channel.guild.id) is None:
+                self.invalidate(channel.guild.id)
+
+    async def on_guild_channel_delete(self, channel):
+        if self._channel_ids.get(channel.guild.id) == channel.id:
+            self.invalidate(channel.guild.id)
+
+    async def on_guild_channel_update(self, before, after):
+        if before.name == after.name:
+            return
+        cached = self._channel_ids.get(after.guild.id)
+        if cached == after.id and after.name != LOG_CHANNEL_NAME:
+            self.invalidate(after.guild.id)
+        elif cached is None and after.name == LOG_CHANNEL_NAME:
+            self.invalidate(after.guild.id)
@@ -0,0 +1,173 @@
+import asyncio
+import logging
+import time
+from collections import Counter, deque
+
+import discord
+
+logger = logging.getLogger("ModerationBot.log_dispatcher")
+
+PRIORITY_LOW = 0
+PRIORITY_NORMAL = 1
+PRIORITY_HIGH = 2
+
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+
+class ChannelBucket:
+    """Kanal başına mesaj gönderme limiti için token bucket (Discord: 5 mesaj / 5 sn)"""
+
+    __slots__ = ("rate", "per", "tokens", "updated")
+
+    def __init__(self, rate: int = 5, per: float = 5.0):
+        self.rate = rate
+        self.per = per
+        self.tokens = float(rate)
+        self.updated = time.monotonic()
+
+    def delay(self) -> float:
+        now = time.monotonic()
+        self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate / self.per)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) * self.per / self.rate
+
+    async def acquire(self):
+        while (wait := self.delay()) > 0:
+            await asyncio.sleep(wait)
+
+
+class _GuildQueue:
+    __slots__ = ("items", "summarized", "task", "full", "create_channel")
+
+    def __init__(self):
+        self.items: deque[tuple[int, discord.Embed]] = deque()
+        self.summarized: Counter = Counter()
+        self.task: asyncio.Task | None = None
+        self.full = asyncio.Event()
+        self.create_channel = False
+
+
+class LogDispatcher:
+    """Denetim kanalına giden embed'leri sunucu başına toplayıp tek mesajda (en fazla 10) gönderir"""
+
+    def __init__(self, bot, flush_interval: float = 1.5, max_queue: int = 100, hard_limit: int = 500):
+        self.bot = bot
+        self.flush_interval = flush_interval
+        # Kuyruk bu derinliği geçince düşük öncelikli olaylar yalnızca özet olarak sayılır
+        self.max_queue = max_queue
+        self.hard_limit = hard_limit
+        self._queues: dict[int, _GuildQueue] = {}
+        self._buckets: dict[int, ChannelBucket] = {}
+        self.sent_messages = 0
+        self.sent_embeds = 0
+        self.summarized_events = 0
+        self.dropped_events = 0
+
+    def send(self, guild: discord.Guild, embed: discord.Embed, priority: int = PRIORITY_NORMAL, create_channel: bool = False):
+        queue = self._queues.get(guild.id)
+        if queue is None:
+            queue = self._queues[guild.id] = _GuildQueue()
+        queue.create_channel |= create_channel
+
+        if len(queue.items) >= self.max_queue and priority == PRIORITY_LOW:
+            queue.summarized[embed.title] += 1
+            self.summarized_events += 1
+        else:
+            if len(queue.items) >= self.hard_limit:
+                self._evict(queue)
+            queue.items.append((priority, embed))
+            if len(queue.items) >= MAX_EMBEDS_PER_MESSAGE:
+                queue.full.set()
+
+        if queue.task is None or queue.task.done():
+            queue.task = asyncio.create_task(self._run(guild.id, queue))
+
+    def _evict(self, queue: _GuildQueue):
+        # Önce en eski düşük öncelikli olayı, yoksa en eskisini at
+        for i, (priority, embed) in enumerate(queue.items):
+            if priority == PRIORITY_LOW:
+                del queue.items[i]
+                queue.summarized[embed.title] += 1
+                self.summarized_events += 1
+                return
+        queue.items.popleft()
+        self.dropped_events += 1
+
+    def _next_batch(self, queue: _GuildQueue) -> list[discord.Embed]:
+        batch, chars = [], 0
+        if queue.summarized:
+            summary = discord.Embed(title="Özetlenen Olaylar", color=0x888888)
+            summary.description = "\n".join(f"{title}: {count}" for title, count in queue.summarized.most_common(20))
+            queue.summarized.clear()
+            batch.append(summary)
+            chars += len(summary)
+        while queue.items and len(batch) < MAX_EMBEDS_PER_MESSAGE:
+            embed = queue.items[0][1]
+            size = len(embed)
+            if batch and chars + size > MAX_EMBED_CHARS_PER_MESSAGE:
+                break
+            queue.items.popleft()
+            batch.append(embed)
+            chars += size
+        return batch
+
+    async def _run(self, guild_id: int, queue: _GuildQueue):
+        while queue.items or queue.summarized:
+            if len(queue.items) < MAX_EMBEDS_PER_MESSAGE:
+                try:
+                    await asyncio.wait_for(queue.full.wait(), self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+            queue.full.clear()
+            await self._flush_once(guild_id, queue)
+        self._queues.pop(guild_id, None)
+
+    async def _flush_once(self, guild_id: int, queue: _GuildQueue):
+        guild = self.bot.get_guild(guild_id)
+        if guild is None:
+            queue.items.clear()
+            queue.summarized.clear()
+            return
+        if queue.create_channel:
+            channel = await self.bot.log_channels.get_or_create(guild)
+        else:
+            channel = await self.bot.log_channels.get(guild)
+        if channel is None:
+            queue.items.clear()
+            queue.summarized.clear()
+            return
+        batch = self._next_batch(queue)
+        if not batch:
+            return
+        bucket = self._buckets.get(channel.id)
+        if bucket is None:
+            bucket = self._buckets[channel.id] = ChannelBucket()
+        await bucket.acquire()
+        try:
+            await channel.send(embeds=batch)
+            self.sent_messages += 1
+            self.sent_embeds += len(batch)
+        except discord.HTTPException as e:
+            logger.warning(f"Denetim kaydı gönderilemedi ({guild_id}): {e}")
+
+    async def close(self):
+        """Bekleyen tüm kayıtları gönder"""
+        for queue in list(self._queues.values()):
+            queue.full.set()
+        tasks = [q.task for q in self._queues.values() if q.task is not None]
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> dict:
+        return {
+            "queued": sum(len(q.items) for q in self._queues.values()),
+            "guilds": len(self._queues),
+            "sent_messages": self.sent_messages,
+            "sent_embeds": self.sent_embeds,
+            "summarized_events": self.summarized_events,
+            "dropped_events": self.dropped_events,
+        }
@@ -0,0 +1,102 @@
+"""Kuyruklu loglama: olay döngüsü yalnızca kaydı kuyruğa koyar, disk/konsol
+yazımı ve biçimlendirme ayrı bir dinleyici iş parçacığında yapılır."""
+import json
+import logging
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler
+
+# Komut bağlamı; her komut/etkileşim kendi görevinde çalıştığı için birbirine karışmaz
+LOG_GUILD: ContextVar[int | None] = ContextVar("log_guild", default=None)
+LOG_USER: ContextVar[int | None] = ContextVar("log_user", default=None)
+LOG_COMMAND: ContextVar[str | None] = ContextVar("log_command", default=None)
+
+
+def bind_log_context(guild_id: int | None, user_id: int | None, command: str | None):
+    LOG_GUILD.set(guild_id)
+    LOG_USER.set(user_id)
+    LOG_COMMAND.set(command)
+
+
+def parse_levels(spec: str | None) -> dict[str, int]:
+    """`ModerationBot.purge=DEBUG,discord.gateway=WARNING` -> logger adı -> seviye"""
+    levels = {}
+    for part in (spec or "").split(","):
+        name, sep, level = part.strip().partition("=")
+        if not sep:
+            continue
+        value = logging.getLevelName(level.strip().upper())
+        if not isinstance(value, int):
+            raise ValueError(f"Geçersiz log seviyesi: {part.strip()}")
+        levels[name.strip()] = value
+    return levels
+
+
+class ContextFilter(logging.Filter):
+    """Kayda guild_id/user_id/command ekler; `extra` ile verilen değerler korunur"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "guild_id"):
+            record.guild_id = LOG_GUILD.get()
+        if not hasattr(record, "user_id"):
+            record.user_id = LOG_USER.get()
+        if not hasattr(record, "command"):
+            record.command = LOG_COMMAND.get()
+        return True
+
+
+class DebugSampler(logging.Filter):
+    """Aynı satırdan gelen DEBUG kayıtlarının yalnızca her `every` tanesinden birini geçirir"""
+
+    def __init__(self, every: int):
+        super().__init__()
+        self.every = every
+        self._counts: dict[tuple[str, int], int] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno != logging.DEBUG or self.every <= 1:
+            return True
+        key = (record.name, record.lineno)
+        count = self._counts.get(key, 0)
+        self._counts[key] = count + 1
+        return count % self.every == 0
+
+
+class LoopQueueHandler(QueueHandler):
+    """Olay döngüsünde yalnızca mesajı birleştirir; traceback ve biçimlendirme dinleyicide yapılır"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Argümanlar değişebilir nesneler olabilir; mesaj kayıt anındaki haliyle sabitlenir
+        message = record.getMessage()
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = message
+        record.args = None
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """Satır başına bir JSON nesnesi; boş bağlam alanları yazılmaz"""
+
+    def __init__(self, static_fields: dict | None = None):
+        super().__init__()
+        self.static_fields = static_fields or {}
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "func": record.funcName,
+            "line": record.lineno,
+            **self.static_fields,
+        }
+        for field in ("guild_id", "user_id", "command"):
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
@@ -0,0 +1,160 @@
+import asyncio
+import logging
+import re
+from datetime import datetime, timedelta, timezone
+
+import discord
+
+from utils.mute_scheduler import parse_duration
+
+logger = logging.getLogger("ModerationBot.mass_action")
+
+MAX_TARGETS = 1000
+MAX_FILE_BYTES = 512 * 1024
+# Discord toplu ban uç noktası istek başına en fazla 200 kullanıcı kabul eder
+BULK_BAN_SIZE = 200
+# Ban ile silinecek mesaj geçmişi varsayılan olarak yok (member.ban ile aynı); en fazla 7 gün
+MAX_DELETE_MESSAGE_SECONDS = 7 * 86400
+
+_ID = re.compile(r"<@!?(\d{15,20})>|(?<!\d)(\d{15,20})(?!\d)")
+_WINDOW_PREFIXES = ("son:", "katilim:")
+_DELETE_PREFIX = "sil:"
+
+
+def parse_targets(text: str | None) -> tuple[list[int], timedelta | None, int, str | None]:
+    """Baştaki ID/mention, `son:10m` ve `sil:1g` parçalarını hedef/seçenek, kalanını sebep olarak ayırır
+
+    `sil:` banlananların kaç saniyelik mesaj geçmişinin silineceğini belirler; verilmezse 0.
+    """
+    ids, window, delete_seconds = [], None, 0
+    words = (text or "").split()
+    consumed = 0
+    for word in words:
+        lowered = word.lower()
+        if lowered.startswith(_WINDOW_PREFIXES):
+            window = parse_duration(word.split(":", 1)[1])
+            if window is None:
+                raise ValueError(f"Geçersiz süre: {word}")
+        elif lowered.startswith(_DELETE_PREFIX):
+            delete = parse_duration(word.split(":", 1)[1])
+            if delete is None or delete.total_seconds() > MAX_DELETE_MESSAGE_SECONDS:
+                raise ValueError(f"Geçersiz mesaj silme süresi: {word} (en fazla 7g)")
+            delete_seconds = int(delete.total_seconds())
+        else:
+            found = [int(a or b) for a, b in _ID.findall(word.strip(","))]
+            if not found or _ID.sub("", word).strip(",;") != "":
+                break
+            ids.extend(found)
+        consumed += 1
+    reason = " ".join(words[consumed:]) or None
+    return ids, window, delete_seconds, reason
+
+
+async def read_attachment_ids(attachments: list[discord.Attachment]) -> list[int]:
+    """Yüklenen metin dosyalarındaki ID'leri okur"""
+    ids = []
+    for attachment in attachments:
+        if attachment.size > MAX_FILE_BYTES:
+            raise ValueError(f"{attachment.filename} çok büyük (en fazla {MAX_FILE_BYTES // 1024} KB)")
+        text = (await attachment.read()).decode("utf-8", errors="ignore")
+        ids.extend(int(a or b) for a, b in _ID.findall(text))
+    return ids
+
+
+def joined_within(guild: discord.Guild, window: timedelta) -> list[int]:
+    since = datetime.now(timezone.utc) - window
+    return [m.id for m in guild.members if m.joined_at is not None and m.joined_at >= since and not m.bot]
+
+
+def filter_targets(ctx, ids: list[int]) -> tuple[list[int], int]:
+    """Tekrarları, yetkiliyi, botu, sunucu sahibini ve hiyerarşide üstte olanları çıkarır"""
+    guild, author = ctx.guild, ctx.author
+    protected = {author.id, guild.owner_id, ctx.bot.user.id}
+    targets, skipped = [], 0
+    for user_id in dict.fromkeys(ids):
+        member = guild.get_member(user_id)
+        if user_id in protected or (member is not None and (
+            (member.top_role >= author.top_role and author.id != guild.owner_id)
+            or member.top_role >= guild.me.top_role
+        )):
+            skipped += 1
+            continue
+        targets.append(user_id)
+    return targets, skipped
+
+
+async def _bounded(ids: list[int], action, concurrency: int) -> tuple[list[int], list[int]]:
+    semaphore = asyncio.Semaphore(concurrency)
+    done, failed = [], []
+
+    async def run(user_id):
+        async with semaphore:
+            try:
+                await action(discord.Object(id=user_id))
+                done.append(user_id)
+            except discord.HTTPException as e:
+                failed.append(user_id)
+                logger.debug(f"Toplu işlem başarısız ({user_id}): {e}")
+
+    await asyncio.gather(*(run(user_id) for user_id in ids))
+    return done, failed
+
+
+async def mass_ban(guild: discord.Guild, ids: list[int], reason: str, delete_message_seconds: int = 0,
+                   concurrency: int = 5) -> tuple[list[int], list[int]]:
+    """ID ile banlar (fetch_user yok); toplu ban uç noktası yoksa/yetki yetmezse tek tek"""
+    banned, failed = [], []
+    for start in range(0, len(ids), BULK_BAN_SIZE):
+        chunk = ids[start:start + BULK_BAN_SIZE]
+        try:
+            result = await guild.bulk_ban(
+                [discord.Object(id=user_id) for user_id in chunk],
+                reason=reason, delete_message_seconds=delete_message_seconds
+            )
+        except discord.HTTPException as e:
+            logger.info(f"Toplu ban kullanılamadı ({guild.id}), tek tek banlanıyor: {e}")
+            done, fail = await _bounded(
+                chunk,
+                lambda user: guild.ban(user, reason=reason, delete_message_seconds=delete_message_seconds),
+                concurrency
+            )
+            banned.extend(done)
+            failed.extend(fail)
+            continue
+        banned.extend(user.id for user in result.banned)
+        failed.extend(user.id for user in result.failed)
+    return banned, failed
+
+
+async def mass_kick(guild: discord.Guild, ids: list[int], reason: str,
+                    concurrency: int = 5) -> tuple[list[int], list[int]]:
+    """Sunucuda olmayan ID'ler başarısız sayılır"""
+    present, absent = [], []
+    for user_id in ids:
+        (present if guild.get_member(user_id) is not None else absent).append(user_id)
+    kicked, failed = await _bounded(present, lambda user: guild.kick(user, reason=reason), concurrency)
+    return kicked, failed + absent
+
+
+class ConfirmView(discord.ui.View):
+    def __init__(self, author_id: int, timeout: float = 60):
+        super().__init__(timeout=timeout)
+        self.author_id = author_id
+        self.confirmed = False
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.author_id:
+            await interaction.response.send_message("Bu onay sana ait değil.", ephemeral=True)
+            return False
+        return True
+
+    @discord.ui.button(label="Onayla", style=discord.ButtonStyle.danger)
+    async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.confirmed = True
+        await interaction.response.edit_message(view=None)
+        self.stop()
+
+    @discord.ui.button(label="Vazgeç", style=discord.ButtonStyle.secondary)
+    async def abort(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await interaction.response.edit_message(content="İşlem iptal edildi.", view=None)
+        self.stop()
@@ -0,0 +1,113 @@
+import sys
+from collections import OrderedDict
+
+# Giriş başına int anahtar + OrderedDict düğümü + hash tablosu payı (tracemalloc ile ölçülmüş yaklaşık değer)
+_SLOT_OVERHEAD = 140
+
+
+class CachedMessage:
+    """Silme/düzenleme logu için gereken alanlar; içerik UTF-8 bytes olarak tutulur"""
+
+    __slots__ = ("channel_id", "author_id", "_content", "_attachments", "size")
+
+    def __init__(self, channel_id: int, author_id: int, content: str, attachments: tuple[str, ...] = ()):
+        self.channel_id = channel_id
+        self.author_id = author_id
+        self._content = content.encode("utf-8")
+        self._attachments = "\n".join(attachments) if attachments else None
+        self.size = (
+            sys.getsizeof(self) + sys.getsizeof(self._content)
+            + (sys.getsizeof(self._attachments) if self._attachments else 0)
+        )
+
+    @property
+    def content(self) -> str:
+        return self._content.decode("utf-8")
+
+    @property
+    def attachments(self) -> list[str]:
+        return self._attachments.split("\n") if self._attachments else []
+
+
+class MessageContentCache:
+    """Mesaj ID'si -> CachedMessage; bellek bütçesi aşılınca en eski girişler atılır.
+
+    discord.py'nin Message önbelleğinden bağımsızdır; raw silme/düzenleme
+    olayları eski mesajlar için de içeriği buradan alır.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[int, CachedMessage] = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, message):
+        """Sunucu mesajını saklar (botlar ve içeriksiz/eksiz mesajlar hariç)"""
+        if message.guild is None or message.author.bot:
+            return
+        if not message.content and not message.attachments:
+            return
+        entry = CachedMessage(
+            message.channel.id, message.author.id, message.content,
+            tuple(a.filename for a in message.attachments)
+        )
+        self._store(message.id, entry)
+
+    def _store(self, message_id: int, entry: CachedMessage):
+        entries = self._entries
+        old = entries.pop(message_id, None)
+        if old is not None:
+            self.bytes -= old.size + _SLOT_OVERHEAD
+        entries[message_id] = entry
+        self.bytes += entry.size + _SLOT_OVERHEAD
+        while self.bytes > self.max_bytes and entries:
+            _, dropped = entries.popitem(last=False)
+            self.bytes -= dropped.size + _SLOT_OVERHEAD
+            self.evicted += 1
+
+    def pop(self, message_id: int) -> CachedMessage | None:
+        entry = self._entries.pop(message_id, None)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.bytes -= entry.size + _SLOT_OVERHEAD
+        return entry
+
+    def pop_many(self, message_ids) -> list[tuple[int, CachedMessage]]:
+        found = []
+        for message_id in sorted(message_ids):
+            entry = self.pop(message_id)
+            if entry is not None:
+                found.append((message_id, entry))
+        return found
+
+    def replace(self, message_id: int, channel_id: int, author_id: int, content: str,
+                attachments: tuple[str, ...] = ()) -> CachedMessage | None:
+        """Düzenlenen mesajın yeni içeriğini saklar ve eski girişi döndürür"""
+        old = self._entries.get(message_id)
+        if old is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        self._store(message_id, CachedMessage(channel_id, author_id, content, attachments))
+        return old
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "bytes_per_message": self.bytes / len(self._entries) if self._entries else 0.0,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evicted": self.evicted,
+        }
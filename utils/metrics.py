@@ -0,0 +1,317 @@
+"""Prometheus metin biçiminde metrikler ve yerel /metrics uç noktası.
+
+Kayıt yolu (observe/inc) yalnızca bir sözlük araması, bisect ve birkaç
+toplama yapar; sıcak yolda kilit, biçimlendirme veya ayırma yoktur. Anlık
+değerler (önbellek boyutları, sunucu sayısı) kayıt anında değil, toplayıcı
+fonksiyonlarla yalnızca /metrics okunurken hesaplanır.
+"""
+import asyncio
+import logging
+import math
+import re
+import time
+from bisect import bisect_left
+
+from discord import app_commands
+
+from utils.log_setup import bind_log_context
+
+logger = logging.getLogger("ModerationBot.metrics")
+
+# Saniye cinsinden; olay/komut/sorgu süreleri için
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple, extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    # İlk heartbeat'ten önce shard gecikmesi nan/inf olur
+    if isinstance(value, float) and not math.isfinite(value):
+        return "NaN" if math.isnan(value) else ("+Inf" if value > 0 else "-Inf")
+    if isinstance(value, int) or value.is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        # Son eleman +Inf kovası
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class HistogramFamily:
+    """Etiket değerleri demeti -> Histogram"""
+
+    type = "histogram"
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = (), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = tuple(buckets)
+        self._children: dict[tuple, Histogram] = {}
+
+    def observe(self, key: tuple, value: float):
+        child = self._children.get(key)
+        if child is None:
+            child = self._children[key] = Histogram(self.buckets)
+        child.observe(value)
+
+    def render(self, out: list[str]):
+        for key, child in sorted(self._children.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), child.counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                out.append(f"{self.name}_bucket{_format_labels(self.labels, key, le)} {cumulative}")
+            labels = _format_labels(self.labels, key)
+            out.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+            out.append(f"{self.name}_count{labels} {child.count}")
+
+
+class CounterFamily:
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, key: tuple = (), amount: float = 1):
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self, out: list[str]):
+        for key, value in sorted(self._values.items()):
+            out.append(f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}")
+
+
+class Gauge:
+    """Toplayıcıların döndürdüğü anlık değer ailesi"""
+
+    __slots__ = ("name", "type", "help", "labels", "samples")
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = (), type: str = "gauge"):
+        self.name = name
+        self.type = type
+        self.help = help
+        self.labels = labels
+        self.samples: list[tuple[tuple, float]] = []
+
+    def add(self, key: tuple, value: float) -> "Gauge":
+        self.samples.append((key, value))
+        return self
+
+    def render(self, out: list[str]):
+        for key, value in self.samples:
+            out.append(f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}")
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._families: list = []
+        self._collectors: list = []
+
+    def histogram(self, name: str, help: str, labels: tuple[str, ...] = (), buckets=DEFAULT_BUCKETS) -> HistogramFamily:
+        family = HistogramFamily(name, help, labels, buckets)
+        self._families.append(family)
+        return family
+
+    def counter(self, name: str, help: str, labels: tuple[str, ...] = ()) -> CounterFamily:
+        family = CounterFamily(name, help, labels)
+        self._families.append(family)
+        return family
+
+    def add_collector(self, collector):
+        """collector() -> Gauge listesi; yalnızca /metrics okunurken çağrılır"""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        families = list(self._families)
+        for collector in self._collectors:
+            try:
+                families.extend(collector())
+            except Exception as e:
+                logger.warning(f"Metrik toplayıcısı başarısız: {getattr(collector, '__name__', collector)}", exc_info=e)
+        out = []
+        for family in families:
+            out.append(f"# HELP {family.name} {family.help}")
+            out.append(f"# TYPE {family.name} {family.type}")
+            family.render(out)
+        out.append("")
+        return "\n".join(out)
+
+
+REGISTRY = MetricsRegistry()
+
+EVENT_SECONDS = REGISTRY.histogram(
+    "modbot_event_handler_seconds", "Olay dinleyicisi başına çalışma süresi", ("event", "listener")
+)
+COMMAND_SECONDS = REGISTRY.histogram(
+    "modbot_command_seconds", "Komut çalışma süresi", ("command", "kind", "status")
+)
+DB_WAIT_SECONDS = REGISTRY.histogram(
+    "modbot_db_wait_seconds", "Okuma bağlantısı / yazma kilidi için bekleme süresi", ("kind",)
+)
+DB_HELD_SECONDS = REGISTRY.histogram(
+    "modbot_db_held_seconds", "Okuma bağlantısının / yazma işleminin tutulduğu süre", ("kind",)
+)
+DB_STATEMENT_SECONDS = REGISTRY.histogram(
+    "modbot_db_statement_seconds", "execute/fetchone/fetchall sorgu süresi (bekleme dahil)", ("statement",)
+)
+RATELIMIT_WAITS = REGISTRY.counter(
+    "modbot_rest_ratelimit_waits_total", "429 yanıtı sonrası bekleme sayısı", ("method",)
+)
+RATELIMIT_WAIT_SECONDS = REGISTRY.counter(
+    "modbot_rest_ratelimit_wait_seconds_total", "429 yanıtı sonrası toplam bekleme süresi", ("method",)
+)
+GLOBAL_RATELIMITS = REGISTRY.counter(
+    "modbot_rest_global_ratelimits_total", "Global hız sınırına takılma sayısı"
+)
+LOOP_LAG_SECONDS = REGISTRY.histogram(
+    "modbot_event_loop_lag_seconds", "Olay döngüsünün zamanlanmış uyanmaya göre gecikmesi", buckets=LAG_BUCKETS
+)
+
+_TABLE = re.compile(r"\b(?:FROM|INTO|UPDATE)\s+(\w+)", re.IGNORECASE)
+_statement_labels: dict[str, str] = {}
+
+
+def statement_label(sql: str) -> str:
+    """`SELECT ... FROM forcebans` -> `SELECT forcebans`; SQL metni başına bir kez çözülür"""
+    label = _statement_labels.get(sql)
+    if label is None:
+        words = sql.split(None, 1)
+        verb = words[0].upper() if words else "?"
+        match = _TABLE.search(sql)
+        label = f"{verb} {match.group(1)}" if match else verb
+        if len(_statement_labels) < 1000:
+            _statement_labels[sql] = label
+    return label
+
+
+class RateLimitHandler(logging.Handler):
+    """discord.http'nin 429 uyarılarını sayar.
+
+    discord.py hız sınırı beklemeleri için olay yayınlamaz; yalnızca bu uyarıları
+    loglar. Kova tükenince yapılan önleyici beklemeler loglanmadığı için sayılmaz.
+    """
+
+    _ROUTE = "We are being rate limited. %s %s responded with 429. Retrying in %.2f seconds."
+    _GLOBAL = "Global rate limit has been hit. Retrying in %.2f seconds."
+
+    def __init__(self):
+        super().__init__(logging.WARNING)
+
+    def emit(self, record: logging.LogRecord):
+        if record.msg == self._ROUTE:
+            method, _, retry_after = record.args
+            RATELIMIT_WAITS.inc((method,))
+            RATELIMIT_WAIT_SECONDS.inc((method,), retry_after)
+        elif record.msg == self._GLOBAL:
+            GLOBAL_RATELIMITS.inc()
+
+
+def install_ratelimit_handler() -> RateLimitHandler:
+    http_logger = logging.getLogger("discord.http")
+    for handler in http_logger.handlers:
+        if isinstance(handler, RateLimitHandler):
+            return handler
+    handler = RateLimitHandler()
+    http_logger.addHandler(handler)
+    return handler
+
+
+async def monitor_loop_lag(interval: float = 0.5):
+    """Uyku süresinin ne kadar aştığını ölçer; engelleyen kod doğrudan burada görünür"""
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        LOOP_LAG_SECONDS.observe((), max(loop.time() - start - interval, 0.0))
+
+
+class MetricsTree(app_commands.CommandTree):
+    """Slash komut sürelerini ölçen ve log bağlamını dolduran komut ağacı"""
+
+    async def interaction_check(self, interaction) -> bool:
+        interaction.extras["metrics_started"] = time.perf_counter()
+        command = interaction.command
+        bind_log_context(interaction.guild_id, interaction.user.id, command.qualified_name if command else None)
+        return True
+
+    async def on_error(self, interaction, error):
+        record_interaction(interaction, "error")
+        await super().on_error(interaction, error)
+
+
+def record_interaction(interaction, status: str):
+    started = interaction.extras.get("metrics_started")
+    if started is None:
+        return
+    command = interaction.command
+    name = command.qualified_name if command is not None else "?"
+    COMMAND_SECONDS.observe((name, "slash", status), time.perf_counter() - started)
+
+
+class MetricsServer:
+    """Yalnızca `GET /metrics` yanıtlayan küçük HTTP dinleyicisi"""
+
+    def __init__(self, registry: MetricsRegistry, host: str = "127.0.0.1", port: int = 9108):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._server: asyncio.Server | None = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"Metrikler http://{self.host}:{self.port}/metrics adresinde")
+
+    async def close(self):
+        if self._server is None:
+            return
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request = await asyncio.wait_for(reader.readline(), 5)
+            # Başlıklar okunmadan kapatılırsa bazı istemciler bağlantı hatası verir
+            while (line := await asyncio.wait_for(reader.readline(), 5)) not in (b"\r\n", b"\n", b""):
+                pass
+            parts = request.split()
+            if len(parts) >= 2 and parts[0] == b"GET" and parts[1].split(b"?")[0] == b"/metrics":
+                status, content_type = "200 OK", "text/plain; version=0.0.4; charset=utf-8"
+                body = self.registry.render().encode("utf-8")
+            else:
+                status, content_type, body = "404 Not Found", "text/plain; charset=utf-8", b"not found\n"
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("ascii") + body
+            )
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
@@ -0,0 +1,105 @@
+import asyncio
+import logging
+
+import discord
+
+MUTE_ROLE_NAME = "Muted"
+
+logger = logging.getLogger("ModerationBot.mute_roles")
+
+
+class MuteRoleManager:
+    """Sunucu başına "Muted" rol ID'sini mute_roles tablosunda ve bellekte tutar.
+
+    Yeni oluşturulan rolün kanal izinleri arka planda, sınırlı eşzamanlılıkla
+    ayarlanır; üye beklemeden susturulur.
+    """
+
+    def __init__(self, bot, db_manager, concurrency: int = 5):
+        self.bot = bot
+        self.db = db_manager
+        self.concurrency = concurrency
+        self._role_ids: dict[int, int] = {}
+        self._loaded = False
+        self._setup_jobs: dict[int, asyncio.Task] = {}
+        bot.add_listener(self.on_guild_channel_create)
+        bot.add_listener(self.on_guild_role_delete)
+
+    async def load(self):
+        self._role_ids.update(await self.db.get_mute_roles())
+        self._loaded = True
+        logger.info(f"Mute rolü önbelleği yüklendi: {len(self._role_ids)} sunucu")
+
+    async def get(self, guild: discord.Guild) -> discord.Role | None:
+        if not self._loaded:
+            await self.load()
+        role_id = self._role_ids.get(guild.id)
+        if role_id is not None:
+            role = guild.get_role(role_id)
+            if role is not None:
+                return role
+        role = discord.utils.get(guild.roles, name=MUTE_ROLE_NAME)
+        if role is not None:
+            await self._remember(guild.id, role)
+        return role
+
+    async def get_or_create(self, guild: discord.Guild) -> discord.Role:
+        role = await self.get(guild)
+        if role is None:
+            role = await guild.create_role(name=MUTE_ROLE_NAME)
+            await self._remember(guild.id, role)
+            self.start_permission_setup(guild, role)
+        return role
+
+    async def _remember(self, guild_id: int, role: discord.Role):
+        if self._role_ids.get(guild_id) != role.id:
+            await self.db.set_mute_role(guild_id, role.id)
+        self._role_ids[guild_id] = role.id
+
+    def start_permission_setup(self, guild: discord.Guild, role: discord.Role) -> asyncio.Task:
+        job = self._setup_jobs.get(guild.id)
+        if job is None or job.done():
+            job = asyncio.create_task(self._apply_overwrites(guild, role))
+            self._setup_jobs[guild.id] = job
+        return job
+
+    async def _apply_overwrites(self, guild: discord.Guild, role: discord.Role):
+        # Metin kanalları önce: susturmanın asıl etkisi orada
+        channels = sorted(
+            (ch for ch in guild.channels if ch.overwrites_for(role).send_messages is not False),
+            key=lambda ch: not isinstance(ch, discord.TextChannel)
+        )
+        semaphore = asyncio.Semaphore(self.concurrency)
+        failed = 0
+
+        async def apply(channel):
+            nonlocal failed
+            async with semaphore:
+                try:
+                    await channel.set_permissions(role, send_messages=False)
+                except discord.HTTPException as e:
+                    failed += 1
+                    logger.warning(f"Mute izni ayarlanamadı ({guild.id}/{channel.id}): {e}")
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await asyncio.gather(*(apply(ch) for ch in channels))
+        self._setup_jobs.pop(guild.id, None)
+        logger.info(
+            f"Mute rolü izinleri ayarlandı: {guild.name} ({len(channels) - failed}/{len(channels)} kanal, "
+            f"{loop.time() - start:.1f} sn)"
+        )
+
+    async def on_guild_channel_create(self, channel):
+        role_id = self._role_ids.get(channel.guild.id)
+        role = channel.guild.get_role(role_id) if role_id is not None else None
+        if role is None:
+            return
+        try:
+            await channel.set_permissions(role, send_messages=False)
+        except discord.HTTPException as e:
+            logger.warning(f"Yeni kanala mute izni eklenemedi ({channel.guild.id}/{channel.id}): {e}")
+
+    async def on_guild_role_delete(self, role):
+        if self._role_ids.get(role.guild.id) == role.id:
+            del self._role_ids[role.guild.id]
@@ -0,0 +1,186 @@
+import asyncio
+import heapq
+import logging
+import re
+import time
+from datetime import datetime, timedelta, timezone
+
+import discord
+from discord.ext import commands
+
+logger = logging.getLogger("ModerationBot.mute_scheduler")
+
+_DURATION_PART = re.compile(r"(\d+)\s*(sn|sa|s|dk|m|h|g|d|w)", re.IGNORECASE)
+_UNITS = {
+    "s": 1, "sn": 1,
+    "m": 60, "dk": 60,
+    "h": 3600, "sa": 3600,
+    "d": 86400, "g": 86400,
+    "w": 604800,
+}
+
+
+def parse_duration(text: str) -> timedelta | None:
+    """"10m", "1h30m", "2g" gibi süreleri çözer; geçersizse None"""
+    text = text.strip()
+    pos, seconds = 0, 0
+    for match in _DURATION_PART.finditer(text):
+        if match.start() != pos:
+            return None
+        seconds += int(match.group(1)) * _UNITS[match.group(2).lower()]
+        pos = match.end()
+    if pos != len(text) or seconds <= 0:
+        return None
+    return timedelta(seconds=seconds)
+
+
+class Duration(commands.Converter):
+    async def convert(self, ctx, argument) -> timedelta:
+        duration = parse_duration(argument)
+        if duration is None:
+            raise commands.BadArgument(f"Geçersiz süre: {argument}")
+        return duration
+
+
+class MuteScheduler:
+    """Süreli susturmaları bir min-heap ile takip eder ve bir sonraki bitişe kadar uyur.
+
+    Giriş başına yalnızca (bitiş, guild_id, user_id) demeti ve bir sözlük
+    kaydı tutulur. Yeniden zamanlanan ya da iptal edilen girişler heap'ten
+    hemen silinmez; çıkarıldıklarında sözlükle karşılaştırılıp atlanır.
+    """
+
+    MAX_SLEEP = 3600
+    RETRY_BASE = 60
+    RETRY_MAX = 3600
+
+    def __init__(self, bot, db_manager, batch_size: int = 100, concurrency: int = 5):
+        self.bot = bot
+        self.db = db_manager
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self._heap: list[tuple[float, int, int]] = []
+        self._expiry: dict[tuple[int, int], float] = {}
+        # Kaldırılamayan (HTTP hatası, sunucu erişilemez) kayıtların deneme sayısı
+        self._attempts: dict[tuple[int, int], int] = {}
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self.expired = 0
+
+    def __len__(self):
+        return len(self._expiry)
+
+    async def start(self):
+        if self._task is not None:
+            return
+        # Kümede her işlem yalnızca kendi shard'larındaki sunucuların süresini takip eder
+        pending = await self.db.get_pending_unmutes(self.bot.shard_count, self.bot.shard_ids)
+        for guild_id, user_id, unmute_date in pending:
+            expires = datetime.fromisoformat(unmute_date).timestamp()
+            self._expiry[(guild_id, user_id)] = expires
+            self._heap.append((expires, guild_id, user_id))
+        heapq.heapify(self._heap)
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Süreli mute zamanlayıcısı başlatıldı: {len(self._expiry)} bekleyen kayıt")
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def schedule(self, guild_id: int, user_id: int, expires_at: datetime):
+        expires = expires_at.timestamp()
+        self._expiry[(guild_id, user_id)] = expires
+        self._attempts.pop((guild_id, user_id), None)
+        heapq.heappush(self._heap, (expires, guild_id, user_id))
+        if len(self._heap) > 2 * len(self._expiry) + 1024:
+            self._compact()
+        if self._heap[0][0] == expires:
+            self._wakeup.set()
+
+    def cancel(self, guild_id: int, user_id: int):
+        self._expiry.pop((guild_id, user_id), None)
+        self._attempts.pop((guild_id, user_id), None)
+
+    def _retry(self, keys: list[tuple[int, int]]):
+        """Kapatılamayan kayıtları artan beklemeyle (60 sn, 2 dk, ... en fazla 1 sa) yeniden kuyruğa alır"""
+        now = time.time()
+        for key in keys:
+            if key in self._expiry:
+                # Beklerken yeniden susturulmuş; yeni bitiş geçerli
+                continue
+            attempt = self._attempts.get(key, 0)
+            self._attempts[key] = attempt + 1
+            expires = now + min(self.RETRY_BASE * 2 ** attempt, self.RETRY_MAX)
+            self._expiry[key] = expires
+            heapq.heappush(self._heap, (expires, *key))
+
+    def _compact(self):
+        self._heap = [(expires, g, u) for (g, u), expires in self._expiry.items()]
+        heapq.heapify(self._heap)
+
+    def _pop_due(self, now: float) -> list[tuple[int, int]]:
+        due = []
+        heap, expiry = self._heap, self._expiry
+        while heap and heap[0][0] <= now and len(due) < self.batch_size:
+            expires, guild_id, user_id = heapq.heappop(heap)
+            if expiry.get((guild_id, user_id)) != expires:
+                continue
+            del expiry[(guild_id, user_id)]
+            due.append((guild_id, user_id))
+        return due
+
+    async def _run(self):
+        while True:
+            self._wakeup.clear()
+            due = self._pop_due(time.time())
+            if due:
+                try:
+                    await self._expire_batch(due)
+                except Exception as e:
+                    logger.error("Süreli mute toplu işlemi başarısız", exc_info=e)
+                    self._retry(due)
+                continue
+            while self._heap and self._expiry.get(self._heap[0][1:]) != self._heap[0][0]:
+                heapq.heappop(self._heap)
+            timeout = min(self._heap[0][0] - time.time(), self.MAX_SLEEP) if self._heap else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _expire_batch(self, due: list[tuple[int, int]]):
+        semaphore = asyncio.Semaphore(self.concurrency)
+        bot_id = self.bot.user.id if self.bot.user else 0
+
+        async def unmute(guild_id, user_id) -> bool:
+            """Kaydın kapatılabileceği durumda True; sunucu bu işlemde değilse ya da rol alınamadıysa False"""
+            guild = self.bot.get_guild(guild_id)
+            if guild is None:
+                return False
+            member = guild.get_member(user_id)
+            role = await self.bot.mute_roles.get(guild)
+            if member is not None and role is not None and role in member.roles:
+                async with semaphore:
+                    try:
+                        await member.remove_roles(role, reason="Mute süresi doldu")
+                    except discord.HTTPException as e:
+                        logger.warning(f"Süreli mute kaldırılamadı ({guild_id}/{user_id}): {e}")
+                        return False
+            await self.db.add_mod_log(guild_id, bot_id, user_id, "UNMUTE", "Mute süresi doldu", None)
+            if not self.bot.log_channels.wants_action(guild_id, "UNMUTE"):
+                return True
+            embed = discord.Embed(title="Unmute", description="Mute süresi doldu", color=0x00ff00, timestamp=datetime.now(timezone.utc))
+            embed.add_field(name="Hedef", value=f"<@{user_id}>", inline=True)
+            self.bot.log_dispatcher.send(guild, embed)
+            return True
+
+        results = await asyncio.gather(*(unmute(guild_id, user_id) for guild_id, user_id in due))
+        # Kapatılmayan kayıtlar aktif kalır ve artan beklemeyle yeniden denenir
+        handled = [key for key, done in zip(due, results) if done]
+        self._retry([key for key, done in zip(due, results) if not done])
+        if handled:
+            await self.db.set_unmuted_many(handled)
+            for key in handled:
+                self._attempts.pop(key, None)
+        self.expired += len(handled)
@@ -0,0 +1,138 @@
+from collections import deque
+
+# Türkçe büyük/küçük harf katlama + diyakritik ve leetspeak normalizasyonu.
+# Her karakter tek karaktere eşlenir, böylece eşleşme konumları korunur.
+_FOLD = {
+    "İ": "i", "I": "i", "ı": "i",
+    "Ç": "c", "ç": "c",
+    "Ğ": "g", "ğ": "g",
+    "Ö": "o", "ö": "o",
+    "Ş": "s", "ş": "s",
+    "Ü": "u", "ü": "u",
+    "Â": "a", "â": "a",
+    "Î": "i", "î": "i",
+    "Û": "u", "û": "u",
+    "0": "o", "1": "i", "3": "e", "4": "a", "5": "s", "7": "t",
+    "@": "a", "$": "s", "!": "i",
+}
+_FOLD_TABLE = str.maketrans(_FOLD)
+
+
+def normalize(text: str) -> str:
+    return text.translate(_FOLD_TABLE).lower()
+
+
+class ProfanityMatcher:
+    """Aho-Corasick otomatı: tüm yasaklı kelimeleri mesaj üzerinde tek geçişte bulur"""
+
+    __slots__ = ("_goto", "_fail", "_output", "_dict_link", "_terms", "_dirty")
+
+    def __init__(self, words=()):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # Düğümde biten terim (yoksa None)
+        self._output: list[str | None] = [None]
+        # Fail zinciri üzerindeki en yakın terim düğümü
+        self._dict_link: list[int] = [0]
+        self._terms: set[str] = set()
+        self._dirty = False
+        for word in words:
+            self.add(word)
+        self.build()
+
+    def __len__(self):
+        return len(self._terms)
+
+    def __contains__(self, word: str):
+        return normalize(word) in self._terms
+
+    @property
+    def terms(self) -> set[str]:
+        return set(self._terms)
+
+    def add(self, word: str) -> bool:
+        """Trie'ye ekler; bağlantılar bir sonraki build() ile güncellenir"""
+        term = normalize(word.strip())
+        if not term or term in self._terms:
+            return False
+        node = 0
+        for ch in term:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(None)
+                self._dict_link.append(0)
+                self._goto[node][ch] = nxt
+            node = nxt
+        self._output[node] = term
+        self._terms.add(term)
+        self._dirty = True
+        return True
+
+    def remove(self, word: str) -> bool:
+        term = normalize(word.strip())
+        if term not in self._terms:
+            return False
+        node = 0
+        for ch in term:
+            node = self._goto[node][ch]
+        self._output[node] = None
+        self._terms.discard(term)
+        self._dirty = True
+        return True
+
+    def build(self):
+        """Fail ve sözlük bağlantılarını BFS ile yeniden hesaplar (trie korunur)"""
+        goto, fail, output, dict_link = self._goto, self._fail, self._output, self._dict_link
+        queue = deque()
+        for child in goto[0].values():
+            fail[child] = 0
+            dict_link[child] = 0
+            queue.append(child)
+        while queue:
+            node = queue.popleft()
+            for ch, child in goto[node].items():
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                target = goto[f].get(ch, 0)
+                fail[child] = target if target != child else 0
+                dict_link[child] = fail[child] if output[fail[child]] is not None else dict_link[fail[child]]
+                queue.append(child)
+        self._dirty = False
+
+    def find_all(self, text: str) -> list[str]:
+        if self._dirty:
+            self.build()
+        goto, fail, output, dict_link = self._goto, self._fail, self._output, self._dict_link
+        found = []
+        node = 0
+        for ch in normalize(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            hit = node if output[node] is not None else dict_link[node]
+            while hit:
+                found.append(output[hit])
+                hit = dict_link[hit]
+        return found
+
+    def search(self, text: str) -> str | None:
+        """İlk bulunan yasaklı terimi döndürür"""
+        if self._dirty:
+            self.build()
+        if not self._terms:
+            return None
+        goto, fail, output, dict_link = self._goto, self._fail, self._output, self._dict_link
+        node = 0
+        for ch in normalize(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if output[node] is not None:
+                return output[node]
+            if dict_link[node]:
+                return output[dict_link[node]]
+        return None
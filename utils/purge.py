@@ -0,0 +1,268 @@
+import asyncio
+import logging
+import re
+import shlex
+import time
+from datetime import datetime, timedelta, timezone
+
+import discord
+
+from utils.log_dispatcher import PRIORITY_HIGH, ChannelBucket
+
+logger = logging.getLogger("ModerationBot.purge")
+
+BULK_SIZE = 100
+# Discord 14 günden eski mesajları toplu silmez; saat farkı için pay bırakılır
+BULK_MAX_AGE = timedelta(days=14) - timedelta(minutes=5)
+
+
+def bulk_cutoff() -> datetime:
+    """Toplu silinebilecek en eski mesaj zamanı; uzun işlerde kaymaması için her seferinde hesaplanır"""
+    return datetime.now(timezone.utc) - BULK_MAX_AGE
+
+_MENTION = re.compile(r"<@!?(\d+)>|(\d{15,20})$")
+
+
+class PurgeFilter:
+    """Silinecek mesajları seçer; hiçbir koşul verilmezse her mesaj eşleşir"""
+
+    __slots__ = ("author_id", "contains", "attachments", "bots")
+
+    def __init__(self, author_id: int | None = None, contains: str | None = None,
+                 attachments: bool = False, bots: bool = False):
+        self.author_id = author_id
+        self.contains = contains.casefold() if contains else None
+        self.attachments = attachments
+        self.bots = bots
+
+    @classmethod
+    def parse(cls, text: str | None) -> "PurgeFilter":
+        """`@kullanıcı`, `icerir:"kelime"`, `ek`, `bot` parçalarını çözer"""
+        kwargs = {}
+        for token in shlex.split(text or ""):
+            lowered = token.lower()
+            if lowered in ("ek", "dosya", "attachments"):
+                kwargs["attachments"] = True
+            elif lowered in ("bot", "bots"):
+                kwargs["bots"] = True
+            elif lowered.startswith(("icerir:", "contains:")):
+                kwargs["contains"] = token.split(":", 1)[1]
+            elif match := _MENTION.match(token):
+                kwargs["author_id"] = int(match.group(1) or match.group(2))
+            else:
+                raise ValueError(f"Bilinmeyen filtre: {token}")
+        return cls(**kwargs)
+
+    def __call__(self, message: discord.Message) -> bool:
+        if self.author_id is not None and message.author.id != self.author_id:
+            return False
+        if self.bots and not message.author.bot:
+            return False
+        if self.attachments and not message.attachments:
+            return False
+        if self.contains is not None and self.contains not in message.content.casefold():
+            return False
+        return True
+
+    def describe(self) -> str:
+        parts = []
+        if self.author_id is not None:
+            parts.append(f"<@{self.author_id}>")
+        if self.contains is not None:
+            parts.append(f'içerir "{self.contains}"')
+        if self.attachments:
+            parts.append("ekli")
+        if self.bots:
+            parts.append("bot")
+        return ", ".join(parts) or "tümü"
+
+
+class PurgeJob:
+    """Kanal geçmişini akış halinde okur ve siler.
+
+    14 günden yeni mesajlar 100'lük gruplar halinde toplu silinir; daha eskiler
+    sınırlı bir kuyruğa girer ve ayrı bir görev tarafından hız sınırıyla tek tek
+    silinir. İptal edildiğinde o ana kadar silinenler sayılır; aynı komut
+    yeniden çalıştırılınca kalan mesajlardan devam edilir.
+    """
+
+    def __init__(self, channel: discord.TextChannel, limit: int | None, check: PurgeFilter,
+                 before: discord.abc.Snowflake | None = None, queue_size: int = 200,
+                 progress_interval: float = 5.0):
+        self.channel = channel
+        self.limit = limit
+        self.check = check
+        self.before = before
+        self.progress_interval = progress_interval
+        self.scanned = 0
+        self.bulk_deleted = 0
+        self.single_deleted = 0
+        self.failed = 0
+        self.cancelled = False
+        self.finished = False
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._bucket = ChannelBucket(rate=5, per=5.0)
+        self._task: asyncio.Task | None = None
+
+    @property
+    def deleted(self) -> int:
+        return self.bulk_deleted + self.single_deleted
+
+    def cancel(self) -> bool:
+        """İşi durdurur; iş zaten bittiyse hiçbir şey yapmaz ve False döner"""
+        if self.finished:
+            return False
+        self.cancelled = True
+        if self._task is not None:
+            self._task.cancel()
+        return True
+
+    async def run(self, on_progress=None):
+        self._task = asyncio.current_task()
+        worker = asyncio.create_task(self._single_worker())
+        last_report = time.monotonic()
+        try:
+            chunk: list[discord.Message] = []
+            selected = 0
+            async for message in self.channel.history(limit=None, before=self.before):
+                self.scanned += 1
+                if on_progress is not None and time.monotonic() - last_report >= self.progress_interval:
+                    last_report = time.monotonic()
+                    await on_progress(self)
+                if not self.check(message):
+                    continue
+                selected += 1
+                if message.created_at > bulk_cutoff():
+                    chunk.append(message)
+                    if len(chunk) == BULK_SIZE:
+                        await self._bulk_delete(chunk)
+                        chunk = []
+                else:
+                    await self._queue.put(message)
+                if self.limit is not None and selected >= self.limit:
+                    break
+            if chunk:
+                await self._bulk_delete(chunk)
+            await self._queue.join()
+        except asyncio.CancelledError:
+            if not self.cancelled:
+                raise
+            asyncio.current_task().uncancel()
+        finally:
+            self.finished = True
+            worker.cancel()
+            self._task = None
+
+    async def _bulk_delete(self, messages: list[discord.Message]):
+        # Grup dolana kadar geçen sürede 14 gün sınırını aşanlar tekil silinir
+        cutoff = bulk_cutoff()
+        stale = [message for message in messages if message.created_at <= cutoff]
+        if stale:
+            messages = [message for message in messages if message.created_at > cutoff]
+            for message in stale:
+                await self._queue.put(message)
+            if not messages:
+                return
+        try:
+            await self.channel.delete_messages(messages)
+            self.bulk_deleted += len(messages)
+        except discord.NotFound:
+            # Bir kısmı zaten silinmiş; kalanları tek tek kuyruğa at
+            for message in messages:
+                await self._queue.put(message)
+        except discord.HTTPException as e:
+            self.failed += len(messages)
+            logger.warning(f"Toplu silme başarısız ({self.channel.id}): {e}")
+
+    async def _single_worker(self):
+        while True:
+            message = await self._queue.get()
+            try:
+                await self._bucket.acquire()
+                await message.delete()
+                self.single_deleted += 1
+            except discord.NotFound:
+                pass
+            except discord.HTTPException as e:
+                self.failed += 1
+                logger.warning(f"Mesaj silinemedi ({self.channel.id}/{message.id}): {e}")
+            finally:
+                self._queue.task_done()
+
+
+class PurgeView(discord.ui.View):
+    def __init__(self, job: PurgeJob, author_id: int):
+        super().__init__(timeout=None)
+        self.job = job
+        self.author_id = author_id
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.author_id and not interaction.user.guild_permissions.administrator:
+            await interaction.response.send_message("Bu işlemi yalnızca başlatan yetkili iptal edebilir.", ephemeral=True)
+            return False
+        return True
+
+    @discord.ui.button(label="İptal", style=discord.ButtonStyle.danger)
+    async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if not self.job.cancel():
+            self.stop()
+            return await interaction.response.edit_message(view=None)
+        button.disabled = True
+        await interaction.response.edit_message(view=self)
+
+
+def _progress_text(job: PurgeJob) -> str:
+    return (
+        f"Siliniyor... {job.deleted} mesaj silindi ({job.bulk_deleted} toplu, {job.single_deleted} tekil), "
+        f"{job.scanned} mesaj tarandı"
+    )
+
+
+async def run_purge(bot, ctx, limit: int | None, check: PurgeFilter, action: str) -> PurgeJob | None:
+    """Kanalda tek bir temizlik işi çalıştırır, ilerlemeyi gösterir ve tek mod_logs kaydı yazar"""
+    jobs = bot.purge_jobs
+    if ctx.channel.id in jobs:
+        await ctx.send("Bu kanalda zaten bir temizlik işlemi sürüyor.", delete_after=5)
+        return None
+    job = PurgeJob(ctx.channel, limit, check, before=ctx.message)
+    jobs[ctx.channel.id] = job
+    view = PurgeView(job, ctx.author.id)
+    status = await ctx.send("Siliniyor...", view=view)
+
+    async def report(job):
+        try:
+            await status.edit(content=_progress_text(job))
+        except discord.HTTPException:
+            pass
+
+    started = time.monotonic()
+    try:
+        await job.run(report)
+    finally:
+        del jobs[ctx.channel.id]
+
+    summary = f"{job.deleted} mesaj silindi"
+    if job.failed:
+        summary += f", {job.failed} silinemedi"
+    if job.cancelled:
+        summary += " (iptal edildi)"
+    view.stop()
+    try:
+        await status.edit(content=f"{summary}.", view=None, delete_after=10)
+        await ctx.message.delete()
+    except discord.HTTPException:
+        pass
+
+    reason = f"#{ctx.channel.name}: {summary} [filtre: {check.describe()}]"
+    target_id = check.author_id or ctx.author.id
+    await bot.db.add_mod_log(ctx.guild.id, ctx.author.id, target_id, action, reason, None)
+    embed = discord.Embed(title=f"Moderasyon | {action}", color=0xff0000, timestamp=datetime.now(timezone.utc))
+    embed.add_field(name="Yetkili", value=ctx.author.mention, inline=True)
+    embed.add_field(name="Kanal", value=ctx.channel.mention, inline=True)
+    embed.add_field(name="Sonuç", value=reason, inline=False)
+    bot.log_dispatcher.send(ctx.guild, embed, priority=PRIORITY_HIGH)
+    logger.info(
+        f"{action} tamamlandı: {ctx.guild.name}/#{ctx.channel.name} {summary} "
+        f"({job.scanned} tarandı, {time.monotonic() - started:.1f} sn)"
+    )
+    return job
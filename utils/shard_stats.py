@@ -0,0 +1,88 @@
+import math
+import time
+from array import array
+
+import discord
+
+# Bu kodla çıkan işlem başlatıcıya tüm kümeyi yeniden başlatmasını söyler.
+# launcher.py main'i içe aktarmadan kullanabilsin diye burada tutulur.
+RESTART_EXIT_CODE = 75
+
+
+class EventRate:
+    """Son `window` saniyedeki olay sayısı; saniyelik kovalardan oluşan halka"""
+
+    __slots__ = ("window", "total", "_ring", "_last")
+
+    def __init__(self, window: int = 60):
+        self.window = window
+        self.total = 0
+        self._ring = array("q", bytes(8 * window))
+        self._last = int(time.monotonic())
+
+    def _advance(self, now: int):
+        gap = now - self._last
+        if gap >= self.window:
+            self._ring = array("q", bytes(8 * self.window))
+        elif gap > 0:
+            for second in range(self._last + 1, now + 1):
+                self._ring[second % self.window] = 0
+        self._last = now
+
+    def hit(self, now: float | None = None):
+        now = int(time.monotonic() if now is None else now)
+        if now != self._last:
+            self._advance(now)
+        self._ring[now % self.window] += 1
+        self.total += 1
+
+    def rate(self, now: float | None = None) -> float:
+        self._advance(int(time.monotonic() if now is None else now))
+        return sum(self._ring) / self.window
+
+
+def event_shard(args: tuple, shard_count: int | None) -> int | None:
+    """Olayın ilk argümanından sunucuyu, oradan da shard numarasını bulur"""
+    if not args:
+        return None
+    obj = args[0]
+    guild_id = getattr(obj, "guild_id", None)
+    if guild_id is None:
+        guild = obj if isinstance(obj, discord.Guild) else getattr(obj, "guild", None)
+        guild_id = getattr(guild, "id", None)
+        if guild_id is None:
+            return None
+    return (guild_id >> 22) % (shard_count or 1)
+
+
+class ShardStats:
+    """Shard başına dağıtılan olay sayısı ve hızı"""
+
+    def __init__(self, window: int = 60):
+        self.window = window
+        self._rates: dict[int, EventRate] = {}
+        self.unsharded = 0
+
+    def record(self, shard_id: int | None):
+        if shard_id is None:
+            self.unsharded += 1
+            return
+        rate = self._rates.get(shard_id)
+        if rate is None:
+            rate = self._rates[shard_id] = EventRate(self.window)
+        rate.hit()
+
+    def rate(self, shard_id: int) -> float:
+        rate = self._rates.get(shard_id)
+        return rate.rate() if rate is not None else 0.0
+
+    def stats(self) -> dict:
+        return {
+            shard_id: {"events": rate.total, "rate": rate.rate()}
+            for shard_id, rate in sorted(self._rates.items())
+        }
+
+
+def format_latency(latency: float) -> str:
+    # İlk heartbeat'ten önce gecikme nan/inf olur
+    return f"{round(latency * 1000)}ms" if math.isfinite(latency) else "?"
@@ -0,0 +1,134 @@
+import sys
+import time
+
+_COUNT_MAX = 0xFFFF
+
+
+class WindowCounter:
+    """(guild_id, actor_id, action) başına iki kovalı kayan pencere sayacı.
+
+    Her anahtarın durumu tek bir int'e paketlenir: `kova << 32 | önceki << 16 | şimdiki`.
+    Kova genişliği pencere süresine eşittir; penceredeki sayı, önceki kovanın
+    pencereye hâlâ giren kısmı oranında tahmin edilir (şimdiki + önceki * kalan oran).
+    Pencere süresi sunucuya göre ayarlanabilir.
+
+    Anahtarlar iki kuşak sözlükte tutulur: dokunulan anahtar sıcak kuşağa taşınır,
+    sıcak kuşak `max_keys / 2`'ye ulaşınca soğuk kuşak topluca atılır. Böylece isabet
+    başına sıralama güncellemesi yapılmaz ve bellek `max_keys` anahtarla sınırlı kalır.
+    """
+
+    __slots__ = ("max_keys", "default", "_thresholds", "_windows", "_window", "_hot", "_cold", "evicted")
+
+    def __init__(self, threshold: int, window: float, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self.default = (threshold, window)
+        self._thresholds: dict[int, int] = {}
+        self._windows: dict[int, float] = {}
+        self._window = window
+        self._hot: dict[tuple, int] = {}
+        self._cold: dict[tuple, int] = {}
+        self.evicted = 0
+
+    def __len__(self):
+        return len(self._hot) + len(self._cold)
+
+    def configure(self, guild_id: int, threshold: int, window: float):
+        old = self._windows.get(guild_id, self._window)
+        self._thresholds[guild_id] = threshold
+        self._windows[guild_id] = window
+        if old != window:
+            self.clear_guild(guild_id)
+
+    def threshold(self, guild_id: int) -> int:
+        return self._thresholds.get(guild_id, self.default[0])
+
+    def window(self, guild_id: int) -> float:
+        return self._windows.get(guild_id, self._window)
+
+    def hit(self, guild_id: int, actor_id: int, action, now: float | None = None) -> int:
+        """İşlemi kaydeder ve penceredeki tahmini işlem sayısını döndürür"""
+        if now is None:
+            now = time.monotonic()
+        position = now / self._windows.get(guild_id, self._window)
+        idx = int(position)
+        key = (guild_id, actor_id, action)
+        hot = self._hot
+        state = hot.get(key)
+        if state is None:
+            state = self._cold.pop(key, None)
+            if len(hot) >= self.max_keys >> 1:
+                self.evicted += len(self._cold)
+                self._cold = hot
+                hot = self._hot = {}
+            if state is None:
+                hot[key] = idx << 32 | 1
+                return 1
+        gap = idx - (state >> 32)
+        if gap <= 0:
+            if state & _COUNT_MAX != _COUNT_MAX:
+                state += 1
+        elif gap == 1:
+            # Şimdiki kova öncekine kayar
+            state = idx << 32 | (state & _COUNT_MAX) << 16 | 1
+        else:
+            hot[key] = idx << 32 | 1
+            return 1
+        hot[key] = state
+        previous = (state >> 16) & _COUNT_MAX
+        if not previous:
+            return state & _COUNT_MAX
+        return (state & _COUNT_MAX) + int(previous * (1 - position + (state >> 32)) + 0.5)
+
+    def count(self, guild_id: int, actor_id: int, action, now: float | None = None) -> int:
+        """Kaydetmeden penceredeki tahmini sayı; hit() ile aynı şekilde yaşlandırılır"""
+        key = (guild_id, actor_id, action)
+        state = self._hot.get(key)
+        if state is None:
+            state = self._cold.get(key)
+            if state is None:
+                return 0
+        if now is None:
+            now = time.monotonic()
+        position = now / self._windows.get(guild_id, self._window)
+        idx = int(position)
+        gap = idx - (state >> 32)
+        if gap <= 0:
+            previous, current = (state >> 16) & _COUNT_MAX, state & _COUNT_MAX
+        elif gap == 1:
+            previous, current = state & _COUNT_MAX, 0
+        else:
+            return 0
+        return current + int(previous * (1 - position + idx) + 0.5)
+
+    def clear_guild(self, guild_id: int):
+        for generation in (self._hot, self._cold):
+            for key in [key for key in generation if key[0] == guild_id]:
+                del generation[key]
+
+    def sweep(self, now: float | None = None) -> int:
+        """Penceresi tamamen boşalmış anahtarları siler"""
+        if now is None:
+            now = time.monotonic()
+        windows, window = self._windows, self._window
+        removed = 0
+        for generation in (self._hot, self._cold):
+            stale = [
+                key for key, state in generation.items()
+                if int(now / windows.get(key[0], window)) - (state >> 32) > 1
+            ]
+            for key in stale:
+                del generation[key]
+            removed += len(stale)
+        self.evicted += removed
+        return removed
+
+    def stats(self) -> dict:
+        keys = len(self)
+        # Sözlük yuvası + anahtar demeti + paketlenmiş durum int'i; kimlik int'leri dahil değil
+        per_key = sys.getsizeof((0, 0, "")) + sys.getsizeof(1 << 40)
+        return {
+            "keys": keys,
+            "max_keys": self.max_keys,
+            "bytes": sys.getsizeof(self._hot) + sys.getsizeof(self._cold) + keys * per_key,
+            "evicted": self.evicted,
+        }